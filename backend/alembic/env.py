@@ -9,6 +9,8 @@ import os
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.db.base import Base
+from app.db.partitioning import is_partition_table
+from app.db.search import SEARCH_INDEX, SEARCH_VECTOR_COLUMN, is_search_table
 from app.core.config import settings
 # Import all models to ensure they are registered with SQLAlchemy
 from app.models import (
@@ -20,6 +22,9 @@ from app.models import (
     Subscription,
     AutomationRule,
     Alert,
+    AlertArchive,
+    Merchant,
+    CategoryRule,
 )
 
 # this is the Alembic Config object, which provides
@@ -35,6 +40,15 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip partitions and search index objects, which are managed outside the models"""
+    if type_ == "table" and reflected and (is_partition_table(name) or is_search_table(name)):
+        return False
+    if reflected and ((type_ == "column" and name == SEARCH_VECTOR_COLUMN) or (type_ == "index" and name == SEARCH_INDEX)):
+        return False
+    return True
+
 # Set SQLAlchemy URL from settings
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 
@@ -59,6 +73,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -84,6 +99,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
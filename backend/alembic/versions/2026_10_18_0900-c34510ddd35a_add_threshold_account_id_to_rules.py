@@ -0,0 +1,50 @@
+"""Add threshold_account_id to automation rules
+
+Revision ID: c34510ddd35a
+Revises: 010140ca96fc
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c34510ddd35a'
+down_revision = '010140ca96fc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('automation_rules', sa.Column('threshold_account_id', sa.Integer(), nullable=True))
+    op.create_index(
+        op.f('ix_automation_rules_threshold_account_id'),
+        'automation_rules',
+        ['threshold_account_id'],
+        unique=False
+    )
+
+    # Backfill from existing balance_threshold trigger conditions
+    bind = op.get_bind()
+    rules = sa.table(
+        'automation_rules',
+        sa.column('id', sa.Integer),
+        sa.column('trigger_conditions', sa.JSON),
+        sa.column('threshold_account_id', sa.Integer),
+    )
+    for rule_id, conditions in bind.execute(sa.select(rules.c.id, rules.c.trigger_conditions)):
+        if not conditions or conditions.get('type') != 'balance_threshold':
+            continue
+        try:
+            account_id = int(conditions['account_id'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        bind.execute(
+            rules.update().where(rules.c.id == rule_id).values(threshold_account_id=account_id)
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_automation_rules_threshold_account_id'), table_name='automation_rules')
+    op.drop_column('automation_rules', 'threshold_account_id')
@@ -0,0 +1,46 @@
+"""Add per-user unread alerts counter
+
+Revision ID: 11668e535294
+Revises: c34510ddd35a
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '11668e535294'
+down_revision = 'c34510ddd35a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('unread_alerts_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.create_index(
+        'ix_alerts_user_dismissed_created',
+        'alerts',
+        ['user_id', 'is_dismissed', 'created_at'],
+        unique=False
+    )
+
+    # Backfill counters from existing alerts
+    op.execute(
+        """
+        UPDATE users SET unread_alerts_count = (
+            SELECT COUNT(*) FROM alerts
+            WHERE alerts.user_id = users.id
+              AND alerts.is_read IS NOT TRUE
+              AND alerts.is_dismissed = false
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alerts_user_dismissed_created', table_name='alerts')
+    op.drop_column('users', 'unread_alerts_count')
@@ -0,0 +1,55 @@
+"""Add alerts_archive table
+
+Revision ID: b91ab6f53cf6
+Revises: 11668e535294
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b91ab6f53cf6'
+down_revision = '11668e535294'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'alerts_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('alert_type', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('priority', sa.String(), nullable=True),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('related_transaction_id', sa.Integer(), nullable=True),
+        sa.Column('related_subscription_id', sa.Integer(), nullable=True),
+        sa.Column('related_account_id', sa.Integer(), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.Column('is_dismissed', sa.Boolean(), nullable=True),
+        sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('dismissed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('requires_action', sa.Boolean(), nullable=True),
+        sa.Column('action_url', sa.String(), nullable=True),
+        sa.Column('action_taken', sa.Boolean(), nullable=True),
+        sa.Column('action_taken_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('push_sent', sa.Boolean(), nullable=True),
+        sa.Column('email_sent', sa.Boolean(), nullable=True),
+        sa.Column('sms_sent', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_alerts_archive_user_id'), 'alerts_archive', ['user_id'], unique=False)
+    op.create_index(op.f('ix_alerts_archive_archived_at'), 'alerts_archive', ['archived_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_alerts_archive_archived_at'), table_name='alerts_archive')
+    op.drop_index(op.f('ix_alerts_archive_user_id'), table_name='alerts_archive')
+    op.drop_table('alerts_archive')
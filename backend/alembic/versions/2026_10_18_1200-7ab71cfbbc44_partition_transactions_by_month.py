@@ -0,0 +1,220 @@
+"""Partition transactions by transaction_date month
+
+Revision ID: 7ab71cfbbc44
+Revises: b91ab6f53cf6
+Create Date: 2026-10-18 12:00:00.000000
+
+On PostgreSQL the table is rebuilt as PARTITION BY RANGE (transaction_date)
+and every row is copied, so it takes time and space in proportion to the
+table. Keys of a partitioned table must include the partition column, so
+this migration weakens two guarantees:
+
+- belvo_transaction_id is only unique per transaction_date
+  (uq_transactions_belvo_id_date). The same Belvo transaction reported
+  under a new date is not rejected by the database. Ingest checks the ID
+  itself (TransactionIngestService).
+- The primary key becomes (id, transaction_date), so nothing can
+  reference transactions.id. The suspicious_charges.transaction_id
+  foreign key is dropped and only indexed; deleting a transaction leaves
+  its suspicious charges pointing at a missing row.
+
+Other databases get the same unique constraint and indexes without
+partitioning, and keep the foreign key. Downgrade restores the unique
+Belvo ID and the foreign key, and refuses to run while rows break them.
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7ab71cfbbc44'
+down_revision = 'b91ab6f53cf6'
+branch_labels = None
+depends_on = None
+
+# Partitions created up front beyond the current month
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, user_id, bank_account_id, credit_card_id, belvo_transaction_id, "
+    "description, merchant_name, category, amount, currency, transaction_type, "
+    "reference, notes, transaction_date, value_date, status, created_at, updated_at"
+)
+
+OLD_INDEXES = (
+    "ix_transactions_id",
+    "ix_transactions_user_id",
+    "ix_transactions_bank_account_id",
+    "ix_transactions_credit_card_id",
+    "ix_transactions_belvo_transaction_id",
+)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_transactions_id', 'transactions', ['id'])
+    op.create_index('ix_transactions_user_id', 'transactions', ['user_id'])
+    op.create_index('ix_transactions_bank_account_id', 'transactions', ['bank_account_id'])
+    op.create_index('ix_transactions_credit_card_id', 'transactions', ['credit_card_id'])
+    op.create_index('ix_transactions_belvo_transaction_id', 'transactions', ['belvo_transaction_id'])
+    op.create_index('ix_transactions_user_date', 'transactions', ['user_id', 'transaction_date'])
+
+
+def _check_downgrade(bind) -> None:
+    """Fail early on rows the restored unique index or foreign key would reject"""
+    duplicates = bind.execute(sa.text(
+        "SELECT count(*) FROM (SELECT belvo_transaction_id FROM transactions "
+        "WHERE belvo_transaction_id IS NOT NULL "
+        "GROUP BY belvo_transaction_id HAVING count(*) > 1) AS d"
+    )).scalar()
+    orphans = 0
+    if bind.dialect.name == 'postgresql':
+        orphans = bind.execute(sa.text(
+            "SELECT count(*) FROM suspicious_charges s WHERE s.transaction_id IS NOT NULL "
+            "AND NOT EXISTS (SELECT 1 FROM transactions t WHERE t.id = s.transaction_id)"
+        )).scalar()
+    if duplicates or orphans:
+        raise RuntimeError(
+            f"Cannot downgrade: {duplicates} Belvo transaction IDs are stored under more than one date "
+            f"and {orphans} suspicious charges point at missing transactions; resolve them first"
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.create_index(op.f('ix_suspicious_charges_transaction_id'), 'suspicious_charges', ['transaction_id'])
+
+    if bind.dialect.name != 'postgresql':
+        # Same keys as the partitioned table, without partitioning
+        op.drop_index('ix_transactions_belvo_transaction_id', table_name='transactions')
+        op.create_index('ix_transactions_belvo_transaction_id', 'transactions', ['belvo_transaction_id'])
+        with op.batch_alter_table('transactions') as batch_op:
+            batch_op.create_unique_constraint(
+                'uq_transactions_belvo_id_date', ['belvo_transaction_id', 'transaction_date']
+            )
+        op.create_index('ix_transactions_user_date', 'transactions', ['user_id', 'transaction_date'])
+        return
+
+    # A partitioned table cannot be referenced by a FK on id alone
+    op.execute("ALTER TABLE suspicious_charges DROP CONSTRAINT IF EXISTS suspicious_charges_transaction_id_fkey")
+
+    # Move the existing table aside, keeping its sequence alive
+    op.execute("ALTER TABLE transactions RENAME TO transactions_unpartitioned")
+    op.execute("ALTER TABLE transactions_unpartitioned RENAME CONSTRAINT transactions_pkey TO transactions_unpartitioned_pkey")
+    for index_name in OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE transactions (
+            id INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            bank_account_id INTEGER REFERENCES bank_accounts (id),
+            credit_card_id INTEGER REFERENCES credit_cards (id),
+            belvo_transaction_id VARCHAR,
+            description VARCHAR NOT NULL,
+            merchant_name VARCHAR,
+            category VARCHAR,
+            amount DOUBLE PRECISION NOT NULL,
+            currency VARCHAR,
+            transaction_type VARCHAR NOT NULL,
+            reference VARCHAR,
+            notes TEXT,
+            transaction_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            value_date TIMESTAMP WITH TIME ZONE,
+            status VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT transactions_pkey PRIMARY KEY (id, transaction_date),
+            CONSTRAINT uq_transactions_belvo_id_date UNIQUE (belvo_transaction_id, transaction_date)
+        ) PARTITION BY RANGE (transaction_date)
+        """
+    )
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    _create_indexes()
+
+    # One partition per month from the oldest transaction through MONTHS_AHEAD
+    oldest = bind.execute(sa.text("SELECT min(transaction_date) FROM transactions_unpartitioned")).scalar()
+    today = date.today()
+    month = (oldest.date() if oldest else today).replace(day=1)
+    last = _add_months(today.replace(day=1), MONTHS_AHEAD)
+    while month <= last:
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE transactions_p{month.year:04d}_{month.month:02d} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_unpartitioned")
+    op.execute("DROP TABLE transactions_unpartitioned")
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    _check_downgrade(bind)
+
+    if bind.dialect.name != 'postgresql':
+        op.drop_index('ix_transactions_user_date', table_name='transactions')
+        with op.batch_alter_table('transactions') as batch_op:
+            batch_op.drop_constraint('uq_transactions_belvo_id_date', type_='unique')
+        op.drop_index('ix_transactions_belvo_transaction_id', table_name='transactions')
+        op.create_index('ix_transactions_belvo_transaction_id', 'transactions', ['belvo_transaction_id'], unique=True)
+        op.drop_index(op.f('ix_suspicious_charges_transaction_id'), table_name='suspicious_charges')
+        return
+
+    op.execute("ALTER TABLE transactions RENAME TO transactions_partitioned")
+    op.execute("ALTER TABLE transactions_partitioned RENAME CONSTRAINT transactions_pkey TO transactions_partitioned_pkey")
+    for index_name in OLD_INDEXES + ("ix_transactions_user_date",):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE transactions (
+            id INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            bank_account_id INTEGER REFERENCES bank_accounts (id),
+            credit_card_id INTEGER REFERENCES credit_cards (id),
+            belvo_transaction_id VARCHAR,
+            description VARCHAR NOT NULL,
+            merchant_name VARCHAR,
+            category VARCHAR,
+            amount DOUBLE PRECISION NOT NULL,
+            currency VARCHAR,
+            transaction_type VARCHAR NOT NULL,
+            reference VARCHAR,
+            notes TEXT,
+            transaction_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            value_date TIMESTAMP WITH TIME ZONE,
+            status VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT transactions_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned")
+    op.execute("DROP TABLE transactions_partitioned CASCADE")
+
+    op.create_index('ix_transactions_id', 'transactions', ['id'])
+    op.create_index('ix_transactions_user_id', 'transactions', ['user_id'])
+    op.create_index('ix_transactions_bank_account_id', 'transactions', ['bank_account_id'])
+    op.create_index('ix_transactions_credit_card_id', 'transactions', ['credit_card_id'])
+    op.create_index('ix_transactions_belvo_transaction_id', 'transactions', ['belvo_transaction_id'], unique=True)
+
+    op.create_foreign_key(
+        'suspicious_charges_transaction_id_fkey',
+        'suspicious_charges', 'transactions',
+        ['transaction_id'], ['id']
+    )
+    op.drop_index(op.f('ix_suspicious_charges_transaction_id'), table_name='suspicious_charges')
@@ -0,0 +1,64 @@
+"""Store money columns as integer minor units
+
+Revision ID: 5d0c2e7f9a41
+Revises: 7ab71cfbbc44
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d0c2e7f9a41'
+down_revision = '7ab71cfbbc44'
+branch_labels = None
+depends_on = None
+
+# (table, float column, nullable, server default)
+MONEY_COLUMNS = (
+    ('transactions', 'amount', False, None),
+    ('bank_accounts', 'current_balance', False, '0'),
+    ('bank_accounts', 'available_balance', False, '0'),
+    ('credit_cards', 'credit_limit', False, None),
+    ('credit_cards', 'current_balance', False, '0'),
+    ('credit_cards', 'available_credit', False, None),
+    ('credit_cards', 'minimum_payment', False, '0'),
+    ('subscriptions', 'amount', False, None),
+    ('suspicious_charges', 'amount', False, None),
+    ('automation_rules', 'max_amount', True, None),
+)
+
+
+def upgrade() -> None:
+    for table, column, nullable, default in MONEY_COLUMNS:
+        cents = f'{column}_cents'
+        op.add_column(table, sa.Column(cents, sa.BigInteger(), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET {cents} = CAST(ROUND({column} * 100) AS BIGINT) "
+            f"WHERE {column} IS NOT NULL"
+        )
+        if not nullable:
+            op.execute(f"UPDATE {table} SET {cents} = 0 WHERE {cents} IS NULL")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
+            if not nullable:
+                batch_op.alter_column(
+                    cents,
+                    existing_type=sa.BigInteger(),
+                    nullable=False,
+                    server_default=default
+                )
+
+
+def downgrade() -> None:
+    for table, column, nullable, default in MONEY_COLUMNS:
+        cents = f'{column}_cents'
+        op.add_column(table, sa.Column(column, sa.Float(), nullable=True))
+        op.execute(f"UPDATE {table} SET {column} = {cents} / 100.0 WHERE {cents} IS NOT NULL")
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(cents)
+            if not nullable and default is None:
+                batch_op.alter_column(column, existing_type=sa.Float(), nullable=False)
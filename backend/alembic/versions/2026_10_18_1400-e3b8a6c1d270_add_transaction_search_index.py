@@ -0,0 +1,85 @@
+"""Add full-text search index over transactions
+
+Revision ID: e3b8a6c1d270
+Revises: 5d0c2e7f9a41
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8a6c1d270'
+down_revision = '5d0c2e7f9a41'
+branch_labels = None
+depends_on = None
+
+# Kept in sync with app/db/search.py
+SEARCH_VECTOR_COLUMN = 'search_vector'
+SEARCH_INDEX = 'ix_transactions_search_vector'
+FTS_TABLE = 'transactions_fts'
+
+POSTGRES_SEARCH_VECTOR = (
+    "to_tsvector('simple', "
+    "coalesce(description, '') || ' ' || coalesce(merchant_name, '') || ' ' || coalesce(notes, ''))"
+)
+
+SQLITE_FTS_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        description, merchant_name, notes,
+        content='transactions', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, description, merchant_name, notes)
+        VALUES (new.id, new.description, new.merchant_name, new.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, merchant_name, notes)
+        VALUES ('delete', old.id, old.description, old.merchant_name, old.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF description, merchant_name, notes ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, merchant_name, notes)
+        VALUES ('delete', old.id, old.description, old.merchant_name, old.notes);
+        INSERT INTO {FTS_TABLE}(rowid, description, merchant_name, notes)
+        VALUES (new.id, new.description, new.merchant_name, new.notes);
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # Stored generated column: maintained by PostgreSQL on every write,
+        # and inherited by every monthly partition
+        op.execute(
+            f"ALTER TABLE transactions ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+            f"GENERATED ALWAYS AS ({POSTGRES_SEARCH_VECTOR}) STORED"
+        )
+        op.execute(f"CREATE INDEX {SEARCH_INDEX} ON transactions USING GIN ({SEARCH_VECTOR_COLUMN})")
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        op.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX}")
+        op.execute(f"ALTER TABLE transactions DROP COLUMN IF EXISTS {SEARCH_VECTOR_COLUMN}")
+    elif dialect == 'sqlite':
+        op.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au")
+        op.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad")
+        op.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
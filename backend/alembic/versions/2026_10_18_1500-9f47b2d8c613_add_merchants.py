@@ -0,0 +1,91 @@
+"""Add canonical merchants and merchant_id on transactions/subscriptions
+
+Revision ID: 9f47b2d8c613
+Revises: e3b8a6c1d270
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f47b2d8c613'
+down_revision = 'e3b8a6c1d270'
+branch_labels = None
+depends_on = None
+
+# Curated merchants: (name, normalized key, default category)
+SEED_MERCHANTS = (
+    ('Netflix', 'netflix', 'entertainment'),
+    ('Spotify', 'spotify', 'entertainment'),
+    ('Disney+', 'disney plus', 'entertainment'),
+    ('HBO Max', 'hbo max', 'entertainment'),
+    ('YouTube', 'youtube', 'entertainment'),
+    ('Apple', 'apple', 'software'),
+    ('Google', 'google', 'software'),
+    ('Microsoft', 'microsoft', 'software'),
+    ('Amazon', 'amazon', 'shopping'),
+    ('Mercado Libre', 'mercadolibre', 'shopping'),
+    ('Liverpool', 'liverpool', 'shopping'),
+    ('Walmart', 'walmart', 'groceries'),
+    ('Costco', 'costco', 'groceries'),
+    ('Soriana', 'soriana', 'groceries'),
+    ('Chedraui', 'chedraui', 'groceries'),
+    ('OXXO', 'oxxo', 'groceries'),
+    ('7-Eleven', 'eleven', 'groceries'),
+    ('Starbucks', 'starbucks', 'food'),
+    ('Rappi', 'rappi', 'food'),
+    ('Uber Eats', 'uber eats', 'food'),
+    ('DiDi Food', 'didi food', 'food'),
+    ('Uber', 'uber', 'transport'),
+    ('DiDi', 'didi', 'transport'),
+    ('Pemex', 'pemex', 'transport'),
+    ('Telcel', 'telcel', 'utilities'),
+    ('Telmex', 'telmex', 'utilities'),
+    ('Izzi', 'izzi', 'utilities'),
+    ('Totalplay', 'totalplay', 'utilities'),
+    ('CFE', 'cfe', 'utilities'),
+)
+
+
+def upgrade() -> None:
+    merchants = op.create_table(
+        'merchants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('normalized_key', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('match_prefix', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_merchants_id'), 'merchants', ['id'], unique=False)
+    op.create_index(op.f('ix_merchants_normalized_key'), 'merchants', ['normalized_key'], unique=True)
+
+    op.bulk_insert(merchants, [
+        {'name': name, 'normalized_key': key, 'category': category, 'match_prefix': True}
+        for name, key, category in SEED_MERCHANTS
+    ])
+
+    # Plain ADD COLUMN (no batch rebuild) keeps the SQLite FTS triggers on
+    # transactions; SQLite cannot add the FK constraint in place
+    is_sqlite = op.get_bind().dialect.name == 'sqlite'
+    for table in ('transactions', 'subscriptions'):
+        op.add_column(table, sa.Column('merchant_id', sa.Integer(), nullable=True))
+        op.create_index(op.f(f'ix_{table}_merchant_id'), table, ['merchant_id'], unique=False)
+        if not is_sqlite:
+            op.create_foreign_key(f'{table}_merchant_id_fkey', table, 'merchants', ['merchant_id'], ['id'])
+
+
+def downgrade() -> None:
+    is_sqlite = op.get_bind().dialect.name == 'sqlite'
+    for table in ('subscriptions', 'transactions'):
+        if not is_sqlite:
+            op.drop_constraint(f'{table}_merchant_id_fkey', table, type_='foreignkey')
+        op.drop_index(op.f(f'ix_{table}_merchant_id'), table_name=table)
+        op.drop_column(table, 'merchant_id')
+
+    op.drop_index(op.f('ix_merchants_normalized_key'), table_name='merchants')
+    op.drop_index(op.f('ix_merchants_id'), table_name='merchants')
+    op.drop_table('merchants')
@@ -0,0 +1,66 @@
+"""Add category rules and transactions.category_source
+
+Revision ID: 2c61f0a9e7b5
+Revises: 9f47b2d8c613
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c61f0a9e7b5'
+down_revision = '9f47b2d8c613'
+branch_labels = None
+depends_on = None
+
+# Curated global keyword rules: (keyword, category)
+SEED_KEYWORD_RULES = (
+    ('gasolina', 'transport'),
+    ('gasolinera', 'transport'),
+    ('estacionamiento', 'transport'),
+    ('caseta', 'transport'),
+    ('farmacia', 'health'),
+    ('hospital', 'health'),
+    ('restaurante', 'food'),
+    ('cafe', 'food'),
+    ('supermercado', 'groceries'),
+    ('colegiatura', 'education'),
+    ('renta', 'housing'),
+    ('nomina', 'income'),
+)
+
+
+def upgrade() -> None:
+    category_rules = op.create_table(
+        'category_rules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('merchant_id', sa.Integer(), nullable=True),
+        sa.Column('keyword', sa.String(), nullable=True),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['merchant_id'], ['merchants.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_category_rules_id'), 'category_rules', ['id'], unique=False)
+    op.create_index('ix_category_rules_user_merchant', 'category_rules', ['user_id', 'merchant_id'], unique=False)
+
+    op.bulk_insert(category_rules, [
+        {'keyword': keyword, 'category': category, 'source': 'curated'}
+        for keyword, category in SEED_KEYWORD_RULES
+    ])
+
+    # Plain ADD COLUMN keeps the SQLite FTS triggers on transactions
+    op.add_column('transactions', sa.Column('category_source', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('transactions', 'category_source')
+    op.drop_index('ix_category_rules_user_merchant', table_name='category_rules')
+    op.drop_index(op.f('ix_category_rules_id'), table_name='category_rules')
+    op.drop_table('category_rules')
@@ -0,0 +1,42 @@
+"""Add change-time indexes for delta sync
+
+Revision ID: 4b8e1d7c0a93
+Revises: 2c61f0a9e7b5
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8e1d7c0a93'
+down_revision = '2c61f0a9e7b5'
+branch_labels = None
+depends_on = None
+
+# Tables served by /sync/changes, keyed by (user_id, coalesce(updated_at, created_at))
+CHANGE_FEED_TABLES = (
+    'bank_accounts',
+    'credit_cards',
+    'subscriptions',
+    'alerts',
+    'suspicious_charges',
+    'transactions',
+)
+
+
+def upgrade() -> None:
+    for table in CHANGE_FEED_TABLES:
+        op.create_index(
+            f'ix_{table}_user_changed',
+            table,
+            ['user_id', sa.text('coalesce(updated_at, created_at)')]
+        )
+    op.create_index('ix_alerts_archive_user_archived', 'alerts_archive', ['user_id', 'archived_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alerts_archive_user_archived', table_name='alerts_archive')
+    for table in reversed(CHANGE_FEED_TABLES):
+        op.drop_index(f'ix_{table}_user_changed', table_name=table)
@@ -0,0 +1,47 @@
+"""Add automation rules to delta sync with tombstones for hard deletes
+
+Revision ID: d2a7c5e8b316
+Revises: 4b8e1d7c0a93
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a7c5e8b316'
+down_revision = '4b8e1d7c0a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_automation_rules_user_changed',
+        'automation_rules',
+        ['user_id', sa.text('coalesce(updated_at, created_at)')]
+    )
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('row_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sync_tombstones_id'), 'sync_tombstones', ['id'], unique=False)
+    op.create_index(
+        'ix_sync_tombstones_user_entity_deleted',
+        'sync_tombstones',
+        ['user_id', 'entity', 'deleted_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sync_tombstones_user_entity_deleted', table_name='sync_tombstones')
+    op.drop_index(op.f('ix_sync_tombstones_id'), table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_index('ix_automation_rules_user_changed', table_name='automation_rules')
@@ -0,0 +1,31 @@
+"""Add per-user resource versions for conditional GETs
+
+Revision ID: e4c91b7a2f05
+Revises: d2a7c5e8b316
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4c91b7a2f05'
+down_revision = 'd2a7c5e8b316'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # No backfill: a missing row is version 0 until the user's next write
+    op.create_table(
+        'resource_versions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('resource', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'resource')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resource_versions')
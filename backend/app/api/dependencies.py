@@ -1,10 +1,14 @@
-from fastapi import Depends, HTTPException, status
+from datetime import date
+import hashlib
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.base import get_db
 from app.core.security import verify_token
+from app.models.resource_version import VERSIONED_TABLES, ResourceVersion
 from app.models.user import User
-from typing import Optional
+from typing import Callable, Optional
 
 # Security scheme
 security = HTTPBearer()
@@ -79,3 +83,100 @@ def get_current_active_user(
         Current active user
     """
     return current_user
+
+
+def is_admin(user: User) -> bool:
+    """
+    Whether a user may use admin features
+
+    Anyone can register with any email, so being listed in ADMIN_EMAILS is
+    not enough: the account must also be active and verified.
+
+    Args:
+        user: User loaded from the database
+
+    Returns:
+        True if the user is an admin
+    """
+    return bool(user.is_active and user.is_verified) and user.email.lower() in settings.admin_emails_list
+
+
+def get_current_admin(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """
+    Dependency restricting an endpoint to admins (see is_admin)
+
+    Args:
+        current_user: Current user from get_current_user
+
+    Returns:
+        Current user, who is an admin
+
+    Raises:
+        HTTPException: If the user is not an admin
+    """
+    if not is_admin(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
+
+
+def conditional_get(*models, daily: bool = False) -> Callable[..., None]:
+    """
+    Build a dependency that answers conditional GETs for a user's list
+
+    The version of the response is the current user's ResourceVersion of
+    each model's table, bumped in the same transaction as every write to
+    it, hashed with the path and query string into a weak ETag. A request
+    whose If-None-Match matches gets a 304 before the endpoint queries or
+    serializes anything; otherwise the ETag is added to the endpoint's
+    response.
+
+    Args:
+        *models: Models whose rows the endpoint returns (their tables must
+            be in VERSIONED_TABLES)
+        daily: Also vary by the current date, for responses computed
+            relative to today
+
+    Returns:
+        FastAPI dependency
+
+    Raises:
+        ValueError: If a model's table is not versioned
+    """
+    resources = [model.__tablename__ for model in models]
+    unversioned = [resource for resource in resources if resource not in VERSIONED_TABLES]
+    if unversioned:
+        raise ValueError(f"Tables without a resource version: {', '.join(unversioned)}")
+
+    def dependency(
+        request: Request,
+        response: Response,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+    ) -> None:
+        parts = [request.url.path, sorted(request.query_params.multi_items()), current_user.id]
+        versions = dict(db.query(ResourceVersion.resource, ResourceVersion.version).filter(
+            ResourceVersion.user_id == current_user.id,
+            ResourceVersion.resource.in_(resources)
+        ).all())
+        parts.extend((resource, versions.get(resource, 0)) for resource in resources)
+        if daily:
+            parts.append(date.today().isoformat())
+
+        etag = 'W/"' + hashlib.sha1(repr(parts).encode()).hexdigest()[:20] + '"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            # If-None-Match uses weak comparison
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in candidates or etag.removeprefix("W/") in candidates:
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
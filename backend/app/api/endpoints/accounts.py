@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import List
 from app.db.base import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import conditional_get, get_current_user
 from app.models.user import User
 from app.models.bank_account import BankAccount
 from app.schemas.bank_account import (
@@ -11,11 +12,12 @@ from app.schemas.bank_account import (
     BankAccountResponse,
     BankAccountSummary
 )
+from app.schemas.money import to_cents, from_cents
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[BankAccountResponse])
+@router.get("/", response_model=List[BankAccountResponse], dependencies=[Depends(conditional_get(BankAccount))])
 def list_bank_accounts(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -42,7 +44,7 @@ def list_bank_accounts(
     return accounts
 
 
-@router.get("/summary", response_model=BankAccountSummary)
+@router.get("/summary", response_model=BankAccountSummary, dependencies=[Depends(conditional_get(BankAccount))])
 def get_accounts_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -61,16 +63,21 @@ def get_accounts_summary(
         BankAccount.user_id == current_user.id
     ).all()
 
-    active_accounts = [acc for acc in accounts if acc.is_active]
-
-    total_balance = sum(acc.current_balance for acc in active_accounts)
-    total_available = sum(acc.available_balance for acc in active_accounts)
+    # Exact integer sums in SQL
+    active_count, total_balance_cents, total_available_cents = db.query(
+        func.count(BankAccount.id),
+        func.coalesce(func.sum(BankAccount.current_balance_cents), 0),
+        func.coalesce(func.sum(BankAccount.available_balance_cents), 0)
+    ).filter(
+        BankAccount.user_id == current_user.id,
+        BankAccount.is_active == True
+    ).one()
 
     return BankAccountSummary(
         total_accounts=len(accounts),
-        active_accounts=len(active_accounts),
-        total_balance=total_balance,
-        total_available=total_available,
+        active_accounts=active_count,
+        total_balance=from_cents(total_balance_cents),
+        total_available=from_cents(total_available_cents),
         accounts=accounts
     )
 
@@ -100,8 +107,8 @@ def create_bank_account(
         account_type=account_data.account_type,
         institution_name=account_data.institution_name,
         currency=account_data.currency,
-        current_balance=account_data.current_balance,
-        available_balance=account_data.available_balance,
+        current_balance_cents=to_cents(account_data.current_balance),
+        available_balance_cents=to_cents(account_data.available_balance),
         is_active=True,
         is_primary=False
     )
@@ -0,0 +1,110 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import List
+from app.api.dependencies import get_current_admin
+from app.models.user import User
+from app.schemas.admin import ProfileResponse, SlowQueryResponse
+from app.core.profiling import request_profiler
+from app.db.slow_queries import slow_query_log
+
+router = APIRouter()
+
+
+@router.get("/slow-queries", response_model=List[SlowQueryResponse])
+def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    List the most recent slow queries recorded by this worker
+
+    Empty unless SLOW_QUERY_LOG_ENABLED is set. Each worker keeps its own
+    buffer; every entry is also written to the log.
+
+    Args:
+        limit: Maximum number of entries
+        current_user: Current admin user
+
+    Returns:
+        Slow queries, newest first
+    """
+    return slow_query_log.entries(limit)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(current_user: User = Depends(get_current_admin)):
+    """
+    Clear this worker's slow query buffer
+
+    Args:
+        current_user: Current admin user
+    """
+    slow_query_log.clear()
+    return None
+
+
+@router.get("/profiles", response_model=List[ProfileResponse])
+def list_profiles(
+    limit: int = Query(50, ge=1, le=1000),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    List the most recent request profiles taken by this worker
+
+    Requests are profiled when an admin sends "X-Profile: 1", or at random
+    with PROFILING_SAMPLE_RATE. A profiled response carries X-Profile-Id.
+
+    Args:
+        limit: Maximum number of profiles
+        current_user: Current admin user
+
+    Returns:
+        Profiles without their stacks, newest first
+    """
+    return request_profiler.profiles(limit)
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(
+    profile_id: int,
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Download a profile as collapsed stacks
+
+    One "frame;frame;frame samples" line per stack, ready for
+    flamegraph.pl, speedscope or inferno.
+
+    Args:
+        profile_id: Profile ID (X-Profile-Id of the profiled response)
+        current_user: Current admin user
+
+    Returns:
+        Collapsed stacks as a text attachment
+
+    Raises:
+        HTTPException: If this worker has no such profile
+    """
+    profile = request_profiler.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    return Response(
+        content=profile.collapsed(),
+        media_type="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.folded"'}
+    )
+
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT)
+def clear_profiles(current_user: User = Depends(get_current_admin)):
+    """
+    Clear this worker's stored profiles
+
+    Args:
+        current_user: Current admin user
+    """
+    request_profiler.clear()
+    return None
@@ -1,89 +1,191 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+import asyncio
+import json
+from app.core.config import settings
 from app.db.base import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import conditional_get, get_current_user
+from app.api.fieldsets import FieldSet, LIST_FORMAT_OBJECTS, LIST_FORMAT_PATTERN, dump_items
+from app.api.responses import json_response, model_response
 from app.models.user import User
 from app.models.alert import Alert
 from app.schemas.alert import (
     AlertCreate,
     AlertUpdate,
+    AlertBulkUpdate,
     AlertResponse,
     AlertSummary
 )
+from app.services.alerts import alert_service
+from app.services.events import event_broker
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[AlertResponse])
+@router.get("/", response_model=List[AlertResponse], dependencies=[Depends(conditional_get(Alert))])
 def list_alerts(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     unread_only: bool = False,
-    category: str = None
+    category: str = None,
+    fields: Optional[str] = Query(None, description="Comma-separated alert fields to return"),
+    format: str = Query(LIST_FORMAT_OBJECTS, pattern=LIST_FORMAT_PATTERN)
 ):
     """
     List all alerts for current user
 
     Args:
+        response: Response carrying the ETag
         current_user: Current authenticated user
         db: Database session
         unread_only: Show only unread alerts
         category: Filter by category (security, payment, budget, account)
+        fields: Only load and return these fields (e.g. id,title,is_read)
+        format: objects, or compact for {"fields": [...], "rows": [[...]]}
 
     Returns:
         List of alerts
+
+    Raises:
+        HTTPException: If fields names an unknown field
     """
+    try:
+        field_set = FieldSet.parse(AlertResponse, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     query = db.query(Alert).filter(
         Alert.user_id == current_user.id,
         Alert.is_dismissed == False
     )
 
     if unread_only:
-        query = query.filter(Alert.is_read == False)
+        query = query.filter(Alert.is_read.isnot(True))
 
     if category:
         query = query.filter(Alert.category == category)
 
+    if field_set:
+        query = query.options(field_set.load_only(Alert))
     alerts = query.order_by(Alert.created_at.desc()).all()
 
+    if field_set or format != LIST_FORMAT_OBJECTS:
+        return json_response(dump_items(alerts, AlertResponse, field_set, format), response)
+
     return alerts
 
 
-@router.get("/summary", response_model=AlertSummary)
+@router.get("/summary", response_model=AlertSummary, dependencies=[Depends(conditional_get(Alert))])
 def get_alerts_summary(
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    include_alerts: bool = True
 ):
     """
     Get summary of alerts
 
     Args:
+        response: Response carrying the ETag
         current_user: Current authenticated user
         db: Database session
+        limit: Maximum number of most recent alerts to embed
+        include_alerts: Embed the most recent alerts (counts only when False)
 
     Returns:
         Alerts summary
     """
-    alerts = db.query(Alert).filter(
-        Alert.user_id == current_user.id,
-        Alert.is_dismissed == False
-    ).all()
-
-    unread_alerts = sum(1 for a in alerts if not a.is_read)
-    critical_alerts = sum(1 for a in alerts if a.priority == "critical")
-    requires_action = sum(1 for a in alerts if a.requires_action and not a.action_taken)
-
-    return AlertSummary(
-        total_alerts=len(alerts),
-        unread_alerts=unread_alerts,
-        critical_alerts=critical_alerts,
-        requires_action=requires_action,
-        alerts=alerts
+    counts = alert_service.get_summary_counts(db, current_user.id)
+
+    alerts = []
+    if include_alerts:
+        alerts = db.query(Alert).filter(
+            Alert.user_id == current_user.id,
+            Alert.is_dismissed == False
+        ).order_by(Alert.created_at.desc()).limit(limit).all()
+
+    return model_response(AlertSummary(**counts, alerts=alerts), response)
+
+
+@router.get("/unread-count", response_model=dict)
+def get_unread_count(current_user: User = Depends(get_current_user)):
+    """
+    Get the number of unread alerts from the per-user counter
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Unread alerts count
+    """
+    return {"unread_alerts": current_user.unread_alerts_count or 0}
+
+
+@router.get("/stream")
+async def stream_alerts(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Server-Sent Events stream of new alerts, unread count changes and
+    Belvo sync progress
+
+    Args:
+        request: Incoming request (used to detect client disconnects)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        text/event-stream response
+    """
+    user_id = current_user.id
+    # Blocking DB work runs in the threadpool, not on the event loop
+    unread_alerts = await run_in_threadpool(alert_service.count_unread, db, user_id)
+    # Release the connection now; the stream itself never touches the DB
+    await run_in_threadpool(db.close)
+
+    queue = event_broker.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield _format_event("unread_count", {"unread_alerts": unread_alerts})
+
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=settings.EVENTS_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield _format_event(message["event"], message["data"])
+        finally:
+            event_broker.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        }
     )
 
 
+def _format_event(event: str, data: dict) -> str:
+    """Format a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.post("/", response_model=AlertResponse, status_code=status.HTTP_201_CREATED)
 def create_alert(
     alert_data: AlertCreate,
@@ -118,9 +220,13 @@ def create_alert(
     )
 
     db.add(new_alert)
+    alert_service.adjust_unread_count(db, current_user.id, 1)
     db.commit()
     db.refresh(new_alert)
 
+    alert_service.publish_created(new_alert)
+    alert_service.publish_unread_count(db, current_user.id)
+
     return new_alert
 
 
@@ -191,6 +297,8 @@ def update_alert(
             detail="Alert not found"
         )
 
+    was_unread = alert_service.is_unread(alert)
+
     # Update fields if provided
     if alert_update.is_read is not None:
         alert.is_read = alert_update.is_read
@@ -207,9 +315,16 @@ def update_alert(
         if alert.action_taken and not alert.action_taken_at:
             alert.action_taken_at = datetime.utcnow()
 
+    alert_service.adjust_unread_count(
+        db,
+        current_user.id,
+        int(alert_service.is_unread(alert)) - int(was_unread)
+    )
     db.commit()
     db.refresh(alert)
 
+    alert_service.publish_unread_count(db, current_user.id)
+
     return alert
 
 
@@ -228,22 +343,43 @@ def mark_all_alerts_read(
     Returns:
         Number of alerts marked as read
     """
-    unread_alerts = db.query(Alert).filter(
-        Alert.user_id == current_user.id,
-        Alert.is_read == False,
-        Alert.is_dismissed == False
-    ).all()
+    count = alert_service.mark_all_read(db, current_user.id)
+    db.commit()
 
-    count = 0
-    now = datetime.utcnow()
-    for alert in unread_alerts:
-        alert.is_read = True
-        alert.read_at = now
-        count += 1
+    alert_service.publish_unread_count(db, current_user.id)
 
+    return {"marked_read": count}
+
+
+@router.post("/bulk", response_model=dict)
+def bulk_update_alerts(
+    bulk_update: AlertBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Mark as read, dismiss or take action on many alerts at once
+
+    Args:
+        bulk_update: Alert IDs and action to apply
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Number of alerts updated
+    """
+    count = alert_service.bulk_update(
+        db,
+        current_user.id,
+        bulk_update.alert_ids,
+        bulk_update.action
+    )
     db.commit()
 
-    return {"marked_read": count}
+    if bulk_update.action != "action_taken":
+        alert_service.publish_unread_count(db, current_user.id)
+
+    return {"updated": count}
 
 
 @router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -275,8 +411,12 @@ def delete_alert(
         )
 
     # Soft delete
+    if alert_service.is_unread(alert):
+        alert_service.adjust_unread_count(db, current_user.id, -1)
     alert.is_dismissed = True
     alert.dismissed_at = datetime.utcnow()
     db.commit()
 
+    alert_service.publish_unread_count(db, current_user.id)
+
     return None
@@ -2,9 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.db.base import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import conditional_get, get_current_user
 from app.models.user import User
 from app.models.automation_rule import AutomationRule
+from app.models.sync_tombstone import SyncTombstone
+from app.services.automation import threshold_account_id_for
+from app.schemas.money import to_cents
 from app.schemas.automation_rule import (
     AutomationRuleCreate,
     AutomationRuleUpdate,
@@ -15,7 +18,7 @@ from app.schemas.automation_rule import (
 router = APIRouter()
 
 
-@router.get("/", response_model=List[AutomationRuleResponse])
+@router.get("/", response_model=List[AutomationRuleResponse], dependencies=[Depends(conditional_get(AutomationRule))])
 def list_automation_rules(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -42,7 +45,7 @@ def list_automation_rules(
     return rules
 
 
-@router.get("/summary", response_model=AutomationRuleSummary)
+@router.get("/summary", response_model=AutomationRuleSummary, dependencies=[Depends(conditional_get(AutomationRule))])
 def get_automation_rules_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -95,9 +98,10 @@ def create_automation_rule(
         rule_type=rule_data.rule_type,
         description=rule_data.description,
         trigger_conditions=rule_data.trigger_conditions,
+        threshold_account_id=threshold_account_id_for(rule_data.trigger_conditions),
         action_config=rule_data.action_config,
         is_active=rule_data.is_active,
-        max_amount=rule_data.max_amount,
+        max_amount_cents=to_cents(rule_data.max_amount),
         require_confirmation=rule_data.require_confirmation,
         execution_count=0,
         failure_count=0
@@ -186,6 +190,7 @@ def update_automation_rule(
 
     if rule_update.trigger_conditions is not None:
         rule.trigger_conditions = rule_update.trigger_conditions
+        rule.threshold_account_id = threshold_account_id_for(rule_update.trigger_conditions)
 
     if rule_update.action_config is not None:
         rule.action_config = rule_update.action_config
@@ -194,7 +199,7 @@ def update_automation_rule(
         rule.is_active = rule_update.is_active
 
     if rule_update.max_amount is not None:
-        rule.max_amount = rule_update.max_amount
+        rule.max_amount_cents = to_cents(rule_update.max_amount)
 
     if rule_update.require_confirmation is not None:
         rule.require_confirmation = rule_update.require_confirmation
@@ -233,7 +238,8 @@ def delete_automation_rule(
             detail="Automation rule not found"
         )
 
-    # Hard delete for automation rules
+    # Hard delete for automation rules; the tombstone tells delta sync
+    db.add(SyncTombstone(user_id=current_user.id, entity="automation_rules", row_id=rule.id))
     db.delete(rule)
     db.commit()
 
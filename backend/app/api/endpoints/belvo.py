@@ -6,7 +6,6 @@ from app.db.base import get_db
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.bank_account import BankAccount
-from app.models.transaction import Transaction
 from app.schemas.belvo import (
     BelvoLinkCreate,
     BelvoLinkResponse,
@@ -15,10 +14,30 @@ from app.schemas.belvo import (
     BelvoSyncResponse
 )
 from app.services.belvo import belvo_service
+from app.services.automation import automation_service, BalanceChange
+from app.services.transaction_ingest import transaction_ingest_service
+from app.services.alerts import alert_service
+from app.schemas.money import to_cents
+from app.services.events import event_broker
 from belvo.exceptions import BelvoAPIException
 
 router = APIRouter()
 
+# Emit a sync_progress event every N processed rows
+SYNC_PROGRESS_INTERVAL = 100
+
+
+def _publish_sync_progress(user_id: int, stage: str, processed: int, total: int) -> None:
+    """Push Belvo sync progress to the user's event stream"""
+    if not event_broker.has_listeners(user_id):
+        return
+    event_broker.publish(user_id, "sync_progress", {
+        "stage": stage,
+        "processed": processed,
+        "total": total,
+        "done": processed >= total,
+    })
+
 
 @router.get("/institutions")
 def list_institutions(country_code: str = "MX"):
@@ -184,18 +203,39 @@ def sync_accounts(
 
         synced_count = 0
         errors = []
+        balance_changes = []
+
+        # Load all already-synced accounts in one query instead of one per row
+        belvo_ids = [a["id"] for a in accounts if a.get("id")]
+        existing_accounts = {
+            account.belvo_account_id: account
+            for account in db.query(BankAccount).filter(
+                BankAccount.belvo_account_id.in_(belvo_ids)
+            ).all()
+        } if belvo_ids else {}
+
+        _publish_sync_progress(current_user.id, "accounts", 0, len(accounts))
 
         for belvo_account in accounts:
             try:
-                # Check if account already exists
-                existing_account = db.query(BankAccount).filter(
-                    BankAccount.belvo_account_id == belvo_account["id"]
-                ).first()
+                current_balance_cents = to_cents(belvo_account.get("balance", {}).get("current", 0))
+                available_balance_cents = to_cents(belvo_account.get("balance", {}).get("available", 0))
+                existing_account = existing_accounts.get(belvo_account["id"])
 
                 if existing_account:
-                    # Update existing account
-                    existing_account.current_balance = float(belvo_account.get("balance", {}).get("current", 0))
-                    existing_account.available_balance = float(belvo_account.get("balance", {}).get("available", 0))
+                    # Update existing account, recording a change event only
+                    # when the balance actually moved
+                    old_balance_cents = existing_account.current_balance_cents or 0
+                    if old_balance_cents != current_balance_cents:
+                        balance_changes.append(BalanceChange(
+                            account_id=existing_account.id,
+                            user_id=existing_account.user_id,
+                            old_balance_cents=old_balance_cents,
+                            new_balance_cents=current_balance_cents
+                        ))
+
+                    existing_account.current_balance_cents = current_balance_cents
+                    existing_account.available_balance_cents = available_balance_cents
                     existing_account.last_synced_at = datetime.utcnow()
                 else:
                     # Create new account
@@ -207,21 +247,29 @@ def sync_accounts(
                         account_type=belvo_account.get("type", "checking"),
                         institution_name=belvo_account.get("institution", {}).get("name", "Unknown"),
                         currency=belvo_account.get("currency", "MXN"),
-                        current_balance=float(belvo_account.get("balance", {}).get("current", 0)),
-                        available_balance=float(belvo_account.get("balance", {}).get("available", 0)),
+                        current_balance_cents=current_balance_cents,
+                        available_balance_cents=available_balance_cents,
                         is_active=True,
                         is_primary=False,
                         last_synced_at=datetime.utcnow()
                     )
                     db.add(new_account)
+                    existing_accounts[belvo_account["id"]] = new_account
 
                 synced_count += 1
 
             except Exception as e:
                 errors.append(f"Failed to sync account {belvo_account.get('id')}: {str(e)}")
 
+        # Evaluate balance_threshold rules only for accounts that changed
+        fired_rules = automation_service.evaluate_balance_changes(db, balance_changes)
+
         db.commit()
 
+        _publish_sync_progress(current_user.id, "accounts", len(accounts), len(accounts))
+        if fired_rules:
+            alert_service.publish_unread_count(db, current_user.id)
+
         return BelvoSyncResponse(
             success=True,
             message=f"Successfully synced {synced_count} accounts",
@@ -267,57 +315,25 @@ def sync_transactions(
             date_to=sync_data.date_to
         )
 
-        synced_count = 0
-        errors = []
-
-        for belvo_transaction in transactions:
-            try:
-                # Check if transaction already exists
-                existing_transaction = db.query(Transaction).filter(
-                    Transaction.belvo_transaction_id == belvo_transaction["id"]
-                ).first()
-
-                if existing_transaction:
-                    continue  # Skip existing transactions
-
-                # Find corresponding bank account
-                account = db.query(BankAccount).filter(
-                    BankAccount.belvo_account_id == belvo_transaction.get("account", {}).get("id")
-                ).first()
-
-                if not account:
-                    errors.append(f"Account not found for transaction {belvo_transaction.get('id')}")
-                    continue
-
-                # Determine transaction type
-                amount = float(belvo_transaction.get("amount", 0))
-                transaction_type = "income" if amount > 0 else "expense"
-
-                # Create new transaction
-                new_transaction = Transaction(
-                    user_id=current_user.id,
-                    bank_account_id=account.id,
-                    belvo_transaction_id=belvo_transaction["id"],
-                    description=belvo_transaction.get("description", "Transaction"),
-                    merchant_name=belvo_transaction.get("merchant", {}).get("name"),
-                    category=belvo_transaction.get("category"),
-                    amount=abs(amount),
-                    currency=belvo_transaction.get("currency", "MXN"),
-                    transaction_type=transaction_type,
-                    reference=belvo_transaction.get("reference"),
-                    transaction_date=datetime.fromisoformat(belvo_transaction["value_date"].replace("Z", "+00:00")),
-                    value_date=datetime.fromisoformat(belvo_transaction["value_date"].replace("Z", "+00:00")),
-                    status="completed"
-                )
-
-                db.add(new_transaction)
-                synced_count += 1
-
-            except Exception as e:
-                errors.append(f"Failed to sync transaction {belvo_transaction.get('id')}: {str(e)}")
+        _publish_sync_progress(current_user.id, "transactions", 0, len(transactions))
+
+        # Large syncs take the COPY path on PostgreSQL
+        result = transaction_ingest_service.ingest(
+            db,
+            current_user.id,
+            transactions,
+            progress=lambda processed, total: _publish_sync_progress(
+                current_user.id, "transactions", processed, total
+            ),
+            progress_interval=SYNC_PROGRESS_INTERVAL
+        )
+        synced_count = result.inserted
+        errors = result.errors
 
         db.commit()
 
+        _publish_sync_progress(current_user.id, "transactions", len(transactions), len(transactions))
+
         return BelvoSyncResponse(
             success=True,
             message=f"Successfully synced {synced_count} transactions",
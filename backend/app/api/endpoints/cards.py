@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import List
 from app.db.base import get_db
-from app.api.dependencies import get_current_user
+from app.api.dependencies import conditional_get, get_current_user
 from app.models.user import User
 from app.models.credit_card import CreditCard
 from app.schemas.credit_card import (
@@ -11,11 +12,12 @@ from app.schemas.credit_card import (
     CreditCardResponse,
     CreditCardSummary
 )
+from app.schemas.money import to_cents, from_cents
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[CreditCardResponse])
+@router.get("/", response_model=List[CreditCardResponse], dependencies=[Depends(conditional_get(CreditCard))])
 def list_credit_cards(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -42,7 +44,7 @@ def list_credit_cards(
     return cards
 
 
-@router.get("/summary", response_model=CreditCardSummary)
+@router.get("/summary", response_model=CreditCardSummary, dependencies=[Depends(conditional_get(CreditCard))])
 def get_cards_summary(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -61,20 +63,25 @@ def get_cards_summary(
         CreditCard.user_id == current_user.id
     ).all()
 
-    active_cards = [card for card in cards if card.is_active]
-
-    total_credit_limit = sum(card.credit_limit for card in active_cards)
-    total_balance = sum(card.current_balance for card in active_cards)
-    total_available_credit = sum(card.available_credit for card in active_cards)
-    total_minimum_payment = sum(card.minimum_payment for card in active_cards)
+    # Exact integer sums in SQL
+    totals = db.query(
+        func.count(CreditCard.id),
+        func.coalesce(func.sum(CreditCard.credit_limit_cents), 0),
+        func.coalesce(func.sum(CreditCard.current_balance_cents), 0),
+        func.coalesce(func.sum(CreditCard.available_credit_cents), 0),
+        func.coalesce(func.sum(CreditCard.minimum_payment_cents), 0)
+    ).filter(
+        CreditCard.user_id == current_user.id,
+        CreditCard.is_active == True
+    ).one()
 
     return CreditCardSummary(
         total_cards=len(cards),
-        active_cards=len(active_cards),
-        total_credit_limit=total_credit_limit,
-        total_balance=total_balance,
-        total_available_credit=total_available_credit,
-        total_minimum_payment=total_minimum_payment,
+        active_cards=totals[0],
+        total_credit_limit=from_cents(totals[1]),
+        total_balance=from_cents(totals[2]),
+        total_available_credit=from_cents(totals[3]),
+        total_minimum_payment=from_cents(totals[4]),
         cards=cards
     )
 
@@ -97,7 +104,8 @@ def create_credit_card(
         Created credit card
     """
     # Calculate available credit
-    available_credit = card_data.credit_limit - card_data.current_balance
+    credit_limit_cents = to_cents(card_data.credit_limit)
+    current_balance_cents = to_cents(card_data.current_balance)
 
     # Create new card
     new_card = CreditCard(
@@ -106,9 +114,9 @@ def create_credit_card(
         last_four_digits=card_data.last_four_digits,
         institution_name=card_data.institution_name,
         card_type=card_data.card_type,
-        credit_limit=card_data.credit_limit,
-        current_balance=card_data.current_balance,
-        available_credit=available_credit,
+        credit_limit_cents=credit_limit_cents,
+        current_balance_cents=current_balance_cents,
+        available_credit_cents=credit_limit_cents - current_balance_cents,
         billing_cycle_day=card_data.billing_cycle_day,
         payment_due_day=card_data.payment_due_day,
         annual_interest_rate=card_data.annual_interest_rate,
@@ -194,9 +202,9 @@ def update_credit_card(
         card.card_name = card_update.card_name
 
     if card_update.credit_limit is not None:
-        card.credit_limit = card_update.credit_limit
+        card.credit_limit_cents = to_cents(card_update.credit_limit)
         # Recalculate available credit
-        card.available_credit = card.credit_limit - card.current_balance
+        card.available_credit_cents = card.credit_limit_cents - card.current_balance_cents
 
     if card_update.billing_cycle_day is not None:
         card.billing_cycle_day = card_update.billing_cycle_day
@@ -1,23 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import func
+from decimal import Decimal
 from typing import List
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from app.db.base import get_db
-from app.api.dependencies import get_current_user
+from app.db.base import get_db, SessionLocal
+from app.api.dependencies import conditional_get, get_current_user
+from app.api.responses import model_response
 from app.models.user import User
 from app.models.subscription import Subscription
+from app.services.merchants import merchant_directory
+from app.services.export import transaction_export_service, EXPORT_FORMATS, SUBSCRIPTIONS
 from app.schemas.subscription import (
     SubscriptionCreate,
     SubscriptionUpdate,
     SubscriptionResponse,
     SubscriptionSummary
 )
+from app.schemas.money import to_cents, from_cents, CENTS_PER_UNIT
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[SubscriptionResponse])
+@router.get("/", response_model=List[SubscriptionResponse], dependencies=[Depends(conditional_get(Subscription))])
 def list_subscriptions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -44,8 +51,9 @@ def list_subscriptions(
     return subscriptions
 
 
-@router.get("/summary", response_model=SubscriptionSummary)
+@router.get("/summary", response_model=SubscriptionSummary, dependencies=[Depends(conditional_get(Subscription, daily=True))])
 def get_subscriptions_summary(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -53,6 +61,7 @@ def get_subscriptions_summary(
     Get summary of all subscriptions
 
     Args:
+        response: Response carrying the ETag
         current_user: Current authenticated user
         db: Database session
 
@@ -65,21 +74,19 @@ def get_subscriptions_summary(
 
     active_subscriptions = [sub for sub in subscriptions if sub.is_active]
 
-    # Calculate monthly and yearly costs
-    monthly_cost = 0.0
-    yearly_cost = 0.0
+    # Calculate monthly and yearly costs from exact per-frequency sums
+    cents_by_frequency = dict(
+        db.query(Subscription.billing_frequency, func.sum(Subscription.amount_cents))
+        .filter(Subscription.user_id == current_user.id, Subscription.is_active == True)
+        .group_by(Subscription.billing_frequency)
+        .all()
+    )
+    monthly_cents = Decimal(cents_by_frequency.get("monthly") or 0)
+    yearly_cents = Decimal(cents_by_frequency.get("yearly") or 0)
+    weekly_cents = Decimal(cents_by_frequency.get("weekly") or 0)
 
-    for sub in active_subscriptions:
-        if sub.billing_frequency == "monthly":
-            monthly_cost += sub.amount
-            yearly_cost += sub.amount * 12
-        elif sub.billing_frequency == "yearly":
-            yearly_cost += sub.amount
-            monthly_cost += sub.amount / 12
-        elif sub.billing_frequency == "weekly":
-            weekly_cost = sub.amount
-            monthly_cost += weekly_cost * 4.33  # Average weeks per month
-            yearly_cost += weekly_cost * 52
+    monthly_cost = monthly_cents + yearly_cents / 12 + weekly_cents * Decimal("4.33")  # Average weeks per month
+    yearly_cost = monthly_cents * 12 + yearly_cents + weekly_cents * 52
 
     # Get upcoming charges (next 30 days)
     today = datetime.now().date()
@@ -91,7 +98,7 @@ def get_subscriptions_summary(
             upcoming_charges.append({
                 "subscription_id": sub.id,
                 "service_name": sub.service_name,
-                "amount": sub.amount,
+                "amount": from_cents(sub.amount_cents),
                 "currency": sub.currency,
                 "charge_date": sub.next_charge_date.isoformat()
             })
@@ -99,14 +106,14 @@ def get_subscriptions_summary(
     # Sort by date
     upcoming_charges.sort(key=lambda x: x["charge_date"])
 
-    return SubscriptionSummary(
+    return model_response(SubscriptionSummary(
         total_subscriptions=len(subscriptions),
         active_subscriptions=len(active_subscriptions),
-        monthly_cost=round(monthly_cost, 2),
-        yearly_cost=round(yearly_cost, 2),
+        monthly_cost=round(float(monthly_cost / CENTS_PER_UNIT), 2),
+        yearly_cost=round(float(yearly_cost / CENTS_PER_UNIT), 2),
         subscriptions=subscriptions,
         upcoming_charges=upcoming_charges
-    )
+    ), response)
 
 
 @router.post("/", response_model=SubscriptionResponse, status_code=status.HTTP_201_CREATED)
@@ -141,8 +148,9 @@ def create_subscription(
         user_id=current_user.id,
         service_name=subscription_data.service_name,
         merchant_name=subscription_data.merchant_name,
+        merchant_id=merchant_directory.resolve(db, subscription_data.merchant_name),
         category=subscription_data.category,
-        amount=subscription_data.amount,
+        amount_cents=to_cents(subscription_data.amount),
         currency=subscription_data.currency,
         billing_frequency=subscription_data.billing_frequency,
         billing_day=subscription_data.billing_day,
@@ -162,6 +170,36 @@ def create_subscription(
     return new_subscription
 
 
+@router.get("/export")
+def export_subscriptions(
+    current_user: User = Depends(get_current_user),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet|arrow)$"),
+    include_inactive: bool = False
+):
+    """
+    Stream the user's subscriptions as CSV, NDJSON, Parquet or Arrow IPC
+
+    Args:
+        current_user: Current authenticated user
+        format: csv, ndjson, parquet or arrow
+        include_inactive: Include inactive subscriptions
+
+    Returns:
+        Streaming file download
+    """
+    criteria = [Subscription.user_id == current_user.id]
+    if not include_inactive:
+        criteria.append(Subscription.is_active == True)
+
+    content = transaction_export_service.stream(SessionLocal, criteria, format, SUBSCRIPTIONS)
+    filename = f"subscriptions-{datetime.utcnow().strftime('%Y%m%d')}.{format}"
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/{subscription_id}", response_model=SubscriptionResponse)
 def get_subscription(
     subscription_id: int,
@@ -234,7 +272,7 @@ def update_subscription(
         subscription.service_name = subscription_update.service_name
 
     if subscription_update.amount is not None:
-        subscription.amount = subscription_update.amount
+        subscription.amount_cents = to_cents(subscription_update.amount)
 
     if subscription_update.billing_frequency is not None:
         subscription.billing_frequency = subscription_update.billing_frequency
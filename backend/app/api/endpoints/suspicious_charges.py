@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
-from app.db.base import get_db
+from app.db.base import get_db, SessionLocal
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.suspicious_charge import SuspiciousCharge
@@ -11,6 +12,8 @@ from app.schemas.suspicious_charge import (
     SuspiciousChargeResponse,
     SuspiciousChargeSummary
 )
+from app.schemas.money import from_cents
+from app.services.export import transaction_export_service, EXPORT_FORMATS, SUSPICIOUS_CHARGES
 
 router = APIRouter()
 
@@ -66,10 +69,10 @@ def get_suspicious_charges_summary(
     confirmed_legitimate = sum(1 for c in charges if c.status == "confirmed_legitimate")
 
     # Calculate total amount at risk (pending charges)
-    total_amount_at_risk = sum(
-        c.amount for c in charges
+    total_amount_at_risk = from_cents(sum(
+        c.amount_cents for c in charges
         if c.status == "pending" or c.status == "confirmed_fraudulent"
-    )
+    ))
 
     return SuspiciousChargeSummary(
         total_suspicious=len(charges),
@@ -81,6 +84,36 @@ def get_suspicious_charges_summary(
     )
 
 
+@router.get("/export")
+def export_suspicious_charges(
+    current_user: User = Depends(get_current_user),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet|arrow)$"),
+    status_filter: str = None
+):
+    """
+    Stream the user's suspicious charges as CSV, NDJSON, Parquet or Arrow IPC
+
+    Args:
+        current_user: Current authenticated user
+        format: csv, ndjson, parquet or arrow
+        status_filter: Filter by status (pending, confirmed_fraudulent, confirmed_legitimate, dismissed)
+
+    Returns:
+        Streaming file download
+    """
+    criteria = [SuspiciousCharge.user_id == current_user.id]
+    if status_filter:
+        criteria.append(SuspiciousCharge.status == status_filter)
+
+    content = transaction_export_service.stream(SessionLocal, criteria, format, SUSPICIOUS_CHARGES)
+    filename = f"suspicious-charges-{datetime.utcnow().strftime('%Y%m%d')}.{format}"
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/{charge_id}", response_model=SuspiciousChargeResponse)
 def get_suspicious_charge(
     charge_id: int,
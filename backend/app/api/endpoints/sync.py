@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.db.base import get_db
+from app.api.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.sync import SyncChangesResponse
+from app.services.changes import change_feed_service
+
+router = APIRouter()
+
+
+@router.get("/changes", response_model=SyncChangesResponse)
+def get_changes(
+    since: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=2000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get everything that changed for the current user since a token
+
+    Covers accounts, cards, subscriptions, alerts, suspicious charges,
+    transactions and automation rules. Call without since for a full first sync, then pass the
+    returned token as since. Keep calling while has_more is true. Rows may
+    be repeated across responses; apply them as upserts by ID.
+
+    Args:
+        since: Token from the previous response
+        limit: Max rows per entity type (defaults to SYNC_CHANGES_PAGE_SIZE)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Changed and deleted rows per entity type, next token and has_more
+
+    Raises:
+        HTTPException: If the token is invalid
+    """
+    try:
+        changes, token, has_more = change_feed_service.changes(db, current_user.id, since, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return SyncChangesResponse(token=token, has_more=has_more, **changes)
@@ -1,28 +1,76 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from typing import Optional
 from datetime import datetime, timedelta
 from collections import defaultdict
-from app.db.base import get_db
+import csv
+from app.db.base import get_db, SessionLocal
 from app.api.dependencies import get_current_user
+from app.api.fieldsets import FieldSet, LIST_FORMAT_OBJECTS, LIST_FORMAT_PATTERN, dump_items
+from app.api.responses import json_response, model_response
 from app.models.user import User
 from app.models.transaction import Transaction
 from app.models.bank_account import BankAccount
 from app.models.credit_card import CreditCard
+from app.models.merchant import Merchant
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
     TransactionListResponse,
+    TransactionSearchHit,
+    TransactionSearchResponse,
+    TransactionImportResponse,
     TransactionAnalytics
 )
+from app.schemas.money import to_cents, from_cents
+from app.services.search import transaction_search_service
+from app.services.merchants import merchant_directory
+from app.services.categorization import categorization_service, SOURCE_USER
+from app.services.export import transaction_export_service, EXPORT_FORMATS
+from app.services.transaction_import import transaction_import_service, ImportLimitExceeded
 
 router = APIRouter()
 
 
+def _transaction_filters(
+    user_id: int,
+    transaction_type: Optional[str] = None,
+    category: Optional[str] = None,
+    account_id: Optional[int] = None,
+    card_id: Optional[int] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> list:
+    """Build the filter expressions shared by listing and export"""
+    criteria = [Transaction.user_id == user_id]
+
+    if transaction_type:
+        criteria.append(Transaction.transaction_type == transaction_type)
+
+    if category:
+        criteria.append(Transaction.category == category)
+
+    if account_id:
+        criteria.append(Transaction.bank_account_id == account_id)
+
+    if card_id:
+        criteria.append(Transaction.credit_card_id == card_id)
+
+    if date_from:
+        criteria.append(Transaction.transaction_date >= datetime.fromisoformat(date_from))
+
+    if date_to:
+        criteria.append(Transaction.transaction_date <= datetime.fromisoformat(date_to))
+
+    return criteria
+
+
 @router.get("/", response_model=TransactionListResponse)
 def list_transactions(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -32,12 +80,15 @@ def list_transactions(
     account_id: Optional[int] = None,
     card_id: Optional[int] = None,
     date_from: Optional[str] = None,
-    date_to: Optional[str] = None
+    date_to: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated transaction fields to return"),
+    format: str = Query(LIST_FORMAT_OBJECTS, pattern=LIST_FORMAT_PATTERN)
 ):
     """
     List transactions for current user with pagination and filters
 
     Args:
+        response: Response whose headers are sent along
         current_user: Current authenticated user
         db: Database session
         page: Page number
@@ -48,43 +99,164 @@ def list_transactions(
         card_id: Filter by credit card
         date_from: Filter from date (YYYY-MM-DD)
         date_to: Filter to date (YYYY-MM-DD)
+        fields: Only load and return these fields (e.g. id,description,amount)
+        format: objects, or compact for {"fields": [...], "rows": [[...]]}
 
     Returns:
         Paginated list of transactions
-    """
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
-
-    # Apply filters
-    if transaction_type:
-        query = query.filter(Transaction.transaction_type == transaction_type)
 
-    if category:
-        query = query.filter(Transaction.category == category)
-
-    if account_id:
-        query = query.filter(Transaction.bank_account_id == account_id)
-
-    if card_id:
-        query = query.filter(Transaction.credit_card_id == card_id)
-
-    if date_from:
-        query = query.filter(Transaction.transaction_date >= datetime.fromisoformat(date_from))
+    Raises:
+        HTTPException: If fields names an unknown field
+    """
+    try:
+        field_set = FieldSet.parse(TransactionResponse, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    if date_to:
-        query = query.filter(Transaction.transaction_date <= datetime.fromisoformat(date_to))
+    query = db.query(Transaction).filter(*_transaction_filters(
+        current_user.id, transaction_type, category, account_id, card_id, date_from, date_to
+    ))
 
     # Get total count
     total = query.count()
 
     # Paginate
     offset = (page - 1) * page_size
+    if field_set:
+        query = query.options(field_set.load_only(Transaction))
     transactions = query.order_by(Transaction.transaction_date.desc()).offset(offset).limit(page_size).all()
 
-    return TransactionListResponse(
+    if field_set or format != LIST_FORMAT_OBJECTS:
+        return json_response({
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "transactions": dump_items(transactions, TransactionResponse, field_set, format),
+        }, response)
+
+    return model_response(TransactionListResponse(
         total=total,
         page=page,
         page_size=page_size,
         transactions=transactions
+    ), response)
+
+
+@router.get("/export")
+def export_transactions(
+    current_user: User = Depends(get_current_user),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet|arrow)$"),
+    transaction_type: Optional[str] = None,
+    category: Optional[str] = None,
+    account_id: Optional[int] = None,
+    card_id: Optional[int] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+):
+    """
+    Stream all matching transactions as CSV, NDJSON, Parquet or Arrow IPC
+
+    Rows are read through a server-side cursor and written in batches, so
+    memory stays flat however many transactions the user has. Parquet and
+    Arrow are zstd-compressed, one row group / record batch per batch, with
+    amounts as exact integer amount_cents.
+
+    Args:
+        current_user: Current authenticated user
+        format: csv, ndjson, parquet or arrow
+        transaction_type: Filter by type (income, expense, transfer)
+        category: Filter by category
+        account_id: Filter by bank account
+        card_id: Filter by credit card
+        date_from: Filter from date (YYYY-MM-DD)
+        date_to: Filter to date (YYYY-MM-DD)
+
+    Returns:
+        Streaming file download
+    """
+    try:
+        criteria = _transaction_filters(
+            current_user.id, transaction_type, category, account_id, card_id, date_from, date_to
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    content = transaction_export_service.stream(SessionLocal, criteria, format)
+    filename = f"transactions-{datetime.utcnow().strftime('%Y%m%d')}.{format}"
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/search", response_model=TransactionSearchResponse)
+def search_transactions(
+    q: str = Query(..., min_length=1, max_length=200),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: str = Query("relevance", pattern="^(relevance|date)$"),
+    transaction_type: Optional[str] = None,
+    category: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+):
+    """
+    Full-text search over description, merchant name and notes
+
+    Args:
+        q: Search text (words are prefix-matched)
+        current_user: Current authenticated user
+        db: Database session
+        limit: Page size
+        cursor: Cursor returned by the previous page
+        sort: Order by relevance or date
+        transaction_type: Filter by type (income, expense, transfer)
+        category: Filter by category
+        date_from: Filter from date (YYYY-MM-DD)
+        date_to: Filter to date (YYYY-MM-DD)
+
+    Returns:
+        Ranked transactions and the cursor for the next page
+
+    Raises:
+        HTTPException: If the query or cursor is invalid
+    """
+    try:
+        results, next_cursor = transaction_search_service.search(
+            db,
+            current_user.id,
+            q,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            transaction_type=transaction_type,
+            category=category,
+            date_from=datetime.fromisoformat(date_from) if date_from else None,
+            date_to=datetime.fromisoformat(date_to) if date_to else None
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    hits = []
+    for transaction, rank in results:
+        hit = TransactionSearchHit.model_validate(transaction)
+        hit.rank = rank
+        hits.append(hit)
+
+    return TransactionSearchResponse(
+        query=q,
+        sort=sort,
+        transactions=hits,
+        next_cursor=next_cursor
     )
 
 
@@ -107,52 +279,76 @@ def get_transaction_analytics(
     """
     date_from = datetime.now() - timedelta(days=days)
 
-    transactions = db.query(Transaction).filter(
+    base_filters = (
         Transaction.user_id == current_user.id,
         Transaction.transaction_date >= date_from
-    ).all()
+    )
+    # Amounts are integer cents, so SQL sums are exact
+    amount_sum = func.sum(func.abs(Transaction.amount_cents))
 
     # Calculate totals
-    total_income = sum(t.amount for t in transactions if t.transaction_type == "income")
-    total_expenses = sum(abs(t.amount) for t in transactions if t.transaction_type == "expense")
-    net_flow = total_income - total_expenses
+    totals = dict(
+        db.query(Transaction.transaction_type, amount_sum)
+        .filter(*base_filters)
+        .group_by(Transaction.transaction_type)
+        .all()
+    )
+    total_income_cents = totals.get("income") or 0
+    total_expenses_cents = totals.get("expense") or 0
 
     # Top categories
-    category_totals = defaultdict(float)
-    for t in transactions:
-        if t.category and t.transaction_type == "expense":
-            category_totals[t.category] += abs(t.amount)
-
-    top_categories = dict(sorted(category_totals.items(), key=lambda x: x[1], reverse=True)[:10])
-
-    # Top merchants
-    merchant_totals = defaultdict(float)
-    for t in transactions:
-        if t.merchant_name and t.transaction_type == "expense":
-            merchant_totals[t.merchant_name] += abs(t.amount)
-
-    top_merchants = dict(sorted(merchant_totals.items(), key=lambda x: x[1], reverse=True)[:10])
+    top_categories = {
+        category: from_cents(total)
+        for category, total in db.query(Transaction.category, amount_sum)
+        .filter(*base_filters, Transaction.transaction_type == "expense", Transaction.category.isnot(None))
+        .group_by(Transaction.category)
+        .order_by(amount_sum.desc())
+        .limit(10)
+    }
+
+    # Top merchants, grouped by normalized merchant ID
+    top_merchants = {
+        merchant: from_cents(total)
+        for _, merchant, total in db.query(Merchant.id, Merchant.name, amount_sum)
+        .join(Merchant, Merchant.id == Transaction.merchant_id)
+        .filter(*base_filters, Transaction.transaction_type == "expense")
+        .group_by(Merchant.id, Merchant.name)
+        .order_by(amount_sum.desc())
+        .limit(10)
+    }
 
     # Monthly summary
-    monthly_summary = defaultdict(lambda: {"income": 0.0, "expenses": 0.0, "net": 0.0})
-    for t in transactions:
-        month_key = t.transaction_date.strftime("%Y-%m")
-        if t.transaction_type == "income":
-            monthly_summary[month_key]["income"] += t.amount
-        elif t.transaction_type == "expense":
-            monthly_summary[month_key]["expenses"] += abs(t.amount)
+    year = extract("year", Transaction.transaction_date)
+    month = extract("month", Transaction.transaction_date)
+    monthly_cents = defaultdict(lambda: {"income": 0, "expenses": 0})
+    for row_year, row_month, transaction_type, total in (
+        db.query(year, month, Transaction.transaction_type, amount_sum)
+        .filter(*base_filters)
+        .group_by(year, month, Transaction.transaction_type)
+    ):
+        month_key = f"{int(row_year):04d}-{int(row_month):02d}"
+        if transaction_type == "income":
+            monthly_cents[month_key]["income"] += total
+        elif transaction_type == "expense":
+            monthly_cents[month_key]["expenses"] += total
 
     # Calculate net for each month
-    for month in monthly_summary:
-        monthly_summary[month]["net"] = monthly_summary[month]["income"] - monthly_summary[month]["expenses"]
+    monthly_summary = {
+        month_key: {
+            "income": from_cents(values["income"]),
+            "expenses": from_cents(values["expenses"]),
+            "net": from_cents(values["income"] - values["expenses"])
+        }
+        for month_key, values in sorted(monthly_cents.items())
+    }
 
     return TransactionAnalytics(
-        total_income=total_income,
-        total_expenses=total_expenses,
-        net_flow=net_flow,
+        total_income=from_cents(total_income_cents),
+        total_expenses=from_cents(total_expenses_cents),
+        net_flow=from_cents(total_income_cents - total_expenses_cents),
         top_categories=top_categories,
         top_merchants=top_merchants,
-        monthly_summary=dict(monthly_summary)
+        monthly_summary=monthly_summary
     )
 
 
@@ -203,14 +399,19 @@ def create_transaction(
         credit_card_id=transaction_data.credit_card_id,
         description=transaction_data.description,
         merchant_name=transaction_data.merchant_name,
+        merchant_id=merchant_directory.resolve(db, transaction_data.merchant_name),
         category=transaction_data.category,
-        amount=transaction_data.amount,
+        category_source=SOURCE_USER if transaction_data.category else None,
+        amount_cents=to_cents(transaction_data.amount),
         currency=transaction_data.currency,
         transaction_type=transaction_data.transaction_type,
         transaction_date=transaction_data.transaction_date,
         status="completed"
     )
 
+    if not transaction_data.category:
+        categorization_service.assign(db, current_user.id, [new_transaction])
+
     db.add(new_transaction)
     db.commit()
     db.refresh(new_transaction)
@@ -218,6 +419,75 @@ def create_transaction(
     return new_transaction
 
 
+@router.post("/import", response_model=TransactionImportResponse)
+def import_transactions(
+    file: UploadFile = File(...),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bulk-import transactions from a CSV or NDJSON file
+
+    Columns/keys match POST /transactions (description, amount,
+    transaction_type, transaction_date, plus the optional fields). Valid
+    rows are imported together; invalid rows are skipped and reported.
+
+    Args:
+        file: Uploaded CSV (with header) or NDJSON file
+        format: csv or ndjson
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Imported and failed counts with per-row errors
+
+    Raises:
+        HTTPException: If the file is too large or cannot be decoded
+    """
+    try:
+        report = transaction_import_service.import_file(db, current_user.id, file.file, format)
+    except ImportLimitExceeded as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Could not read file: {e}"
+        )
+
+    return TransactionImportResponse(
+        total_rows=report.total_rows,
+        imported=report.imported,
+        failed=report.failed,
+        errors=report.errors
+    )
+
+
+@router.post("/recategorize", response_model=dict, status_code=status.HTTP_202_ACCEPTED)
+def recategorize_transactions(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Queue re-applying categorization rules to the user's past transactions
+
+    The job runs after the response is sent, in chunks that commit as they
+    go. Transactions the user categorized by hand are not changed.
+
+    Args:
+        background_tasks: Request background tasks
+        current_user: Current authenticated user
+
+    Returns:
+        Queued status
+    """
+    background_tasks.add_task(categorization_service.recategorize_user, SessionLocal, current_user.id)
+    return {"status": "queued"}
+
+
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 def get_transaction(
     transaction_id: int,
@@ -287,7 +557,11 @@ def update_transaction(
 
     # Update fields if provided
     if transaction_update.category is not None:
+        # Remember the correction for future transactions at this merchant
+        if transaction_update.category != transaction.category:
+            categorization_service.learn(db, current_user.id, transaction.merchant_id, transaction_update.category)
         transaction.category = transaction_update.category
+        transaction.category_source = SOURCE_USER
 
     if transaction_update.notes is not None:
         transaction.notes = transaction_update.notes
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from app.db.base import get_db
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.bank_account import BankAccount
 from app.models.credit_card import CreditCard
 from app.models.subscription import Subscription
-from app.models.alert import Alert
 from app.schemas.user import UserResponse, UserUpdate, UserProfile
+from app.schemas.money import from_cents
 
 router = APIRouter()
 
@@ -53,18 +54,20 @@ def get_user_profile(
     ).count()
 
     # Calculate total balance
-    accounts = db.query(BankAccount).filter(
+    total_balance = from_cents(db.query(
+        func.coalesce(func.sum(BankAccount.current_balance_cents), 0)
+    ).filter(
         BankAccount.user_id == current_user.id,
         BankAccount.is_active == True
-    ).all()
-    total_balance = sum(account.current_balance for account in accounts)
+    ).scalar())
 
     # Calculate total credit limit
-    cards = db.query(CreditCard).filter(
+    total_credit_limit = from_cents(db.query(
+        func.coalesce(func.sum(CreditCard.credit_limit_cents), 0)
+    ).filter(
         CreditCard.user_id == current_user.id,
         CreditCard.is_active == True
-    ).all()
-    total_credit_limit = sum(card.credit_limit for card in cards)
+    ).scalar())
 
     # Count active subscriptions
     active_subscriptions = db.query(Subscription).filter(
@@ -72,12 +75,8 @@ def get_user_profile(
         Subscription.is_active == True
     ).count()
 
-    # Count pending alerts
-    pending_alerts = db.query(Alert).filter(
-        Alert.user_id == current_user.id,
-        Alert.is_read == False,
-        Alert.is_dismissed == False
-    ).count()
+    # Pending alerts come from the per-user unread counter
+    pending_alerts = current_user.unread_alerts_count or 0
 
     # Build profile response
     profile = UserProfile(
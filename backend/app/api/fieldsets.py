@@ -0,0 +1,86 @@
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+LIST_FORMAT_OBJECTS = "objects"
+LIST_FORMAT_COMPACT = "compact"  # {"fields": [...], "rows": [[...], ...]}
+LIST_FORMAT_PATTERN = f"^({LIST_FORMAT_OBJECTS}|{LIST_FORMAT_COMPACT})$"
+
+
+@lru_cache(maxsize=128)
+def _subset_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """Copy of schema with only the named fields (validators and aliases kept)"""
+    fields = {name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names}
+    return create_model(f"{schema.__name__}Fields", __config__=ConfigDict(from_attributes=True), **fields)
+
+
+@lru_cache(maxsize=128)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+class FieldSet:
+    """
+    Fields of a list item schema requested with ?fields=a,b,c
+
+    Trims both the SELECT (load_only on the ORM columns behind the fields)
+    and the serialized items. Unknown field names raise ValueError.
+    """
+
+    def __init__(self, schema: Type[BaseModel], names: Iterable[str]):
+        self.names = tuple(dict.fromkeys(names))
+        unknown = [name for name in self.names if name not in schema.model_fields]
+        if not self.names or unknown:
+            problem = f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields given"
+            raise ValueError(f"{problem}. Valid fields: {', '.join(schema.model_fields)}")
+        self.schema = schema
+        self.item_schema = _subset_schema(schema, self.names)
+
+    @classmethod
+    def parse(cls, schema: Type[BaseModel], fields: Optional[str]) -> Optional["FieldSet"]:
+        """FieldSet for a comma-separated fields parameter, or None for all fields"""
+        if fields is None:
+            return None
+        return cls(schema, (name.strip() for name in fields.split(",") if name.strip()))
+
+    def load_only(self, model) -> Any:
+        """Loader option selecting only the columns behind the requested fields"""
+        column_names = {attr.key for attr in inspect(model).column_attrs}
+        columns = []
+        for name in self.names:
+            alias = self.schema.model_fields[name].validation_alias
+            source = alias if isinstance(alias, str) else name
+            if source in column_names:
+                columns.append(getattr(model, source))
+        return load_only(*columns)
+
+
+def dump_items(
+    objects: List[Any],
+    schema: Type[BaseModel],
+    field_set: Optional[FieldSet] = None,
+    list_format: str = LIST_FORMAT_OBJECTS
+) -> Any:
+    """
+    Serialize ORM objects for a list response
+
+    Args:
+        objects: ORM objects
+        schema: Full item schema (e.g. TransactionResponse)
+        field_set: Requested fields, or None for all of them
+        list_format: "objects" for a list of dicts, "compact" for
+            {"fields": names, "rows": [[values in field order], ...]}
+
+    Returns:
+        JSON-ready items
+    """
+    item_schema = field_set.item_schema if field_set else schema
+    adapter = _list_adapter(item_schema)
+    items = adapter.dump_python(adapter.validate_python(objects, from_attributes=True), mode="json")
+
+    if list_format != LIST_FORMAT_COMPACT:
+        return items
+    names = list(field_set.names if field_set else schema.model_fields)
+    return {"fields": names, "rows": [[item[name] for name in names] for item in items]}
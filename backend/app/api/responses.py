@@ -0,0 +1,71 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(value: Any) -> Any:
+    """Types orjson does not serialize natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered in Rust instead of with json.dumps
+
+    Pydantic models are written with model_dump_json in a single pass;
+    anything else (FastAPI's already-serialized content) goes through orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(model: BaseModel, response: Response, status_code: int = 200) -> FastJSONResponse:
+    """
+    Send a built response model without FastAPI validating and dumping it again
+
+    When an endpoint returns its response_model instance, FastAPI dumps it to
+    a dict, validates that dict back into the model and serializes it once
+    more. Returning this response skips both extra passes. Headers set on the
+    endpoint's Response parameter (e.g. an ETag from conditional_get) are
+    carried over, as FastAPI only merges them into responses it builds.
+
+    Args:
+        model: Instance of the endpoint's response_model
+        response: The endpoint's Response parameter
+        status_code: HTTP status code
+
+    Returns:
+        Rendered JSON response
+    """
+    return json_response(model, response, status_code)
+
+
+def json_response(content: Any, response: Response, status_code: int = 200) -> FastJSONResponse:
+    """
+    Send content as-is, bypassing the endpoint's response_model
+
+    Used for partial representations (?fields=, compact lists) and by
+    model_response; headers set on the endpoint's Response parameter are
+    carried over.
+
+    Args:
+        content: A pydantic model, or dicts/lists/scalars as produced by mode="json" dumps
+        response: The endpoint's Response parameter
+        status_code: HTTP status code
+
+    Returns:
+        Rendered JSON response
+    """
+    rendered = FastJSONResponse(content, status_code=status_code)
+    rendered.headers.raw.extend(response.headers.raw)
+    return rendered
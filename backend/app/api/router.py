@@ -9,7 +9,9 @@ from app.api.endpoints import (
     suspicious_charges,
     alerts,
     automation,
-    belvo
+    belvo,
+    sync,
+    admin
 )
 
 api_router = APIRouter()
@@ -25,3 +27,5 @@ api_router.include_router(suspicious_charges.router, prefix="/suspicious-charges
 api_router.include_router(alerts.router, prefix="/alerts", tags=["Alerts"])
 api_router.include_router(automation.router, prefix="/automation", tags=["Automation Rules"])
 api_router.include_router(belvo.router, prefix="/belvo", tags=["Belvo Integration"])
+api_router.include_router(sync.router, prefix="/sync", tags=["Sync"])
+api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
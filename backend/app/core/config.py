@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 3  # Monthly partitions pre-created ahead of time
 
     # JWT Configuration
     SECRET_KEY: str
@@ -32,11 +33,19 @@ class Settings(BaseSettings):
     BELVO_SECRET_ID: str
     BELVO_SECRET_PASSWORD: str
     BELVO_ENVIRONMENT: str = "sandbox"
+    BELVO_INGEST_BATCH_SIZE: int = 1000  # Rows per executemany insert during sync
+    BELVO_COPY_THRESHOLD: int = 5000  # Syncs with more new rows use COPY on PostgreSQL (0 disables)
 
     # Redis Configuration (optional in production)
     REDIS_URL: Optional[str] = None
     REDIS_PASSWORD: str = ""
 
+    # Realtime Events (SSE)
+    EVENTS_REDIS_FANOUT: bool = False  # Fan events out across workers via Redis pub/sub
+    EVENTS_REDIS_CHANNEL: str = "glass:events"
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_QUEUE_SIZE: int = 100
+
     # Celery Configuration (optional in production)
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
@@ -46,6 +55,7 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
     CORS_ORIGINS: str = "http://localhost:19006,http://localhost:8081"
+    ADMIN_EMAILS: str = ""  # Comma-separated users allowed on /admin endpoints, once verified
 
     # Brevo Email Configuration (formerly Sendinblue)
     BREVO_API_KEY: Optional[str] = None
@@ -57,11 +67,61 @@ class Settings(BaseSettings):
     SUSPICIOUS_CHARGE_THRESHOLD: float = 1000.0
     SUBSCRIPTION_DETECTION_DAYS: int = 90
 
+    # Prometheus metrics (/metrics); set PROMETHEUS_MULTIPROC_DIR under gunicorn
+    METRICS_ENABLED: bool = True
+
+    # SQL query stats per request (Server-Timing header, N+1 warnings)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_SERVER_TIMING: bool = True
+    QUERY_REPEAT_WARNING_THRESHOLD: int = 10  # Warn when one statement runs more often in a request
+
+    # Slow query log (opt-in; /admin/slow-queries)
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: int = 200  # Record statements slower than this
+    SLOW_QUERY_EXPLAIN_THRESHOLD_MS: int = 1000  # Also capture an EXPLAIN plan above this
+    SLOW_QUERY_BUFFER_SIZE: int = 200  # Most recent slow queries kept per worker
+
+    # Request profiling (admins send X-Profile: 1; /admin/profiles)
+    PROFILING_ENABLED: bool = True
+    PROFILING_SAMPLE_RATE: float = 0.0  # Fraction of all requests profiled at random
+    PROFILING_INTERVAL_MS: int = 5  # Stack sampling interval
+    PROFILING_BUFFER_SIZE: int = 50  # Most recent profiles kept per worker
+
+    # Response Compression (gzip, or brotli when installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # Bytes; smaller bodies are sent uncompressed
+    COMPRESSION_THREAD_MIN_SIZE: int = 262_144  # Bytes; larger bodies are compressed off the event loop
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Categorization
+    CATEGORIZATION_CACHE_SECONDS: int = 300  # Compiled rule sets are rebuilt after this
+    CATEGORIZATION_USER_CACHE_SIZE: int = 1024  # Users whose rules stay compiled per worker
+    CATEGORIZATION_BATCH_SIZE: int = 1000
+
+    # Delta Sync (/sync/changes)
+    SYNC_CHANGES_PAGE_SIZE: int = 500  # Max rows per entity per response
+    SYNC_CHANGES_OVERLAP_SECONDS: int = 120  # Re-read window for rows committed after the token was issued
+
+    # Bulk Transaction Import
+    IMPORT_BATCH_SIZE: int = 1000  # Rows per executemany insert
+    IMPORT_MAX_ROWS: int = 100_000  # Rows accepted per upload
+
+    # Alert Retention (0 disables a rule)
+    ALERT_RETENTION_DISMISSED_DAYS: int = 30  # Archive dismissed alerts after N days
+    ALERT_RETENTION_MAX_AGE_DAYS: int = 365  # Archive any alert older than N days
+    ALERT_RETENTION_BATCH_SIZE: int = 1000
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS_ORIGINS string to list"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def admin_emails_list(self) -> List[str]:
+        """Convert ADMIN_EMAILS string to a list of lowercase emails"""
+        return [email.strip().lower() for email in self.ADMIN_EMAILS.split(",") if email.strip()]
+
 
 # Initialize settings - will read from environment variables
 settings = Settings()
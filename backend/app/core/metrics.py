@@ -0,0 +1,145 @@
+"""
+Prometheus metrics
+
+Under gunicorn, set PROMETHEUS_MULTIPROC_DIR to an empty directory before
+the workers start. Every worker then writes its samples there and
+/metrics aggregates all of them (see gunicorn.conf.py); without it each
+worker only reports its own.
+"""
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+import os
+import time
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# HTTP requests (app.middleware.metrics)
+HTTP_REQUEST_DURATION = Histogram(
+    "glass_http_request_duration_seconds",
+    "Request latency until the last body byte is sent",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUEST_DB_QUERIES = Histogram(
+    "glass_http_request_db_queries",
+    "SQL statements executed per request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100, 250),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "glass_http_requests_in_progress",
+    "Requests being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# SQLAlchemy connection pool
+DB_POOL_CHECKED_OUT = Gauge(
+    "glass_db_pool_checked_out_connections",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "glass_db_pool_overflow_connections",
+    "Connections open beyond pool_size",
+    multiprocess_mode="livesum",
+)
+
+# Calls to external APIs (Belvo, Brevo)
+EXTERNAL_CALL_DURATION = Histogram(
+    "glass_external_call_duration_seconds",
+    "Latency of calls to external APIs",
+    ["service", "operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+EXTERNAL_CALL_ERRORS = Counter(
+    "glass_external_call_errors",
+    "Failed calls to external APIs",
+    ["service", "operation"],
+)
+
+# Response compression (app.middleware.compression)
+COMPRESSION_RATIO = Histogram(
+    "glass_response_compression_ratio",
+    "Compressed size divided by original size per compressed response",
+    ["encoding"],
+    buckets=(0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.7, 0.9, 1.0),
+)
+COMPRESSION_CPU_SECONDS = Histogram(
+    "glass_response_compression_cpu_seconds",
+    "CPU time spent compressing one response body",
+    ["encoding"],
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+COMPRESSION_INPUT_BYTES = Counter(
+    "glass_response_compression_input_bytes",
+    "Response bytes before compression",
+    ["encoding"],
+)
+COMPRESSION_OUTPUT_BYTES = Counter(
+    "glass_response_compression_output_bytes",
+    "Response bytes after compression",
+    ["encoding"],
+)
+
+
+@contextmanager
+def track_external_call(service: str, operation: str) -> Iterator[None]:
+    """
+    Time a call to an external API, counting it as an error if it raises
+
+    Args:
+        service: API name (belvo, brevo)
+        operation: Call name, e.g. transactions.create
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_CALL_ERRORS.labels(service, operation).inc()
+        raise
+    finally:
+        EXTERNAL_CALL_DURATION.labels(service, operation).observe(time.perf_counter() - started)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """Keep the pool gauges current on every connection checkout and checkin"""
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return  # Pools without counters (e.g. SQLite in-memory)
+
+    def on_checkout(*_):
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    def on_checkin(*_):
+        # Fires before the connection is returned: it still counts as checked
+        # out, and if the pool is full it is about to be closed as overflow
+        overflow = pool.overflow()
+        if pool.checkedin() >= pool.size():
+            overflow -= 1
+        DB_POOL_CHECKED_OUT.set(pool.checkedout() - 1)
+        DB_POOL_OVERFLOW.set(max(overflow, 0))
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition of all metrics, aggregated across workers in multiprocess mode"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
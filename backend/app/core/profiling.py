@@ -0,0 +1,156 @@
+"""
+On-demand request profiling
+
+A sampling profiler: while a profiled request runs, a background thread
+reads the stack of every thread each PROFILING_INTERVAL_MS and counts
+identical stacks. cProfile would only see the event loop thread, while
+sync endpoints and dependencies run in the threadpool, so stacks are
+sampled from all threads instead. Threads parked in a wait (idle pool
+workers, the event loop in select) are left out.
+
+Only one request per worker is profiled at a time. Samples still cover
+the whole worker for that duration, so under load other requests' stacks
+show up too; the request's own frames are the ones under its endpoint.
+
+Profiles are kept as collapsed stacks ("a;b;c 12" per line), which
+flamegraph.pl, speedscope and inferno read directly.
+"""
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, List, Optional
+import itertools
+import sys
+import threading
+from app.core.config import settings
+
+# Modules whose frame on top of a stack means the thread is waiting, not working
+IDLE_MODULES = frozenset({"threading", "selectors", "queue"})
+MAX_STACK_DEPTH = 128
+
+
+@dataclass
+class Profile:
+    """Sampled stacks of one request"""
+    id: int
+    recorded_at: datetime
+    request: str  # "METHOD /path"
+    trigger: str  # "header" or "sample"
+    route: Optional[str] = None
+    status: Optional[int] = None
+    duration_ms: float = 0.0
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)  # Collapsed stack -> samples
+
+    def collapsed(self) -> str:
+        """Stacks in the collapsed (folded) format, heaviest first"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _collapse(frame) -> Optional[str]:
+    """Collapsed stack of a frame, root first, or None for an idle thread"""
+    if frame.f_globals.get("__name__") in IDLE_MODULES:
+        return None
+
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Background thread counting the stacks of all other threads"""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stopped.wait(self.interval_seconds):
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = _collapse(frame)
+                if stack is not None:
+                    self.stacks[stack] += 1
+            self.samples += 1
+
+
+class RequestProfiler:
+    """
+    Profiles requests one at a time and keeps the most recent ones
+
+    The middleware calls start() for a request it wants profiled and
+    finish() when the response is sent. Profiles live in a per-worker ring
+    buffer of PROFILING_BUFFER_SIZE entries.
+    """
+
+    def __init__(self):
+        self.interval_seconds = settings.PROFILING_INTERVAL_MS / 1000
+        self._profiles: Deque[Profile] = deque(maxlen=settings.PROFILING_BUFFER_SIZE)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self, request: str, trigger: str) -> Optional[tuple]:
+        """
+        Start sampling for a request
+
+        Returns:
+            (profile, sampler) to hand to finish(), or None if another
+            request is being profiled
+        """
+        with self._lock:
+            if self._running:
+                return None
+            self._running = True
+
+        profile = Profile(
+            id=next(self._ids),
+            recorded_at=datetime.now(timezone.utc),
+            request=request,
+            trigger=trigger,
+        )
+        sampler = StackSampler(self.interval_seconds)
+        sampler.start()
+        return profile, sampler
+
+    def finish(self, profile: Profile, sampler: StackSampler) -> Profile:
+        """Stop sampling and store the profile"""
+        sampler.stop()
+        profile.stacks = sampler.stacks
+        profile.samples = sampler.samples
+        with self._lock:
+            self._profiles.append(profile)
+            self._running = False
+        return profile
+
+    def profiles(self, limit: Optional[int] = None) -> List[Profile]:
+        """Stored profiles, newest first"""
+        with self._lock:
+            profiles = list(reversed(self._profiles))
+        return profiles[:limit] if limit else profiles
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+# Singleton instance
+request_profiler = RequestProfiler()
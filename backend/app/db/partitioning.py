@@ -0,0 +1,173 @@
+"""
+Monthly range partitioning for the transactions table (PostgreSQL only)
+
+The transactions table is declared PARTITION BY RANGE (transaction_date) by
+migration, with one child table per month named transactions_pYYYY_MM plus a
+transactions_default catch-all. Partitions for upcoming months are created
+ahead of time at startup (and by running this module), so inserts never land
+in the default partition in normal operation.
+"""
+from datetime import date, datetime
+from typing import Any, Iterable, List, Optional
+import logging
+import re
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "transactions"
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+PARTITION_NAME_RE = re.compile(rf"^{PARTITIONED_TABLE}_(p\d{{4}}_\d{{2}}|default)$")
+
+
+def is_partition_table(name: str) -> bool:
+    """Whether a table name is a transactions child partition"""
+    return bool(PARTITION_NAME_RE.match(name))
+
+
+def month_start(value: date, offset: int = 0) -> date:
+    """First day of the month containing value, shifted by offset months"""
+    month_index = value.year * 12 + (value.month - 1) + offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Child table name for a month"""
+    return f"{PARTITIONED_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    """Whether the transactions table is a partitioned table"""
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(connection.execute(text(
+        "SELECT 1 FROM pg_partitioned_table pt "
+        "JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+    ), {"table": PARTITIONED_TABLE}).scalar())
+
+
+def create_month_partition(connection: Connection, month: date) -> bool:
+    """
+    Create the partition for a month if it does not exist
+
+    Args:
+        connection: Database connection
+        month: Any day in the target month
+
+    Returns:
+        True if the partition was created
+    """
+    start = month_start(month)
+    end = month_start(start, 1)
+    name = partition_name(start)
+
+    exists = connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+    if exists:
+        return False
+
+    connection.execute(text(
+        f'CREATE TABLE "{name}" PARTITION OF {PARTITIONED_TABLE} '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    logger.info(f"Created partition {name}")
+    return True
+
+
+def ensure_transaction_partitions(
+    connection: Connection,
+    months_ahead: Optional[int] = None,
+    start: Optional[date] = None
+) -> List[str]:
+    """
+    Create monthly partitions from start (default: current month) through
+    months_ahead months into the future
+
+    Args:
+        connection: Database connection (caller commits)
+        months_ahead: Future months to pre-create (defaults to settings)
+        start: First month to ensure
+
+    Returns:
+        Names of the partitions that were created
+    """
+    if not is_partitioned(connection):
+        return []
+
+    if months_ahead is None:
+        months_ahead = settings.TRANSACTION_PARTITION_MONTHS_AHEAD
+
+    first = month_start(start or datetime.utcnow().date())
+    last = month_start(datetime.utcnow().date(), months_ahead)
+
+    created = []
+    month = first
+    while month <= last:
+        if create_month_partition(connection, month):
+            created.append(partition_name(month))
+        month = month_start(month, 1)
+
+    return created
+
+
+def scanned_partitions(connection: Connection, statement: Any, params: Optional[dict] = None) -> List[str]:
+    """
+    List the transactions partitions a query would scan, using EXPLAIN
+
+    Used to verify partition pruning: a query bounded by transaction_date
+    should only touch the partitions for the months in its range.
+
+    Args:
+        connection: Database connection
+        statement: SQL string or SQLAlchemy statement
+        params: Bind parameters for a SQL string
+
+    Returns:
+        Sorted partition names that appear in the plan
+    """
+    if not isinstance(statement, str):
+        statement = str(statement.compile(
+            dialect=connection.dialect,
+            compile_kwargs={"literal_binds": True}
+        ))
+
+    plan = connection.execute(text(f"EXPLAIN (FORMAT JSON) {statement}"), params or {}).scalar()
+    return sorted(set(_relation_names(plan)) & _partition_names(connection))
+
+
+def _relation_names(node: Any) -> Iterable[str]:
+    """Walk an EXPLAIN JSON plan yielding relation names"""
+    if isinstance(node, list):
+        for item in node:
+            yield from _relation_names(item)
+    elif isinstance(node, dict):
+        if "Relation Name" in node:
+            yield node["Relation Name"]
+        for value in node.values():
+            if isinstance(value, (list, dict)):
+                yield from _relation_names(value)
+
+
+def _partition_names(connection: Connection) -> set:
+    """Names of all attached transactions partitions"""
+    return set(connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table"
+    ), {"table": PARTITIONED_TABLE}).scalars())
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.db.base import engine
+
+    parser = argparse.ArgumentParser(description="Create upcoming monthly transactions partitions")
+    parser.add_argument("--months-ahead", type=int, default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        names = ensure_transaction_partitions(conn, months_ahead=args.months_ahead)
+    print(f"Created {len(names)} partitions: {', '.join(names) or '-'}")
@@ -0,0 +1,106 @@
+"""
+Per-request SQL query counting
+
+Engine cursor events feed the QueryStats of the request being handled
+(tracked in a context variable set by QueryStatsMiddleware), so every
+response can report its query count and database time. query_budget counts
+everything run on an engine while it is active, for tests:
+
+    with query_budget(4):
+        client.get("/api/v1/users/me", headers=auth_headers)
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """Queries run while handling one request"""
+    request: Optional[str] = None  # "METHOD /path"
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)  # Statement text -> executions
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed more than threshold times, most repeated first"""
+        return [(statement, n) for statement, n in self.statements.most_common() if n > threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_request_stats(request: Optional[str] = None) -> QueryStats:
+    """Begin collecting queries for the current request context"""
+    stats = QueryStats(request=request)
+    _current_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[QueryStats]:
+    """Stats of the request being handled, if any"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context so failed statements leave nothing behind
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_started)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Count and time every statement executed on engine"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def query_budget(max_queries: int, engine: Optional[Engine] = None) -> Iterator[QueryStats]:
+    """
+    Fail if more than max_queries statements run on engine inside the block
+
+    Counts statements from any thread, so it works around TestClient calls
+    whose handlers run outside the test's context.
+
+    Args:
+        max_queries: Allowed number of statements
+        engine: Engine to watch (defaults to the application engine)
+
+    Yields:
+        The collected QueryStats
+
+    Raises:
+        AssertionError: If the budget is exceeded
+    """
+    if engine is None:
+        from app.db.base import engine
+
+    stats = QueryStats()
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, 0.0)
+
+    event.listen(engine, "after_cursor_execute", count)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", count)
+
+    if stats.count > max_queries:
+        listing = "\n".join(f"  {n}x {statement}" for statement, n in stats.statements.most_common())
+        raise AssertionError(f"{stats.count} queries run, budget is {max_queries}:\n{listing}")
@@ -0,0 +1,98 @@
+"""
+Full-text search index over transactions.description/merchant_name/notes
+
+On PostgreSQL the migration adds a stored generated tsvector column,
+transactions.search_vector, with a GIN index. It is not declared on the model
+because the type and expression are PostgreSQL specific.
+
+On SQLite (local development and tests) an external-content FTS5 table,
+transactions_fts, mirrors the same three columns and is kept in sync by
+triggers. It is created by migration or, for databases built with
+create_all, at startup.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration; 'simple' avoids stemming merchant names
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_INDEX = "ix_transactions_search_vector"
+FTS_TABLE = "transactions_fts"
+
+POSTGRES_SEARCH_VECTOR = (
+    f"to_tsvector('{SEARCH_CONFIG}', "
+    "coalesce(description, '') || ' ' || coalesce(merchant_name, '') || ' ' || coalesce(notes, ''))"
+)
+
+SQLITE_FTS_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        description, merchant_name, notes,
+        content='transactions', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, description, merchant_name, notes)
+        VALUES (new.id, new.description, new.merchant_name, new.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, merchant_name, notes)
+        VALUES ('delete', old.id, old.description, old.merchant_name, old.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF description, merchant_name, notes ON transactions BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, merchant_name, notes)
+        VALUES ('delete', old.id, old.description, old.merchant_name, old.notes);
+        INSERT INTO {FTS_TABLE}(rowid, description, merchant_name, notes)
+        VALUES (new.id, new.description, new.merchant_name, new.notes);
+    END
+    """,
+)
+
+SQLITE_FTS_DROP = (
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+
+
+def is_search_table(name: str) -> bool:
+    """Whether a table name belongs to the SQLite FTS5 index"""
+    return name == FTS_TABLE or name.startswith(f"{FTS_TABLE}_")
+
+
+def has_sqlite_fts(connection: Connection) -> bool:
+    """Whether the FTS5 table exists"""
+    return bool(connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE}
+    ).scalar())
+
+
+def ensure_sqlite_fts(connection: Connection) -> bool:
+    """
+    Create the FTS5 table and triggers if missing and index existing rows
+
+    Args:
+        connection: SQLite connection (caller commits)
+
+    Returns:
+        True if the index was created
+    """
+    if connection.dialect.name != "sqlite" or has_sqlite_fts(connection):
+        return False
+
+    for statement in SQLITE_FTS_DDL:
+        connection.execute(text(statement))
+    connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    logger.info(f"Created {FTS_TABLE} search index")
+    return True
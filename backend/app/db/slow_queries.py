@@ -0,0 +1,157 @@
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, List, Optional
+import itertools
+import json
+import logging
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.db.query_stats import current_request_stats
+
+logger = logging.getLogger(__name__)
+
+# Execution option that keeps a connection's statements out of the log (set on EXPLAIN runs)
+SKIP_OPTION = "slow_query_log"
+MAX_LOGGED_PARAMETERS = 20
+MAX_PENDING_EXPLAINS = 8
+PLAN_CACHE_SIZE = 256
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Replace bound values with their type names
+
+    Statements are parameterized, so values are the user data (amounts,
+    descriptions, emails); only their shape is kept for the log.
+    """
+    if isinstance(parameters, dict):
+        items = list(parameters.items())[:MAX_LOGGED_PARAMETERS]
+        return {key: None if value is None else f"<{type(value).__name__}>" for key, value in items}
+    if isinstance(parameters, (list, tuple)):
+        return [None if value is None else f"<{type(value).__name__}>" for value in parameters[:MAX_LOGGED_PARAMETERS]]
+    return None
+
+
+@dataclass
+class SlowQuery:
+    """A statement slower than SLOW_QUERY_THRESHOLD_MS"""
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any
+    executemany: bool
+    request: Optional[str] = None
+    plan: Optional[List[str]] = field(default=None)
+
+
+class SlowQueryLog:
+    """
+    Opt-in recorder of slow statements on an engine
+
+    Statements over the threshold go to a per-worker ring buffer and to the
+    log as one JSON line. Those over the EXPLAIN threshold also get their
+    plan captured (EXPLAIN without ANALYZE, so nothing runs again) on a
+    background thread, at most once per statement text while it stays in
+    the plan cache.
+    """
+
+    def __init__(self):
+        self.threshold_seconds = settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        self.explain_threshold_seconds = settings.SLOW_QUERY_EXPLAIN_THRESHOLD_MS / 1000
+        self._entries: Deque[SlowQuery] = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+        self._plans: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._engine: Optional[Engine] = None
+
+    def install(self, engine: Engine) -> None:
+        """Start recording statements executed on engine"""
+        self._engine = engine
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def entries(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Recorded slow queries, newest first"""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - context._slow_query_started
+        if duration < self.threshold_seconds or context.execution_options.get(SKIP_OPTION) is False:
+            return
+
+        stats = current_request_stats()
+        entry = SlowQuery(
+            id=next(self._ids),
+            recorded_at=datetime.now(timezone.utc),
+            duration_ms=round(duration * 1000, 1),
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            executemany=executemany,
+            request=stats.request if stats else None,
+        )
+        with self._lock:
+            self._entries.append(entry)
+            entry.plan = self._plans.get(statement)
+
+        logger.warning(f"slow_query {json.dumps(asdict(entry), default=str)}")
+
+        if duration >= self.explain_threshold_seconds and entry.plan is None and not executemany:
+            self._schedule_explain(entry, parameters)
+
+    def _schedule_explain(self, entry: SlowQuery, parameters: Any) -> None:
+        with self._lock:
+            if self._pending >= MAX_PENDING_EXPLAINS:
+                return
+            self._pending += 1
+        self._executor.submit(self._explain, entry, parameters)
+
+    def _explain(self, entry: SlowQuery, parameters: Any) -> None:
+        """Capture the plan of a slow statement with its original parameters"""
+        try:
+            with self._engine.connect() as conn:
+                conn = conn.execution_options(**{SKIP_OPTION: False})
+                if conn.dialect.name == "postgresql":
+                    prefix = "EXPLAIN (ANALYZE false, VERBOSE false, FORMAT TEXT) "
+                elif conn.dialect.name == "sqlite":
+                    prefix = "EXPLAIN QUERY PLAN "
+                else:
+                    prefix = "EXPLAIN "
+                rows = conn.exec_driver_sql(prefix + entry.statement, parameters).fetchall()
+                conn.rollback()
+            plan = [" ".join(str(value) for value in row) for row in rows]
+        except Exception as e:
+            logger.warning(f"Could not EXPLAIN slow query {entry.id}: {str(e)}")
+            return
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        with self._lock:
+            entry.plan = plan
+            self._plans[entry.statement] = plan
+            while len(self._plans) > PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+
+        logger.warning(f"slow_query_plan {json.dumps({'id': entry.id, 'plan': plan})}")
+
+
+# Singleton instance
+slow_query_log = SlowQueryLog()
@@ -1,8 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.router import api_router
+from app.api.responses import FastJSONResponse
+from app.core.metrics import instrument_pool, render_metrics
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.query_stats import QueryStatsMiddleware
 from app.db.base import Base, engine
+from app.db.query_stats import instrument_queries
+from app.db.slow_queries import slow_query_log
+from app.db.partitioning import ensure_transaction_partitions
+from app.db.search import ensure_sqlite_fts
+from app.services.events import event_broker
 import logging
 
 # Configure logging
@@ -19,6 +30,7 @@ app = FastAPI(
     debug=settings.DEBUG,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -30,6 +42,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses for clients on slow networks
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        thread_minimum_size=settings.COMPRESSION_THREAD_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Count SQL queries per request (Server-Timing header, N+1 warnings)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        repeat_threshold=settings.QUERY_REPEAT_WARNING_THRESHOLD,
+        server_timing=settings.QUERY_STATS_SERVER_TIMING,
+    )
+    instrument_queries(engine)
+
+# Opt-in slow query recorder with EXPLAIN capture
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine)
+
+# Sampled or admin-requested profiling (X-Profile header)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, sample_rate=settings.PROFILING_SAMPLE_RATE)
+
+# Outermost, so latency includes the other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    instrument_pool(engine)
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -38,6 +82,27 @@ async def startup_event():
     logger.info(f"Environment: {settings.BELVO_ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
+    # Pre-create upcoming monthly transactions partitions (PostgreSQL only)
+    if engine.dialect.name == "postgresql":
+        try:
+            with engine.begin() as conn:
+                created = ensure_transaction_partitions(conn)
+            if created:
+                logger.info(f"Created transactions partitions: {', '.join(created)}")
+        except Exception as e:
+            logger.error(f"Failed to ensure transactions partitions: {str(e)}")
+
+    # SQLite databases built with create_all need the FTS5 search index
+    if engine.dialect.name == "sqlite":
+        try:
+            with engine.begin() as conn:
+                ensure_sqlite_fts(conn)
+        except Exception as e:
+            logger.error(f"Failed to create transactions search index: {str(e)}")
+
+    # Relay realtime events between workers when Redis fan-out is enabled
+    await event_broker.start()
+
     # Create database tables (in production, use Alembic migrations instead)
     # if settings.DEBUG:
         # logger.info("Creating database tables...")
@@ -49,6 +114,7 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event"""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await event_broker.stop()
 
 
 @app.get("/")
@@ -72,6 +138,14 @@ def health_check():
     }
 
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus metrics endpoint"""
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
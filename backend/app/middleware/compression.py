@@ -0,0 +1,230 @@
+from typing import Optional, Tuple
+import gzip
+import time
+import zlib
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import (
+    COMPRESSION_CPU_SECONDS,
+    COMPRESSION_INPUT_BYTES,
+    COMPRESSION_OUTPUT_BYTES,
+    COMPRESSION_RATIO,
+)
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+# Server-sent events must reach the client as soon as they are written
+STREAMING_TYPES = {"text/event-stream"}
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of this Content-Type is worth compressing"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in STREAMING_TYPES:
+        return False
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES or media_type.endswith("+json")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick brotli or gzip from an Accept-Encoding header
+
+    Brotli wins ties when the module is installed; codings with q=0 are
+    refused and "*" accepts either.
+
+    Args:
+        accept_encoding: Accept-Encoding request header
+
+    Returns:
+        "br", "gzip" or None for identity
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip()] = quality
+
+    wildcard = weights.get("*", 0.0)
+    candidates = [ENCODING_BROTLI, ENCODING_GZIP] if brotli is not None else [ENCODING_GZIP]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == ENCODING_BROTLI:
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, finish: bool) -> bytes:
+        if self.encoding == ENCODING_BROTLI:
+            data = self._brotli.process(chunk)
+            return data + (self._brotli.finish() if finish else self._brotli.flush())
+        data = self._zlib.compress(chunk)
+        return data + self._zlib.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, as negotiated by Accept-Encoding
+
+    Bodies sent in one piece are compressed only when they reach
+    minimum_size, and from thread_minimum_size on the work runs in a worker
+    thread so large bodies do not block the event loop. Streamed bodies
+    (exports) are compressed chunk by chunk. Responses that are already
+    encoded, not textual, or server-sent events pass through untouched.
+    Every compressed response records its size ratio and compression CPU
+    time in app.core.metrics.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        thread_minimum_size: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_minimum_size = thread_minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> Tuple[bytes, float]:
+        """Compress a whole body; returns (compressed body, CPU seconds)"""
+        started = time.thread_time()
+        if encoding == ENCODING_BROTLI:
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        return compressed, time.thread_time() - started
+
+    @staticmethod
+    def record(encoding: str, original_size: int, compressed_size: int, cpu_seconds: float) -> None:
+        """Record one compressed response in the metrics"""
+        COMPRESSION_INPUT_BYTES.labels(encoding).inc(original_size)
+        COMPRESSION_OUTPUT_BYTES.labels(encoding).inc(compressed_size)
+        COMPRESSION_CPU_SECONDS.labels(encoding).observe(cpu_seconds)
+        if original_size:
+            COMPRESSION_RATIO.labels(encoding).observe(compressed_size / original_size)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper holding the response start until the body is seen"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[_StreamCompressor] = None
+        self.original_size = 0
+        self.compressed_size = 0
+        self.cpu_seconds = 0.0
+
+    def _encoded_headers(self, content_length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+                self.passthrough = True
+                await self._send(message)
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is None and not more_body:
+            await self._send_whole(body)
+            return
+
+        if self.stream is None:
+            self.stream = _StreamCompressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            self._encoded_headers(None)
+            await self._send(self.start_message)
+
+        started = time.thread_time()
+        chunk = self.stream.compress(body, finish=not more_body)
+        self.cpu_seconds += time.thread_time() - started
+        self.original_size += len(body)
+        self.compressed_size += len(chunk)
+
+        if chunk or not more_body:
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        if not more_body:
+            self.middleware.record(self.encoding, self.original_size, self.compressed_size, self.cpu_seconds)
+
+    async def _send_whole(self, body: bytes) -> None:
+        """Body sent in a single message: compress it if large enough"""
+        if len(body) < self.middleware.minimum_size:
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        if len(body) >= self.middleware.thread_minimum_size:
+            compressed, cpu_seconds = await anyio.to_thread.run_sync(self.middleware.compress, self.encoding, body)
+        else:
+            compressed, cpu_seconds = self.middleware.compress(self.encoding, body)
+        self.middleware.record(self.encoding, len(body), len(compressed), cpu_seconds)
+
+        self._encoded_headers(len(compressed))
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": compressed})
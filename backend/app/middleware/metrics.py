@@ -0,0 +1,43 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+# Route label for requests that matched no route, so 404 scans stay one series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record request latency per route template and status, and requests in flight
+
+    The route label is the matched path template (/api/v1/accounts/{account_id})
+    rather than the raw path, which keeps label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(time.perf_counter() - started)
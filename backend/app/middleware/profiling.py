@@ -0,0 +1,89 @@
+import random
+import time
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.api.dependencies import is_admin
+from app.core.profiling import request_profiler
+from app.core.security import verify_token
+from app.db.base import SessionLocal
+from app.models.user import User
+
+# Request header asking for a profile; honoured only for admins
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """
+    Profile a sampled fraction of requests, or one request on demand
+
+    A request is profiled when an admin (see is_admin) sends "X-Profile: 1"
+    with their bearer token, or at random with probability sample_rate.
+    The response then carries X-Profile-Id, the profile to download from
+    /api/v1/admin/profiles/{id}. Other requests only pay for the header
+    scan and a random() call; only X-Profile requests look up the user.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0):
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trigger = await self._trigger(scope)
+        run = request_profiler.start(f"{scope['method']} {scope['path']}", trigger) if trigger else None
+        if run is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile, sampler = run
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                MutableHeaders(raw=message["headers"]).append("X-Profile-Id", str(profile.id))
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            profile.route = getattr(scope.get("route"), "path", None)
+            request_profiler.finish(profile, sampler)
+
+    async def _trigger(self, scope: Scope):
+        """Why this request should be profiled: "header", "sample" or None"""
+        requested = False
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value not in (b"", b"0")
+            elif name == b"authorization":
+                authorization = value
+
+        if requested and authorization and await run_in_threadpool(self._is_admin, authorization.decode("latin-1")):
+            return "header"
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    @staticmethod
+    def _is_admin(authorization: str) -> bool:
+        """Same check as get_current_admin, on the user's row rather than the token"""
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer":
+            return False
+        payload = verify_token(token, token_type="access")
+        if not payload or payload.get("sub") is None:
+            return False
+
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.id == payload["sub"]).first()
+            return user is not None and is_admin(user)
+        finally:
+            db.close()
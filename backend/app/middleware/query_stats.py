@@ -0,0 +1,48 @@
+import logging
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import HTTP_REQUEST_DB_QUERIES
+from app.db.query_stats import start_request_stats
+from app.middleware.metrics import UNMATCHED_ROUTE
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Count SQL queries per request and report them in a Server-Timing header
+
+    The header (db;dur=<ms>;desc="<n> queries") covers queries run before
+    the response starts, which is all of them except for streamed bodies.
+    A warning is logged when one statement runs more than repeat_threshold
+    times in a request, the usual sign of an N+1 loop.
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 10, server_timing: bool = True):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request_stats(f"{scope['method']} {scope['path']}")
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"')
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DB_QUERIES.labels(route).observe(stats.count)
+            for statement, executions in stats.repeated(self.repeat_threshold):
+                logger.warning(
+                    f"Statement ran {executions} times in {scope['method']} {route} "
+                    f"(possible N+1): {' '.join(statement.split())[:300]}"
+                )
@@ -6,6 +6,11 @@ from app.models.suspicious_charge import SuspiciousCharge
 from app.models.subscription import Subscription
 from app.models.automation_rule import AutomationRule
 from app.models.alert import Alert
+from app.models.alert_archive import AlertArchive
+from app.models.merchant import Merchant
+from app.models.category_rule import CategoryRule
+from app.models.sync_tombstone import SyncTombstone
+from app.models.resource_version import ResourceVersion
 
 __all__ = [
     "User",
@@ -16,4 +21,9 @@ __all__ = [
     "Subscription",
     "AutomationRule",
     "Alert",
+    "AlertArchive",
+    "Merchant",
+    "CategoryRule",
+    "SyncTombstone",
+    "ResourceVersion",
 ]
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Index, func, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Serves the undismissed-alerts listing and summary per user
+        Index("ix_alerts_user_dismissed_created", "user_id", "is_dismissed", "created_at"),
+        Index("ix_alerts_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index, func
+from app.db.base import Base
+
+
+class AlertArchive(Base):
+    """Alerts moved out of the live alerts table by the retention job"""
+    __tablename__ = "alerts_archive"
+    __table_args__ = (
+        # Delta sync reports archived alerts as deleted
+        Index("ix_alerts_archive_user_archived", "user_id", "archived_at"),
+    )
+
+    # Same ID as the original alert
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False, index=True)
+
+    # Alert details
+    alert_type = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    priority = Column(String, nullable=True)
+    category = Column(String, nullable=False)
+
+    # Related entities
+    related_transaction_id = Column(Integer, nullable=True)
+    related_subscription_id = Column(Integer, nullable=True)
+    related_account_id = Column(Integer, nullable=True)
+
+    # Status at archive time
+    is_read = Column(Boolean, nullable=True)
+    is_dismissed = Column(Boolean, nullable=True)
+    read_at = Column(DateTime(timezone=True), nullable=True)
+    dismissed_at = Column(DateTime(timezone=True), nullable=True)
+    requires_action = Column(Boolean, nullable=True)
+    action_url = Column(String, nullable=True)
+    action_taken = Column(Boolean, nullable=True)
+    action_taken_at = Column(DateTime(timezone=True), nullable=True)
+    push_sent = Column(Boolean, nullable=True)
+    email_sent = Column(Boolean, nullable=True)
+    sms_sent = Column(Boolean, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, JSON, func
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Boolean, JSON, Index, func, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class AutomationRule(Base):
     __tablename__ = "automation_rules"
+    __table_args__ = (
+        Index("ix_automation_rules_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -21,6 +24,10 @@ class AutomationRule(Base):
     # {"type": "balance_threshold", "account_id": 1, "threshold": 1000}
     # {"type": "transaction_match", "merchant": "Netflix", "amount": 199}
 
+    # Account watched by a balance_threshold trigger, denormalized from
+    # trigger_conditions so sync can look rules up by account ID
+    threshold_account_id = Column(Integer, nullable=True, index=True)
+
     # Action configuration (stored as JSON)
     action_config = Column(JSON, nullable=False)
     # Examples:
@@ -30,7 +37,7 @@ class AutomationRule(Base):
 
     # Execution settings
     is_active = Column(Boolean, default=True)
-    max_amount = Column(Float, nullable=True)  # Maximum amount for transfers/payments
+    max_amount_cents = Column(BigInteger, nullable=True)  # Maximum amount for transfers/payments (minor units)
     require_confirmation = Column(Boolean, default=True)
 
     # Execution tracking
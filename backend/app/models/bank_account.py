@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, ForeignKey, func, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class BankAccount(Base):
     __tablename__ = "bank_accounts"
+    __table_args__ = (
+        Index("ix_bank_accounts_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -19,9 +22,9 @@ class BankAccount(Base):
     institution_name = Column(String, nullable=False)
     currency = Column(String, default="MXN")
 
-    # Balance information
-    current_balance = Column(Float, default=0.0)
-    available_balance = Column(Float, default=0.0)
+    # Balance information (minor units)
+    current_balance_cents = Column(BigInteger, default=0, server_default="0", nullable=False)
+    available_balance_cents = Column(BigInteger, default=0, server_default="0", nullable=False)
 
     # Status
     is_active = Column(Boolean, default=True)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
+from app.db.base import Base
+
+
+class CategoryRule(Base):
+    """
+    Category assignment rule used by the categorization engine
+
+    User rules (user_id set) are learned from category corrections; global
+    rules (user_id NULL) are curated. A rule matches either a merchant or a
+    keyword in the transaction description.
+    """
+    __tablename__ = "category_rules"
+    __table_args__ = (
+        Index("ix_category_rules_user_merchant", "user_id", "merchant_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    # Match on one of these
+    merchant_id = Column(Integer, ForeignKey("merchants.id"), nullable=True)
+    keyword = Column(String, nullable=True)  # Lower-case word in the description
+
+    category = Column(String, nullable=False)
+    source = Column(String, nullable=False, default="user_correction")  # user_correction, curated
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
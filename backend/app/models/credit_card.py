@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Date, ForeignKey, func
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Boolean, DateTime, Date, ForeignKey, func, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class CreditCard(Base):
     __tablename__ = "credit_cards"
+    __table_args__ = (
+        Index("ix_credit_cards_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -15,16 +18,16 @@ class CreditCard(Base):
     institution_name = Column(String, nullable=False)
     card_type = Column(String, nullable=True)  # visa, mastercard, amex, etc.
 
-    # Credit information
-    credit_limit = Column(Float, nullable=False)
-    current_balance = Column(Float, default=0.0)
-    available_credit = Column(Float, nullable=False)
+    # Credit information (minor units)
+    credit_limit_cents = Column(BigInteger, nullable=False)
+    current_balance_cents = Column(BigInteger, default=0, server_default="0", nullable=False)
+    available_credit_cents = Column(BigInteger, nullable=False)
 
     # Billing information
     billing_cycle_day = Column(Integer, nullable=True)  # Day of month billing cycle closes
     payment_due_day = Column(Integer, nullable=True)  # Day of month payment is due
     next_payment_date = Column(Date, nullable=True)
-    minimum_payment = Column(Float, default=0.0)
+    minimum_payment_cents = Column(BigInteger, default=0, server_default="0", nullable=False)  # Minor units
 
     # Interest rate
     annual_interest_rate = Column(Float, nullable=True)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from app.db.base import Base
+
+
+class Merchant(Base):
+    """Canonical merchant that raw merchant names normalize to"""
+    __tablename__ = "merchants"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Display name and the normalized lookup key (see app/services/merchants.py)
+    name = Column(String, nullable=False)
+    normalized_key = Column(String, nullable=False, unique=True, index=True)
+
+    # Default category for transactions at this merchant
+    category = Column(String, nullable=True)
+
+    # Curated merchants also claim longer keys that start with their tokens,
+    # e.g. "oxxo" matches "oxxo insurgentes"
+    match_prefix = Column(Boolean, default=False, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
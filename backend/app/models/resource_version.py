@@ -0,0 +1,82 @@
+from typing import Any, Iterable, Set, Tuple
+from sqlalchemy import Column, Integer, String, event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.db.base import Base
+
+# Tables whose per-user version backs conditional GETs (see conditional_get)
+VERSIONED_TABLES = frozenset({"bank_accounts", "credit_cards", "subscriptions", "alerts", "automation_rules"})
+
+INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+class ResourceVersion(Base):
+    """
+    Change counter of one user's rows in a table
+
+    Bumped in the same database transaction as every write to a table in
+    VERSIONED_TABLES, so the version moves exactly when the change becomes
+    visible, regardless of clock resolution or transaction start times.
+    """
+    __tablename__ = "resource_versions"
+
+    user_id = Column(Integer, primary_key=True)
+    resource = Column(String, primary_key=True)  # Table name
+    version = Column(Integer, nullable=False, default=0)
+
+
+def bump_versions(session: Session, keys: Iterable[Tuple[int, str]]) -> None:
+    """
+    Increment the version of each (user_id, table name) in keys
+
+    Sorted, so concurrent transactions lock the counter rows in one order.
+    """
+    connection = session.connection()
+    insert = INSERTS[connection.dialect.name]
+    table = ResourceVersion.__table__
+    for user_id, resource in sorted(keys):
+        statement = insert(table).values(user_id=user_id, resource=resource, version=1)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.resource],
+            set_={"version": table.c.version + 1}
+        ))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed(session: Session, flush_context: Any) -> None:
+    # new/dirty/deleted still hold the flushed objects here, with user_id set
+    keys: Set[Tuple[int, str]] = set()
+    for obj in (*session.new, *session.deleted, *session.dirty):
+        resource = getattr(obj, "__tablename__", None)
+        if resource not in VERSIONED_TABLES or obj.user_id is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        keys.add((obj.user_id, resource))
+    if keys:
+        bump_versions(session, keys)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk(orm_execute_state: Any) -> None:
+    # Bulk UPDATE/DELETE bypasses the flush; find the affected users first
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = orm_execute_state.statement.table
+    if table.name not in VERSIONED_TABLES:
+        return
+
+    session = orm_execute_state.session
+    users = select(table.c.user_id).distinct()
+    if orm_execute_state.statement.whereclause is not None:
+        users = users.where(orm_execute_state.statement.whereclause)
+    parameters = orm_execute_state.parameters
+    # executemany passes a list of parameter sets
+    parameter_sets = parameters if isinstance(parameters, list) else [parameters or {}]
+    user_ids = {
+        user_id
+        for params in parameter_sets
+        for (user_id,) in session.connection().execute(users, params)
+    }
+    bump_versions(session, {(user_id, table.name) for user_id in user_ids})
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Boolean, func
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Date, ForeignKey, Boolean, func, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        Index("ix_subscriptions_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -12,10 +15,11 @@ class Subscription(Base):
     # Subscription details
     service_name = Column(String, nullable=False)
     merchant_name = Column(String, nullable=False)
+    merchant_id = Column(Integer, ForeignKey("merchants.id"), nullable=True, index=True)  # Normalized merchant
     category = Column(String, nullable=True)  # entertainment, software, utilities, etc.
 
     # Billing information
-    amount = Column(Float, nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)  # Minor units
     currency = Column(String, default="MXN")
     billing_frequency = Column(String, nullable=False)  # monthly, yearly, weekly, etc.
     billing_day = Column(Integer, nullable=True)  # Day of month for billing
@@ -1,18 +1,22 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, func
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Boolean, Text, func, Index, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class SuspiciousCharge(Base):
     __tablename__ = "suspicious_charges"
+    __table_args__ = (
+        Index("ix_suspicious_charges_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    transaction_id = Column(Integer, ForeignKey("transactions.id"), nullable=True)
+    # No FK: transactions is partitioned and its primary key is (id, transaction_date)
+    transaction_id = Column(Integer, nullable=True, index=True)
 
     # Charge details
     merchant_name = Column(String, nullable=False)
-    amount = Column(Float, nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)  # Minor units
     currency = Column(String, default="MXN")
     charge_date = Column(DateTime(timezone=True), nullable=False)
 
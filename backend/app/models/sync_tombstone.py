@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
+from app.db.base import Base
+
+
+class SyncTombstone(Base):
+    """A hard-deleted row, kept so delta sync can report the deletion"""
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_entity_deleted", "user_id", "entity", "deleted_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False)
+    entity = Column(String, nullable=False)  # /sync/changes feed name, e.g. automation_rules
+    row_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
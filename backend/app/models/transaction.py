@@ -1,10 +1,18 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, func, Text
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, UniqueConstraint, func, Text, text
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # On PostgreSQL the table is range-partitioned by transaction_date month
+    # (see app/db/partitioning.py), so unique keys must include it
+    __table_args__ = (
+        UniqueConstraint("belvo_transaction_id", "transaction_date", name="uq_transactions_belvo_id_date"),
+        Index("ix_transactions_user_date", "user_id", "transaction_date"),
+        # Delta sync (/sync/changes) reads rows by change time
+        Index("ix_transactions_user_changed", "user_id", text("coalesce(updated_at, created_at)")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -12,13 +20,15 @@ class Transaction(Base):
     credit_card_id = Column(Integer, ForeignKey("credit_cards.id"), nullable=True, index=True)
 
     # Belvo transaction ID
-    belvo_transaction_id = Column(String, unique=True, index=True, nullable=True)
+    belvo_transaction_id = Column(String, index=True, nullable=True)
 
     # Transaction details
     description = Column(String, nullable=False)
     merchant_name = Column(String, nullable=True)
+    merchant_id = Column(Integer, ForeignKey("merchants.id"), nullable=True, index=True)  # Normalized merchant
     category = Column(String, nullable=True)
-    amount = Column(Float, nullable=False)
+    category_source = Column(String, nullable=True)  # bank, rule, user
+    amount_cents = Column(BigInteger, nullable=False)  # Minor units
     currency = Column(String, default="MXN")
 
     # Transaction type
@@ -43,3 +53,4 @@ class Transaction(Base):
     user = relationship("User", back_populates="transactions")
     bank_account = relationship("BankAccount", back_populates="transactions")
     credit_card = relationship("CreditCard", back_populates="transactions")
+    merchant = relationship("Merchant")
@@ -21,6 +21,9 @@ class User(Base):
     email_notifications = Column(Boolean, default=True)
     sms_notifications = Column(Boolean, default=False)
 
+    # Unread, undismissed alerts (kept up to date by AlertService)
+    unread_alerts_count = Column(Integer, default=0, server_default="0", nullable=False)
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
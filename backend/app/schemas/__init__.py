@@ -34,6 +34,10 @@ from app.schemas.transaction import (
     TransactionUpdate,
     TransactionResponse,
     TransactionListResponse,
+    TransactionSearchHit,
+    TransactionSearchResponse,
+    TransactionImportError,
+    TransactionImportResponse,
     TransactionAnalytics,
 )
 from app.schemas.subscription import (
@@ -54,6 +58,7 @@ from app.schemas.alert import (
     AlertBase,
     AlertCreate,
     AlertUpdate,
+    AlertBulkUpdate,
     AlertResponse,
     AlertSummary,
 )
@@ -71,6 +76,14 @@ from app.schemas.belvo import (
     BelvoTransactionSync,
     BelvoSyncResponse,
 )
+from app.schemas.sync import (
+    EntityChanges,
+    SyncChangesResponse,
+)
+from app.schemas.admin import (
+    SlowQueryResponse,
+    ProfileResponse,
+)
 
 __all__ = [
     # Auth
@@ -105,6 +118,10 @@ __all__ = [
     "TransactionUpdate",
     "TransactionResponse",
     "TransactionListResponse",
+    "TransactionSearchHit",
+    "TransactionSearchResponse",
+    "TransactionImportError",
+    "TransactionImportResponse",
     "TransactionAnalytics",
     # Subscription
     "SubscriptionBase",
@@ -122,6 +139,7 @@ __all__ = [
     "AlertBase",
     "AlertCreate",
     "AlertUpdate",
+    "AlertBulkUpdate",
     "AlertResponse",
     "AlertSummary",
     # Automation Rule
@@ -136,4 +154,10 @@ __all__ = [
     "BelvoAccountSync",
     "BelvoTransactionSync",
     "BelvoSyncResponse",
+    # Sync
+    "EntityChanges",
+    "SyncChangesResponse",
+    # Admin
+    "SlowQueryResponse",
+    "ProfileResponse",
 ]
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from typing import Any, Optional
+from datetime import datetime
+
+
+class SlowQueryResponse(BaseModel):
+    """A recorded slow SQL statement"""
+    id: int
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any = None  # Values replaced by their type names
+    executemany: bool
+    request: Optional[str] = None  # "METHOD /path" that ran it
+    plan: Optional[list[str]] = None  # EXPLAIN output, once captured
+
+    class Config:
+        from_attributes = True
+
+
+class ProfileResponse(BaseModel):
+    """A profiled request; its stacks are downloaded separately"""
+    id: int
+    recorded_at: datetime
+    request: str
+    trigger: str  # "header" or "sample"
+    route: Optional[str] = None
+    status: Optional[int] = None
+    duration_ms: float
+    samples: int
+
+    class Config:
+        from_attributes = True
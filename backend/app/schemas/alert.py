@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
 from datetime import datetime
 
 
@@ -28,6 +28,12 @@ class AlertUpdate(BaseModel):
     action_taken: Optional[bool] = None
 
 
+class AlertBulkUpdate(BaseModel):
+    """Schema for applying one state change to many alerts"""
+    alert_ids: list[int] = Field(..., min_length=1, max_length=1000)
+    action: Literal["read", "dismiss", "action_taken"]
+
+
 class AlertResponse(AlertBase):
     """Schema for alert response"""
     id: int
@@ -58,4 +64,4 @@ class AlertSummary(BaseModel):
     unread_alerts: int
     critical_alerts: int
     requires_action: int
-    alerts: list[AlertResponse]
+    alerts: list[AlertResponse] = []  # Most recent alerts, capped by the summary limit
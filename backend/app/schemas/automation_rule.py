@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Any
 from datetime import datetime
+from app.schemas.money import OptionalCentsAmount
 
 
 class AutomationRuleBase(BaseModel):
@@ -37,7 +38,7 @@ class AutomationRuleResponse(AutomationRuleBase):
     trigger_conditions: dict[str, Any]
     action_config: dict[str, Any]
     is_active: bool
-    max_amount: Optional[float] = None
+    max_amount: OptionalCentsAmount = Field(None, validation_alias="max_amount_cents")
     require_confirmation: bool
     last_executed_at: Optional[datetime] = None
     execution_count: int
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.money import CentsAmount
 
 
 class BankAccountBase(BaseModel):
@@ -31,8 +32,8 @@ class BankAccountResponse(BankAccountBase):
     user_id: int
     belvo_account_id: Optional[str] = None
     account_number: Optional[str] = None
-    current_balance: float
-    available_balance: float
+    current_balance: CentsAmount = Field(validation_alias="current_balance_cents")
+    available_balance: CentsAmount = Field(validation_alias="available_balance_cents")
     is_active: bool
     is_primary: bool
     created_at: datetime
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime, date
+from app.schemas.money import CentsAmount
 
 
 class CreditCardBase(BaseModel):
@@ -31,16 +32,17 @@ class CreditCardUpdate(BaseModel):
 
 class CreditCardResponse(CreditCardBase):
     """Schema for credit card response"""
+    credit_limit: CentsAmount = Field(validation_alias="credit_limit_cents")
     id: int
     user_id: int
     last_four_digits: str
     card_type: Optional[str] = None
-    current_balance: float
-    available_credit: float
+    current_balance: CentsAmount = Field(validation_alias="current_balance_cents")
+    available_credit: CentsAmount = Field(validation_alias="available_credit_cents")
     billing_cycle_day: Optional[int] = None
     payment_due_day: Optional[int] = None
     next_payment_date: Optional[date] = None
-    minimum_payment: float
+    minimum_payment: CentsAmount = Field(validation_alias="minimum_payment_cents")
     annual_interest_rate: Optional[float] = None
     is_active: bool
     created_at: datetime
@@ -0,0 +1,49 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Annotated, Optional, Union
+from pydantic import BeforeValidator
+
+# Amounts are stored as BIGINT minor units (centavos); the API speaks major units
+CENTS_PER_UNIT = 100
+
+
+def to_cents(amount: Optional[Union[float, int, str, Decimal]]) -> Optional[int]:
+    """
+    Convert a major-unit amount to integer minor units
+
+    Args:
+        amount: Amount in major units (e.g. 199.99)
+
+    Returns:
+        Amount in minor units (e.g. 19999), rounded half-up
+    """
+    if amount is None:
+        return None
+    return int((Decimal(str(amount)) * CENTS_PER_UNIT).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: Optional[int]) -> Optional[float]:
+    """
+    Convert integer minor units to a major-unit amount
+
+    Args:
+        cents: Amount in minor units
+
+    Returns:
+        Amount in major units
+    """
+    if cents is None:
+        return None
+    return float(Decimal(int(cents)) / CENTS_PER_UNIT)
+
+
+def _cents_to_amount(value):
+    """Validator: ORM minor units -> API major units"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return from_cents(value)
+    return value
+
+
+# Response field populated from a *_cents ORM attribute, e.g.
+#     amount: CentsAmount = Field(validation_alias="amount_cents")
+CentsAmount = Annotated[float, BeforeValidator(_cents_to_amount)]
+OptionalCentsAmount = Annotated[Optional[float], BeforeValidator(_cents_to_amount)]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime, date
+from app.schemas.money import CentsAmount
 
 
 class SubscriptionBase(BaseModel):
@@ -35,8 +36,10 @@ class SubscriptionUpdate(BaseModel):
 
 class SubscriptionResponse(SubscriptionBase):
     """Schema for subscription response"""
+    amount: CentsAmount = Field(validation_alias="amount_cents")
     id: int
     user_id: int
+    merchant_id: Optional[int] = None
     category: Optional[str] = None
     currency: str
     billing_day: Optional[int] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.money import CentsAmount
 
 
 class SuspiciousChargeBase(BaseModel):
@@ -27,6 +28,7 @@ class SuspiciousChargeUpdate(BaseModel):
 
 class SuspiciousChargeResponse(SuspiciousChargeBase):
     """Schema for suspicious charge response"""
+    amount: CentsAmount = Field(validation_alias="amount_cents")
     id: int
     user_id: int
     transaction_id: Optional[int] = None
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Generic, TypeVar
+from app.schemas.alert import AlertResponse
+from app.schemas.automation_rule import AutomationRuleResponse
+from app.schemas.bank_account import BankAccountResponse
+from app.schemas.credit_card import CreditCardResponse
+from app.schemas.subscription import SubscriptionResponse
+from app.schemas.suspicious_charge import SuspiciousChargeResponse
+from app.schemas.transaction import TransactionResponse
+
+T = TypeVar("T")
+
+
+class EntityChanges(BaseModel, Generic[T]):
+    """Changed rows of one entity type"""
+    upserted: list[T] = []
+    deleted: list[int] = []
+
+
+class SyncChangesResponse(BaseModel):
+    """Delta sync response; pass token back as since"""
+    token: str
+    has_more: bool
+    accounts: EntityChanges[BankAccountResponse]
+    cards: EntityChanges[CreditCardResponse]
+    subscriptions: EntityChanges[SubscriptionResponse]
+    alerts: EntityChanges[AlertResponse]
+    suspicious_charges: EntityChanges[SuspiciousChargeResponse]
+    transactions: EntityChanges[TransactionResponse]
+    automation_rules: EntityChanges[AutomationRuleResponse]
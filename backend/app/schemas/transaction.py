@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.money import CentsAmount
 
 
 class TransactionBase(BaseModel):
@@ -28,12 +29,15 @@ class TransactionUpdate(BaseModel):
 
 class TransactionResponse(TransactionBase):
     """Schema for transaction response"""
+    amount: CentsAmount = Field(validation_alias="amount_cents")
     id: int
     user_id: int
     bank_account_id: Optional[int] = None
     credit_card_id: Optional[int] = None
     belvo_transaction_id: Optional[str] = None
     merchant_name: Optional[str] = None
+    merchant_id: Optional[int] = None
+    category_source: Optional[str] = None  # bank, rule, user
     currency: str
     reference: Optional[str] = None
     notes: Optional[str] = None
@@ -54,6 +58,33 @@ class TransactionListResponse(BaseModel):
     transactions: list[TransactionResponse]
 
 
+class TransactionSearchHit(TransactionResponse):
+    """Transaction search result with its relevance rank"""
+    rank: float = 0.0
+
+
+class TransactionSearchResponse(BaseModel):
+    """Cursor-paginated transaction search response"""
+    query: str
+    sort: str
+    transactions: list[TransactionSearchHit]
+    next_cursor: Optional[str] = None
+
+
+class TransactionImportError(BaseModel):
+    """A row rejected by a bulk import"""
+    row: int
+    error: str
+
+
+class TransactionImportResponse(BaseModel):
+    """Bulk import result"""
+    total_rows: int
+    imported: int
+    failed: int
+    errors: list[TransactionImportError]
+
+
 class TransactionAnalytics(BaseModel):
     """Transaction analytics summary"""
     total_income: float
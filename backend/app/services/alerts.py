@@ -0,0 +1,220 @@
+from datetime import datetime
+from typing import Dict, List
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+from app.models.alert import Alert
+from app.models.user import User
+from app.schemas.alert import AlertResponse
+from app.services.events import event_broker
+
+
+class AlertService:
+    """Service for alert bookkeeping and realtime notifications"""
+
+    @staticmethod
+    def is_unread(alert: Alert) -> bool:
+        """
+        Whether an alert counts towards the user's unread counter
+
+        A NULL is_read counts as unread, here and in every query below
+        (is_read IS NOT TRUE), so the counter and the alerts table agree.
+        """
+        return not alert.is_read and not alert.is_dismissed
+
+    def count_unread(self, db: Session, user_id: int) -> int:
+        """
+        Get the user's unread alert counter (no scan of the alerts table)
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Number of unread alerts
+        """
+        return db.query(User.unread_alerts_count).filter(User.id == user_id).scalar() or 0
+
+    def adjust_unread_count(self, db: Session, user_id: int, delta: int) -> None:
+        """
+        Atomically add delta to the user's unread alert counter
+
+        Args:
+            db: Database session (caller commits)
+            user_id: User ID
+            delta: Change in unread alerts
+        """
+        if not delta:
+            return
+        db.query(User).filter(User.id == user_id).update(
+            {User.unread_alerts_count: User.unread_alerts_count + delta},
+            synchronize_session=False
+        )
+
+    def recount_unread(self, db: Session, user_id: int) -> int:
+        """
+        Rebuild the user's unread counter from the alerts table
+
+        Args:
+            db: Database session (caller commits)
+            user_id: User ID
+
+        Returns:
+            Recounted number of unread alerts
+        """
+        count = db.query(func.count(Alert.id)).filter(
+            Alert.user_id == user_id,
+            Alert.is_read.isnot(True),
+            Alert.is_dismissed == False
+        ).scalar() or 0
+        db.query(User).filter(User.id == user_id).update(
+            {User.unread_alerts_count: count},
+            synchronize_session=False
+        )
+        return count
+
+    def get_summary_counts(self, db: Session, user_id: int) -> Dict[str, int]:
+        """
+        Compute alert summary counts with a single conditional aggregate
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Total, unread, critical and action-required counts
+        """
+        row = db.query(
+            func.count(Alert.id),
+            func.sum(case((Alert.is_read.isnot(True), 1), else_=0)),
+            func.sum(case((Alert.priority == "critical", 1), else_=0)),
+            func.sum(case(((Alert.requires_action == True) & Alert.action_taken.isnot(True), 1), else_=0)),
+        ).filter(
+            Alert.user_id == user_id,
+            Alert.is_dismissed == False
+        ).one()
+
+        return {
+            "total_alerts": row[0] or 0,
+            "unread_alerts": row[1] or 0,
+            "critical_alerts": row[2] or 0,
+            "requires_action": row[3] or 0,
+        }
+
+    def mark_all_read(self, db: Session, user_id: int) -> int:
+        """
+        Mark every unread alert as read with a single UPDATE
+
+        Args:
+            db: Database session (caller commits)
+            user_id: User ID
+
+        Returns:
+            Number of alerts marked as read
+        """
+        count = db.query(Alert).filter(
+            Alert.user_id == user_id,
+            Alert.is_read.isnot(True),
+            Alert.is_dismissed == False
+        ).update(
+            {Alert.is_read: True, Alert.read_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        self.adjust_unread_count(db, user_id, -count)
+        return count
+
+    def bulk_update(self, db: Session, user_id: int, alert_ids: List[int], action: str) -> int:
+        """
+        Apply a state change to a list of alerts with a single UPDATE
+
+        Only alerts that actually change state are touched, so the returned
+        count and the unread counter adjustment are exact.
+
+        Args:
+            db: Database session (caller commits)
+            user_id: User ID (alerts of other users are ignored)
+            alert_ids: Alerts to update
+            action: read, dismiss or action_taken
+
+        Returns:
+            Number of alerts updated
+        """
+        now = datetime.utcnow()
+        owned = (Alert.user_id == user_id) & Alert.id.in_(alert_ids)
+
+        if action == "read":
+            count = db.query(Alert).filter(
+                owned,
+                Alert.is_read.isnot(True),
+                Alert.is_dismissed == False
+            ).update({Alert.is_read: True, Alert.read_at: now}, synchronize_session=False)
+            self.adjust_unread_count(db, user_id, -count)
+            return count
+
+        if action == "dismiss":
+            # RETURNING tells us how many of the dismissed alerts were unread
+            was_read = db.execute(
+                update(Alert)
+                .where(owned, Alert.is_dismissed == False)
+                .values(is_dismissed=True, dismissed_at=now)
+                .returning(Alert.is_read)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            self.adjust_unread_count(db, user_id, -sum(1 for is_read in was_read if not is_read))
+            return len(was_read)
+
+        if action == "action_taken":
+            return db.query(Alert).filter(
+                owned,
+                Alert.action_taken.isnot(True)
+            ).update({Alert.action_taken: True, Alert.action_taken_at: now}, synchronize_session=False)
+
+        raise ValueError(f"Unsupported bulk alert action: {action}")
+
+    def publish_created(self, alert: Alert) -> None:
+        """Push a newly committed alert to the user's event stream"""
+        if not event_broker.has_listeners(alert.user_id):
+            return
+        event_broker.publish(
+            alert.user_id,
+            "alert",
+            AlertResponse.model_validate(alert).model_dump(mode="json")
+        )
+
+    def publish_unread_count(self, db: Session, user_id: int) -> None:
+        """Push the user's current unread count to their event stream"""
+        if not event_broker.has_listeners(user_id):
+            return
+        event_broker.publish(
+            user_id,
+            "unread_count",
+            {"unread_alerts": self.count_unread(db, user_id)}
+        )
+
+
+# Singleton instance
+alert_service = AlertService()
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.db.base import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild unread alert counters from the alerts table")
+    parser.add_argument("--user-id", type=int, help="Only this user (default: every user)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id:
+            user_ids = [args.user_id]
+        else:
+            user_ids = [user_id for (user_id,) in db.query(User.id).order_by(User.id)]
+        corrected = 0
+        for user_id in user_ids:
+            before = alert_service.count_unread(db, user_id)
+            if alert_service.recount_unread(db, user_id) != before:
+                corrected += 1
+            db.commit()
+        print(f"Recounted {len(user_ids)} users, corrected {corrected}")
+    finally:
+        db.close()
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from app.models.alert import Alert
+from app.models.automation_rule import AutomationRule
+from app.services.alerts import alert_service
+from app.schemas.money import to_cents, from_cents
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of account IDs bound into a single IN (...) clause
+RULE_LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class BalanceChange:
+    """Balance change event emitted by account sync (amounts in cents)"""
+    account_id: int
+    user_id: int
+    old_balance_cents: int
+    new_balance_cents: int
+
+
+def threshold_account_id_for(trigger_conditions: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    Extract the watched account ID from balance_threshold trigger conditions
+
+    Args:
+        trigger_conditions: Rule trigger conditions
+
+    Returns:
+        Account ID for balance_threshold triggers, None otherwise
+    """
+    if not trigger_conditions or trigger_conditions.get("type") != "balance_threshold":
+        return None
+
+    try:
+        return int(trigger_conditions["account_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class AutomationService:
+    """Service for evaluating automation rules against data changes"""
+
+    def evaluate_balance_changes(
+        self,
+        db: Session,
+        changes: Iterable[BalanceChange]
+    ) -> List[AutomationRule]:
+        """
+        Evaluate balance_threshold rules for accounts whose balance changed
+
+        Only active rules registered for the changed accounts are loaded, so
+        a sync without balance changes does no rule work at all.
+
+        Args:
+            db: Database session (caller commits)
+            changes: Balance change events from sync
+
+        Returns:
+            Rules that fired
+        """
+        changes_by_account = {change.account_id: change for change in changes}
+        if not changes_by_account:
+            return []
+
+        account_ids = list(changes_by_account)
+        fired = []
+
+        for start in range(0, len(account_ids), RULE_LOOKUP_CHUNK_SIZE):
+            chunk = account_ids[start:start + RULE_LOOKUP_CHUNK_SIZE]
+            rules = db.query(AutomationRule).filter(
+                AutomationRule.threshold_account_id.in_(chunk),
+                AutomationRule.is_active == True
+            ).all()
+
+            for rule in rules:
+                change = changes_by_account[rule.threshold_account_id]
+                if rule.user_id != change.user_id:
+                    continue
+                if self._crosses_threshold(rule.trigger_conditions, change):
+                    self._fire(db, rule, change)
+                    fired.append(rule)
+
+        if fired:
+            logger.info(f"Fired {len(fired)} balance threshold rules for {len(account_ids)} changed accounts")
+
+        return fired
+
+    @staticmethod
+    def _crosses_threshold(trigger_conditions: Dict[str, Any], change: BalanceChange) -> bool:
+        """Check whether a balance change crosses the rule threshold"""
+        try:
+            # Thresholds are configured in major units
+            threshold = to_cents(float(trigger_conditions["threshold"]))
+        except (KeyError, TypeError, ValueError, ArithmeticError):
+            return False
+
+        if trigger_conditions.get("direction", "below") == "above":
+            return change.old_balance_cents <= threshold < change.new_balance_cents
+
+        return change.new_balance_cents < threshold <= change.old_balance_cents
+
+    @staticmethod
+    def _fire(db: Session, rule: AutomationRule, change: BalanceChange) -> None:
+        """Record a rule execution and notify the user"""
+        action_config = rule.action_config or {}
+        message = action_config.get("message") or (
+            f"El saldo de tu cuenta cambió de ${from_cents(change.old_balance_cents):,.2f} "
+            f"a ${from_cents(change.new_balance_cents):,.2f}"
+        )
+
+        db.add(Alert(
+            user_id=rule.user_id,
+            alert_type="balance_threshold",
+            title=rule.rule_name,
+            message=message,
+            priority="high",
+            category="budget",
+            related_account_id=change.account_id,
+            requires_action=action_config.get("type") != "send_alert" and bool(rule.require_confirmation),
+            is_read=False,
+            is_dismissed=False
+        ))
+        alert_service.adjust_unread_count(db, rule.user_id, 1)
+
+        rule.last_executed_at = datetime.utcnow()
+        rule.execution_count = (rule.execution_count or 0) + 1
+
+
+# Singleton instance
+automation_service = AutomationService()
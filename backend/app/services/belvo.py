@@ -1,6 +1,7 @@
 from belvo.client import Client
 from belvo.exceptions import BelvoAPIException
 from app.core.config import settings
+from app.core.metrics import track_external_call
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
@@ -63,8 +64,10 @@ class BelvoService:
             if token:
                 link_data["token"] = token
 
+            # Error responses raise instead of coming back as the result
             # Belvo API returns a list, even when creating a single link
-            links = self.client.Links.create(**link_data)
+            with track_external_call("belvo", "links.create"):
+                links = self.client.Links.create(**link_data, raise_exception=True)
             link = links[0] if isinstance(links, list) and len(links) > 0 else links
             logger.info(f"Created Belvo link: {link['id']}")
             return link
@@ -84,7 +87,8 @@ class BelvoService:
             Link data from Belvo
         """
         try:
-            link = self.client.Links.get(link_id)
+            with track_external_call("belvo", "links.get"):
+                link = self.client.Links.get(link_id)
             return link
         except BelvoAPIException as e:
             logger.error(f"Failed to get Belvo link {link_id}: {str(e)}")
@@ -101,7 +105,8 @@ class BelvoService:
             True if successful
         """
         try:
-            self.client.Links.delete(link_id)
+            with track_external_call("belvo", "links.delete"):
+                self.client.Links.delete(link_id)
             logger.info(f"Deleted Belvo link: {link_id}")
             return True
         except BelvoAPIException as e:
@@ -119,7 +124,8 @@ class BelvoService:
             List of account data from Belvo
         """
         try:
-            accounts = self.client.Accounts.create(link=link_id)
+            with track_external_call("belvo", "accounts.create"):
+                accounts = self.client.Accounts.create(link=link_id, raise_exception=True)
             logger.info(f"Retrieved {len(accounts)} accounts for link {link_id}")
             return accounts
         except BelvoAPIException as e:
@@ -150,29 +156,36 @@ class BelvoService:
             if not date_to:
                 date_to = datetime.now().strftime("%Y-%m-%d")
 
-            transactions = self.client.Transactions.create(
-                link=link_id,
-                date_from=date_from,
-                date_to=date_to
-            )
+            with track_external_call("belvo", "transactions.create"):
+                transactions = self.client.Transactions.create(
+                    link=link_id,
+                    date_from=date_from,
+                    date_to=date_to,
+                    raise_exception=True
+                )
             logger.info(f"Retrieved {len(transactions)} transactions for link {link_id}")
             return transactions
         except BelvoAPIException as e:
             logger.error(f"Failed to get transactions for link {link_id}: {str(e)}")
             raise
 
-    def get_balances(self, link_id: str) -> List[Dict[str, Any]]:
+    def get_balances(self, link_id: str, date_from: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieve account balances for a link
 
         Args:
             link_id: Belvo link ID
+            date_from: First balance date in YYYY-MM-DD format (defaults to today)
 
         Returns:
             List of balance data from Belvo
         """
         try:
-            balances = self.client.Balances.create(link=link_id)
+            if not date_from:
+                date_from = datetime.now().strftime("%Y-%m-%d")
+
+            with track_external_call("belvo", "balances.create"):
+                balances = self.client.Balances.create(link=link_id, date_from=date_from, raise_exception=True)
             logger.info(f"Retrieved balances for link {link_id}")
             return balances
         except BelvoAPIException as e:
@@ -190,7 +203,8 @@ class BelvoService:
             List of owner data from Belvo
         """
         try:
-            owners = self.client.Owners.create(link=link_id)
+            with track_external_call("belvo", "owners.create"):
+                owners = self.client.Owners.create(link=link_id, raise_exception=True)
             logger.info(f"Retrieved owners for link {link_id}")
             return owners
         except BelvoAPIException as e:
@@ -208,9 +222,11 @@ class BelvoService:
             List of available institutions
         """
         try:
-            institutions = self.client.Institutions.list()
-            # Filter by country if needed
-            filtered = [inst for inst in institutions if inst.get("country") == country_code]
+            # Pages are fetched while the results are iterated
+            with track_external_call("belvo", "institutions.list"):
+                institutions = self.client.Institutions.list()
+                # Filter by country if needed
+                filtered = [inst for inst in institutions if inst.get("country") == country_code]
             logger.info(f"Retrieved {len(filtered)} institutions for {country_code}")
             return filtered
         except BelvoAPIException as e:
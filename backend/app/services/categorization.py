@@ -0,0 +1,381 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Pattern, Tuple
+import operator
+import logging
+import re
+import threading
+import time
+from sqlalchemy import and_, bindparam, or_, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.category_rule import CategoryRule
+from app.models.merchant import Merchant
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Transaction.category_source values
+SOURCE_BANK = "bank"
+SOURCE_RULE = "rule"
+SOURCE_USER = "user"
+
+
+@dataclass
+class CompiledRules:
+    """Lookup structure for one rule scope (a user, or global)"""
+    by_merchant: Dict[int, str] = field(default_factory=dict)
+    by_keyword: Dict[str, str] = field(default_factory=dict)
+    keyword_re: Optional[Pattern] = None
+    built_at: float = field(default_factory=time.monotonic)
+
+    def match(self, merchant_id: Optional[int], description: Optional[str]) -> Optional[str]:
+        """Category for a transaction, merchant rules first, then keywords"""
+        if merchant_id is not None:
+            category = self.by_merchant.get(merchant_id)
+            if category:
+                return category
+
+        if self.keyword_re is not None and description:
+            found = self.keyword_re.search(description.lower())
+            if found:
+                return self.by_keyword[found.group(1)]
+
+        return None
+
+
+def compile_rules(
+    merchant_rules: Iterable[Tuple[int, str]],
+    keyword_rules: Iterable[Tuple[str, str]]
+) -> CompiledRules:
+    """
+    Compile rules into dict lookups plus one keyword alternation regex
+
+    Later rules win over earlier ones for the same merchant or keyword.
+
+    Args:
+        merchant_rules: (merchant_id, category) pairs
+        keyword_rules: (keyword, category) pairs
+
+    Returns:
+        Compiled rules
+    """
+    compiled = CompiledRules(by_merchant=dict(merchant_rules))
+    compiled.by_keyword = {keyword.lower(): category for keyword, category in keyword_rules if keyword}
+
+    if compiled.by_keyword:
+        # Longest first so "uber eats" beats "uber"
+        alternation = "|".join(re.escape(k) for k in sorted(compiled.by_keyword, key=len, reverse=True))
+        compiled.keyword_re = re.compile(rf"\b({alternation})\b")
+
+    return compiled
+
+
+class CategorizationService:
+    """
+    Assigns transaction categories from compiled rules
+
+    Precedence: the user's own rules (learned from their corrections), then
+    global rules (merchant default categories, overridden by curated rules),
+    then the bank's category. Compiled rule sets are cached per worker and
+    rebuilt after CATEGORIZATION_CACHE_SECONDS; user sets live in an LRU and
+    are dropped immediately when the user corrects a category.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global: Optional[CompiledRules] = None
+        self._users: "OrderedDict[int, CompiledRules]" = OrderedDict()
+
+    @staticmethod
+    def _is_stale(rules: Optional[CompiledRules]) -> bool:
+        return rules is None or time.monotonic() - rules.built_at > settings.CATEGORIZATION_CACHE_SECONDS
+
+    def global_rules(self, db: Session) -> CompiledRules:
+        """Compiled global rules (merchant defaults + curated rules)"""
+        rules = self._global
+        if not self._is_stale(rules):
+            return rules
+
+        merchant_rules = list(db.query(Merchant.id, Merchant.category).filter(Merchant.category.isnot(None)))
+        curated = db.query(CategoryRule.merchant_id, CategoryRule.keyword, CategoryRule.category).filter(
+            CategoryRule.user_id.is_(None)
+        ).order_by(CategoryRule.id).all()
+
+        rules = compile_rules(
+            merchant_rules + [(m, c) for m, _, c in curated if m is not None],
+            [(k, c) for _, k, c in curated if k]
+        )
+        self._global = rules
+        return rules
+
+    def user_rules(self, db: Session, user_id: int) -> CompiledRules:
+        """Compiled rules learned for one user"""
+        with self._lock:
+            rules = self._users.get(user_id)
+            if rules is not None:
+                self._users.move_to_end(user_id)
+        if not self._is_stale(rules):
+            return rules
+
+        rows = db.query(CategoryRule.merchant_id, CategoryRule.keyword, CategoryRule.category).filter(
+            CategoryRule.user_id == user_id
+        ).order_by(CategoryRule.id).all()
+        rules = compile_rules(
+            [(m, c) for m, _, c in rows if m is not None],
+            [(k, c) for _, k, c in rows if k]
+        )
+
+        with self._lock:
+            self._users[user_id] = rules
+            self._users.move_to_end(user_id)
+            while len(self._users) > settings.CATEGORIZATION_USER_CACHE_SIZE:
+                self._users.popitem(last=False)
+        return rules
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop cached rules for a user, or everything when user_id is None"""
+        with self._lock:
+            if user_id is None:
+                self._global = None
+                self._users.clear()
+            else:
+                self._users.pop(user_id, None)
+
+    def categorize(
+        self,
+        db: Session,
+        user_id: int,
+        merchant_id: Optional[int],
+        description: Optional[str]
+    ) -> Optional[str]:
+        """
+        Category the rules assign to a transaction
+
+        Args:
+            db: Database session
+            user_id: Owner of the transaction
+            merchant_id: Normalized merchant ID
+            description: Transaction description
+
+        Returns:
+            Category, or None if no rule matches
+        """
+        return (
+            self.user_rules(db, user_id).match(merchant_id, description)
+            or self.global_rules(db).match(merchant_id, description)
+        )
+
+    def _assign(
+        self,
+        db: Session,
+        user_id: int,
+        items: Iterable[Any],
+        get: Callable[[Any, str], Any],
+        set_: Callable[[Any, str, Any], None]
+    ) -> int:
+        """Match loop shared by assign (ORM objects) and assign_rows (dicts)"""
+        user = self.user_rules(db, user_id)
+        global_ = self.global_rules(db)
+
+        assigned = 0
+        for item in items:
+            if get(item, "category_source") == SOURCE_USER:
+                continue
+
+            merchant_id, description = get(item, "merchant_id"), get(item, "description")
+            category = user.match(merchant_id, description) or global_.match(merchant_id, description)
+            if category:
+                set_(item, "category", category)
+                set_(item, "category_source", SOURCE_RULE)
+                assigned += 1
+            elif get(item, "category"):
+                set_(item, "category_source", SOURCE_BANK)
+
+        return assigned
+
+    def assign(self, db: Session, user_id: int, transactions: Iterable[Transaction]) -> int:
+        """
+        Set category and category_source on new or pending transactions
+
+        Rules are compiled once for the whole batch. Transactions the user
+        categorized by hand are left alone.
+
+        Args:
+            db: Database session
+            user_id: Owner of the transactions
+            transactions: Transactions to categorize (not yet flushed is fine)
+
+        Returns:
+            Number of transactions categorized by a rule
+        """
+        return self._assign(db, user_id, transactions, getattr, setattr)
+
+    def assign_rows(self, db: Session, user_id: int, rows: Iterable[dict]) -> int:
+        """
+        Same as assign, for plain insert-parameter dicts
+
+        Used by bulk paths that insert with Core statements instead of ORM
+        objects. Rows need merchant_id, description, category and
+        category_source keys.
+
+        Args:
+            db: Database session
+            user_id: Owner of the rows
+            rows: Row dicts, updated in place
+
+        Returns:
+            Number of rows categorized by a rule
+        """
+        return self._assign(db, user_id, rows, operator.getitem, operator.setitem)
+
+    def learn(self, db: Session, user_id: int, merchant_id: Optional[int], category: str) -> Optional[CategoryRule]:
+        """
+        Record a user's category correction as a merchant rule
+
+        Args:
+            db: Database session (caller commits)
+            user_id: User ID
+            merchant_id: Merchant of the corrected transaction
+            category: Category the user chose
+
+        Returns:
+            The created or updated rule, or None without a merchant
+        """
+        if merchant_id is None:
+            return None
+
+        rule = db.query(CategoryRule).filter(
+            CategoryRule.user_id == user_id,
+            CategoryRule.merchant_id == merchant_id,
+            CategoryRule.keyword.is_(None)
+        ).first()
+
+        if rule:
+            rule.category = category
+        else:
+            rule = CategoryRule(
+                user_id=user_id,
+                merchant_id=merchant_id,
+                category=category,
+                source="user_correction"
+            )
+            db.add(rule)
+
+        self.invalidate(user_id)
+        return rule
+
+    def recategorize_history(
+        self,
+        db: Session,
+        user_id: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Re-apply current rules to existing transactions in id-ordered chunks
+
+        Each chunk reads only the columns the rules need, writes the rows
+        whose category changed with one executemany UPDATE, and commits.
+        Rows the user categorized by hand are skipped.
+
+        Args:
+            db: Database session
+            user_id: Limit to one user (all users when None)
+            batch_size: Rows per chunk (defaults to settings)
+
+        Returns:
+            Counts of scanned and updated rows and chunks
+        """
+        batch_size = batch_size or settings.CATEGORIZATION_BATCH_SIZE
+        report = {"scanned": 0, "updated": 0, "chunks": 0}
+        table = Transaction.__table__
+        statement = (
+            update(table)
+            # transaction_date lets PostgreSQL prune to one partition per row
+            .where(and_(
+                table.c.id == bindparam("row_id"),
+                table.c.transaction_date == bindparam("row_date", type_=table.c.transaction_date.type)
+            ))
+            .values(category=bindparam("new_category"), category_source=SOURCE_RULE)
+        )
+
+        last_id = 0
+        while True:
+            query = db.query(
+                Transaction.id,
+                Transaction.transaction_date,
+                Transaction.user_id,
+                Transaction.merchant_id,
+                Transaction.description,
+                Transaction.category
+            ).filter(
+                Transaction.id > last_id,
+                or_(Transaction.category_source.is_(None), Transaction.category_source != SOURCE_USER)
+            )
+            if user_id is not None:
+                query = query.filter(Transaction.user_id == user_id)
+
+            rows = query.order_by(Transaction.id).limit(batch_size).all()
+            if not rows:
+                break
+
+            params = []
+            for row_id, row_date, row_user_id, merchant_id, description, current in rows:
+                category = self.categorize(db, row_user_id, merchant_id, description)
+                if category and category != current:
+                    params.append({"row_id": row_id, "row_date": row_date, "new_category": category})
+
+            if params:
+                db.execute(statement, params)
+            db.commit()
+
+            last_id = rows[-1][0]
+            report["scanned"] += len(rows)
+            report["updated"] += len(params)
+            report["chunks"] += 1
+
+        logger.info(f"Recategorized transactions: {report}")
+        return report
+
+    def recategorize_user(self, session_factory: Callable[[], Session], user_id: int) -> None:
+        """
+        Recategorize one user's history on a session of its own
+
+        Meant for BackgroundTasks, which run after the request's session is
+        closed. Failures are logged; chunks already committed stay applied
+        and a rerun finishes the rest.
+
+        Args:
+            session_factory: Creates the job's session (e.g. SessionLocal)
+            user_id: User ID
+        """
+        db = session_factory()
+        try:
+            self.recategorize_history(db, user_id=user_id)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Recategorization failed for user {user_id}: {str(e)}")
+        finally:
+            db.close()
+
+
+# Singleton instance
+categorization_service = CategorizationService()
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    from app.db.base import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Re-apply categorization rules to existing transactions")
+    parser.add_argument("--user-id", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=settings.CATEGORIZATION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = categorization_service.recategorize_history(db, user_id=args.user_id, batch_size=args.batch_size)
+        print(json.dumps(result, indent=2))
+    finally:
+        db.close()
@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import base64
+import json
+import logging
+from sqlalchemy import String, and_, func, literal, or_
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.alert import Alert
+from app.models.alert_archive import AlertArchive
+from app.models.automation_rule import AutomationRule
+from app.models.bank_account import BankAccount
+from app.models.credit_card import CreditCard
+from app.models.subscription import Subscription
+from app.models.suspicious_charge import SuspiciousCharge
+from app.models.sync_tombstone import SyncTombstone
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Token cursor for alerts removed by the retention job
+ARCHIVE_CURSOR = "alerts_archive"
+
+Cursor = Tuple[datetime, int]
+
+
+@dataclass(frozen=True)
+class ChangeFeed:
+    """A per-user table exposed through /sync/changes"""
+    name: str
+    model: Any
+    # Soft-deleted rows are reported by ID instead of in full
+    is_deleted: Optional[Callable[[Any], bool]] = None
+    # Hard deletes leave a SyncTombstone (entity = name) to report
+    tombstones: bool = False
+
+
+CHANGE_FEEDS = (
+    ChangeFeed("accounts", BankAccount, lambda account: account.is_active is False),
+    ChangeFeed("cards", CreditCard, lambda card: card.is_active is False),
+    ChangeFeed("subscriptions", Subscription, lambda subscription: subscription.is_active is False),
+    ChangeFeed("alerts", Alert, lambda alert: bool(alert.is_dismissed)),
+    ChangeFeed("suspicious_charges", SuspiciousCharge),
+    ChangeFeed("transactions", Transaction),
+    ChangeFeed("automation_rules", AutomationRule, tombstones=True),
+)
+
+
+def changed_at(model) -> Any:
+    """Change time of a row; matches the ix_<table>_user_changed indexes"""
+    return func.coalesce(model.updated_at, model.created_at)
+
+
+class ChangeFeedService:
+    """
+    Delta sync of a user's rows since an opaque token
+
+    The token holds a (change time, id) keyset cursor per table. Rows are
+    stamped when their database transaction starts, so a row can commit
+    with a time older than a token issued meanwhile; once a table is caught
+    up its cursor is set SYNC_CHANGES_OVERLAP_SECONDS in the past and
+    recent rows are sent again. Clients apply changes as upserts by ID.
+    """
+
+    @staticmethod
+    def encode_token(cursors: Dict[str, Cursor]) -> str:
+        """Opaque token holding a cursor per table"""
+        payload = json.dumps({name: [ts.isoformat(), row_id] for name, (ts, row_id) in cursors.items()})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_token(token: str) -> Dict[str, Cursor]:
+        """
+        Decode a token produced by encode_token
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            return {name: (datetime.fromisoformat(ts), int(row_id)) for name, (ts, row_id) in payload.items()}
+        except Exception:
+            raise ValueError("Invalid sync token")
+
+    @staticmethod
+    def _bind_time(db: Session, ts: datetime) -> Any:
+        """Cursor time as a bind value comparable with stored timestamps"""
+        if db.get_bind().dialect.name == "sqlite":
+            # CURRENT_TIMESTAMP defaults are stored as UTC text without fractions
+            if ts.tzinfo:
+                ts = ts.astimezone(timezone.utc)
+            return literal(ts.strftime("%Y-%m-%d %H:%M:%S"), String())
+        return ts
+
+    def _after(self, db: Session, changed, id_column, cursor: Cursor):
+        """Rows strictly after a keyset cursor"""
+        ts = self._bind_time(db, cursor[0])
+        return or_(changed > ts, and_(changed == ts, id_column > cursor[1]))
+
+    def _removed(
+        self,
+        db: Session,
+        name: str,
+        cursors: Dict[str, Cursor],
+        next_cursors: Dict[str, Cursor],
+        floor: Cursor,
+        limit: int,
+        model,
+        removed_at,
+        row_id,
+        *criteria
+    ) -> Tuple[List[int], bool]:
+        """IDs removed since a cursor, read from a table recording removals"""
+        after = cursors.get(name)
+        next_cursors[name] = floor
+        if not after:
+            return [], False
+
+        rows = db.query(model.id, removed_at, row_id).filter(
+            *criteria,
+            self._after(db, removed_at, model.id, after)
+        ).order_by(removed_at, model.id).limit(limit + 1).all()
+
+        if len(rows) > limit:
+            last_id, last_removed, _ = rows[limit - 1]
+            next_cursors[name] = (last_removed, last_id)
+        return [removed_id for _, _, removed_id in rows[:limit]], len(rows) > limit
+
+    def changes(
+        self,
+        db: Session,
+        user_id: int,
+        token: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[Dict[str, Dict[str, list]], str, bool]:
+        """
+        Rows created, updated or soft-deleted since a token
+
+        Without a token every live row is returned (a full first sync) and
+        no deletions are reported.
+
+        Args:
+            db: Database session
+            user_id: User whose rows to return
+            token: Token from the previous response
+            limit: Max rows per table (defaults to settings)
+
+        Returns:
+            (changes per table as {"upserted": rows, "deleted": ids}, next token, has_more)
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        limit = limit or settings.SYNC_CHANGES_PAGE_SIZE
+        cursors = self.decode_token(token) if token else {}
+        floor = (datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_CHANGES_OVERLAP_SECONDS), 0)
+
+        result: Dict[str, Dict[str, list]] = {}
+        next_cursors: Dict[str, Cursor] = {}
+        has_more = False
+
+        for feed in CHANGE_FEEDS:
+            after = cursors.get(feed.name)
+            changed = changed_at(feed.model)
+
+            query = db.query(feed.model, changed).filter(feed.model.user_id == user_id)
+            if after:
+                query = query.filter(self._after(db, changed, feed.model.id, after))
+            rows = query.order_by(changed, feed.model.id).limit(limit + 1).all()
+
+            upserted: List[Any] = []
+            deleted: List[int] = []
+            for row, _ in rows[:limit]:
+                if feed.is_deleted and feed.is_deleted(row):
+                    if after:
+                        deleted.append(row.id)
+                else:
+                    upserted.append(row)
+
+            if len(rows) > limit:
+                has_more = True
+                last, last_changed = rows[limit - 1]
+                next_cursors[feed.name] = (last_changed, last.id)
+            else:
+                next_cursors[feed.name] = floor
+
+            result[feed.name] = {"upserted": upserted, "deleted": deleted}
+
+        # Alerts archived by the retention job no longer exist in alerts
+        archived, more = self._removed(
+            db, ARCHIVE_CURSOR, cursors, next_cursors, floor, limit,
+            AlertArchive, AlertArchive.archived_at, AlertArchive.id,
+            AlertArchive.user_id == user_id
+        )
+        result["alerts"]["deleted"].extend(archived)
+        has_more = has_more or more
+
+        for feed in CHANGE_FEEDS:
+            if not feed.tombstones:
+                continue
+            removed, more = self._removed(
+                db, f"{feed.name}_tombstones", cursors, next_cursors, floor, limit,
+                SyncTombstone, SyncTombstone.deleted_at, SyncTombstone.row_id,
+                SyncTombstone.user_id == user_id,
+                SyncTombstone.entity == feed.name
+            )
+            result[feed.name]["deleted"].extend(removed)
+            has_more = has_more or more
+
+        return result, self.encode_token(next_cursors), has_more
+
+
+# Singleton instance
+change_feed_service = ChangeFeedService()
@@ -2,6 +2,7 @@ import logging
 from typing import List, Optional
 import httpx
 from app.core.config import settings
+from app.core.metrics import EXTERNAL_CALL_ERRORS, track_external_call
 
 logger = logging.getLogger(__name__)
 
@@ -61,17 +62,19 @@ class EmailService:
 
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=10.0
-                )
+                with track_external_call("brevo", "send_email"):
+                    response = await client.post(
+                        self.api_url,
+                        json=payload,
+                        headers=headers,
+                        timeout=10.0
+                    )
 
                 if response.status_code == 201:
                     logger.info(f"Email sent successfully to {to_email}")
                     return True
                 else:
+                    EXTERNAL_CALL_ERRORS.labels("brevo", "send_email").inc()
                     logger.error(f"Failed to send email: {response.status_code} - {response.text}")
                     return False
 
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EventBroker:
+    """
+    In-process pub/sub for per-user realtime events
+
+    Subscribers are asyncio queues owned by SSE connections. Publishing is
+    safe from any thread (sync endpoints run in the threadpool). When
+    EVENTS_REDIS_FANOUT is enabled, events go through a Redis channel so that
+    every worker delivers them to its own local subscribers.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._redis = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether events are fanned out through Redis"""
+        return settings.EVENTS_REDIS_FANOUT and bool(settings.REDIS_URL)
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """
+        Register a subscriber queue for a user (must run on the event loop)
+
+        Args:
+            user_id: User to receive events for
+
+        Returns:
+            Queue that receives event messages
+        """
+        queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[user_id].add((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue"""
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if not subscribers:
+                return
+            subscribers.difference_update({entry for entry in subscribers if entry[1] is queue})
+            if not subscribers:
+                del self._subscribers[user_id]
+
+    def has_listeners(self, user_id: int) -> bool:
+        """
+        Whether an event for this user may be delivered anywhere
+
+        Lets publishers skip building payloads nobody will receive. With Redis
+        fan-out enabled, subscribers on other workers are unknown, so this is
+        always True.
+        """
+        return self.redis_enabled or bool(self._subscribers.get(user_id))
+
+    def publish(self, user_id: int, event: str, data: Dict[str, Any]) -> None:
+        """
+        Publish an event to a user's subscribers
+
+        Args:
+            user_id: Target user
+            event: Event name (alert, unread_count, sync_progress)
+            data: JSON-serializable payload
+        """
+        message = {"user_id": user_id, "event": event, "data": data}
+
+        if self.redis_enabled:
+            try:
+                self._get_redis().publish(settings.EVENTS_REDIS_CHANNEL, json.dumps(message))
+                return
+            except Exception as e:
+                logger.error(f"Failed to publish event to Redis, delivering locally: {str(e)}")
+
+        self._dispatch(message)
+
+    def _get_redis(self):
+        """Lazy initialization of the synchronous Redis publisher"""
+        if self._redis is None:
+            import redis
+
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL,
+                password=settings.REDIS_PASSWORD or None
+            )
+        return self._redis
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Deliver a message to local subscribers"""
+        with self._lock:
+            targets = list(self._subscribers.get(message["user_id"], ()))
+
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, message)
+            except RuntimeError:
+                # Event loop already closed
+                self.unsubscribe(message["user_id"], queue)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, message: Dict[str, Any]) -> None:
+        """Enqueue a message, dropping the oldest one for slow consumers"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    async def start(self) -> None:
+        """Start the Redis fan-out listener if enabled"""
+        if not self.redis_enabled or self._listener_task is not None:
+            return
+        self._listener_task = asyncio.create_task(self._listen())
+        logger.info(f"Event fan-out listening on Redis channel {settings.EVENTS_REDIS_CHANNEL}")
+
+    async def stop(self) -> None:
+        """Stop the Redis fan-out listener"""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _listen(self) -> None:
+        """Relay messages from the Redis channel to local subscribers"""
+        import redis.asyncio as aioredis
+
+        while True:
+            client = aioredis.Redis.from_url(
+                settings.REDIS_URL,
+                password=settings.REDIS_PASSWORD or None
+            )
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(settings.EVENTS_REDIS_CHANNEL)
+                    async for item in pubsub.listen():
+                        if item.get("type") != "message":
+                            continue
+                        try:
+                            self._dispatch(json.loads(item["data"]))
+                        except (ValueError, KeyError) as e:
+                            logger.error(f"Discarding malformed event: {str(e)}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis event listener failed, reconnecting: {str(e)}")
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+# Singleton instance
+event_broker = EventBroker()
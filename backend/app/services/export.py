@@ -0,0 +1,369 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+import csv
+import io
+import json
+import logging
+from sqlalchemy.orm import Session
+from app.models.subscription import Subscription
+from app.models.suspicious_charge import SuspiciousCharge
+from app.models.transaction import Transaction
+from app.schemas.money import from_cents
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per server-side cursor round trip, and rows per emitted chunk
+EXPORT_BATCH_SIZE = 1000
+# Columnar formats compress better with larger batches (one record batch /
+# Parquet row group each); memory stays bounded by this many rows
+COLUMNAR_BATCH_SIZE = 50_000
+COLUMNAR_COMPRESSION = "zstd"
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+COLUMNAR_FORMATS = ("arrow", "parquet")
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """
+    One exported column
+
+    kind is one of int, float, bool, string, date, timestamp or cents. Cents
+    columns are exported as major-unit floats in text formats and as exact
+    int64 <name>_cents in columnar formats.
+    """
+    name: str
+    expression: Any
+    kind: str
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    """Columns and ordering of an exportable table"""
+    name: str
+    columns: Tuple[ExportColumn, ...]
+    order_by: Tuple[Any, ...]
+
+    def text_names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def columnar_names(self) -> List[str]:
+        return [f"{c.name}_cents" if c.kind == "cents" else c.name for c in self.columns]
+
+
+TRANSACTIONS = ExportDataset(
+    name="transactions",
+    columns=(
+        ExportColumn("id", Transaction.id, "int"),
+        ExportColumn("transaction_date", Transaction.transaction_date, "timestamp"),
+        ExportColumn("description", Transaction.description, "string"),
+        ExportColumn("merchant_name", Transaction.merchant_name, "string"),
+        ExportColumn("merchant_id", Transaction.merchant_id, "int"),
+        ExportColumn("category", Transaction.category, "string"),
+        ExportColumn("transaction_type", Transaction.transaction_type, "string"),
+        ExportColumn("amount", Transaction.amount_cents, "cents"),
+        ExportColumn("currency", Transaction.currency, "string"),
+        ExportColumn("bank_account_id", Transaction.bank_account_id, "int"),
+        ExportColumn("credit_card_id", Transaction.credit_card_id, "int"),
+        ExportColumn("reference", Transaction.reference, "string"),
+        ExportColumn("notes", Transaction.notes, "string"),
+        ExportColumn("status", Transaction.status, "string"),
+    ),
+    order_by=(Transaction.transaction_date.desc(), Transaction.id.desc()),
+)
+
+SUBSCRIPTIONS = ExportDataset(
+    name="subscriptions",
+    columns=(
+        ExportColumn("id", Subscription.id, "int"),
+        ExportColumn("service_name", Subscription.service_name, "string"),
+        ExportColumn("merchant_name", Subscription.merchant_name, "string"),
+        ExportColumn("merchant_id", Subscription.merchant_id, "int"),
+        ExportColumn("category", Subscription.category, "string"),
+        ExportColumn("amount", Subscription.amount_cents, "cents"),
+        ExportColumn("currency", Subscription.currency, "string"),
+        ExportColumn("billing_frequency", Subscription.billing_frequency, "string"),
+        ExportColumn("first_charge_date", Subscription.first_charge_date, "date"),
+        ExportColumn("last_charge_date", Subscription.last_charge_date, "date"),
+        ExportColumn("next_charge_date", Subscription.next_charge_date, "date"),
+        ExportColumn("is_active", Subscription.is_active, "bool"),
+        ExportColumn("auto_detected", Subscription.auto_detected, "bool"),
+    ),
+    order_by=(Subscription.id,),
+)
+
+SUSPICIOUS_CHARGES = ExportDataset(
+    name="suspicious_charges",
+    columns=(
+        ExportColumn("id", SuspiciousCharge.id, "int"),
+        ExportColumn("transaction_id", SuspiciousCharge.transaction_id, "int"),
+        ExportColumn("merchant_name", SuspiciousCharge.merchant_name, "string"),
+        ExportColumn("amount", SuspiciousCharge.amount_cents, "cents"),
+        ExportColumn("currency", SuspiciousCharge.currency, "string"),
+        ExportColumn("charge_date", SuspiciousCharge.charge_date, "timestamp"),
+        ExportColumn("suspicion_type", SuspiciousCharge.suspicion_type, "string"),
+        ExportColumn("confidence_score", SuspiciousCharge.confidence_score, "float"),
+        ExportColumn("status", SuspiciousCharge.status, "string"),
+        ExportColumn("resolved_at", SuspiciousCharge.resolved_at, "timestamp"),
+    ),
+    order_by=(SuspiciousCharge.charge_date.desc(), SuspiciousCharge.id.desc()),
+)
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to a generator"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class TransactionExportService:
+    """Streams a user's data as CSV, NDJSON, Arrow IPC or Parquet with bounded memory"""
+
+    def iter_batches(
+        self,
+        session_factory: Callable[[], Session],
+        criteria: Sequence[Any],
+        batch_size: int = EXPORT_BATCH_SIZE,
+        dataset: ExportDataset = TRANSACTIONS
+    ) -> Iterator[List[tuple]]:
+        """
+        Yield lists of raw rows from a server-side cursor
+
+        Opens its own session so the stream can outlive the request's
+        dependency-scoped session. Only the exported columns are selected,
+        and no ORM objects are built.
+
+        Args:
+            session_factory: Session constructor
+            criteria: Filter expressions for the dataset's table
+            batch_size: Rows per yielded batch
+            dataset: What to export
+
+        Yields:
+            Row tuples in dataset column order (cents columns as stored)
+        """
+        db = session_factory()
+        try:
+            result = db.query(*[column.expression for column in dataset.columns]).filter(
+                *criteria
+            ).order_by(*dataset.order_by).yield_per(batch_size)
+
+            batch = []
+            for row in result:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            db.close()
+
+    @staticmethod
+    def _text_rows(dataset: ExportDataset, batch: List[tuple]) -> Iterator[list]:
+        """Rows with cents converted to major units"""
+        cents = [index for index, column in enumerate(dataset.columns) if column.kind == "cents"]
+        for row in batch:
+            row = list(row)
+            for index in cents:
+                row[index] = from_cents(row[index])
+            yield row
+
+    def stream_csv(self, batches: Iterator[List[tuple]], dataset: ExportDataset = TRANSACTIONS) -> Iterator[str]:
+        """
+        Encode row batches as CSV, one chunk per batch
+
+        Args:
+            batches: Row batches from iter_batches
+            dataset: Dataset the rows belong to
+
+        Yields:
+            CSV text chunks, header first
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(dataset.text_names())
+
+        for batch in batches:
+            writer.writerows(
+                [value.isoformat() if isinstance(value, (date, datetime)) else value for value in row]
+                for row in self._text_rows(dataset, batch)
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def stream_ndjson(self, batches: Iterator[List[tuple]], dataset: ExportDataset = TRANSACTIONS) -> Iterator[str]:
+        """
+        Encode row batches as newline-delimited JSON, one chunk per batch
+
+        Args:
+            batches: Row batches from iter_batches
+            dataset: Dataset the rows belong to
+
+        Yields:
+            NDJSON text chunks
+        """
+        names = dataset.text_names()
+        for batch in batches:
+            yield "".join(
+                json.dumps(dict(zip(names, row)), default=_json_default, ensure_ascii=False) + "\n"
+                for row in self._text_rows(dataset, batch)
+            )
+
+    @staticmethod
+    def arrow_schema(dataset: ExportDataset):
+        """Arrow schema for a dataset"""
+        import pyarrow as pa
+
+        types = {
+            "int": pa.int64(),
+            "cents": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "string": pa.string(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("us"),
+        }
+        return pa.schema([
+            pa.field(name, types[column.kind])
+            for name, column in zip(dataset.columnar_names(), dataset.columns)
+        ])
+
+    @staticmethod
+    def _record_batch(schema, batch: List[tuple]):
+        """Transpose a row batch into an Arrow record batch"""
+        import pyarrow as pa
+
+        columns = list(zip(*batch))
+        return pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema
+        )
+
+    def stream_arrow(self, batches: Iterator[List[tuple]], dataset: ExportDataset = TRANSACTIONS) -> Iterator[bytes]:
+        """
+        Encode row batches as a zstd-compressed Arrow IPC stream
+
+        Args:
+            batches: Row batches from iter_batches
+            dataset: Dataset the rows belong to
+
+        Yields:
+            IPC stream bytes, one record batch per chunk
+        """
+        import pyarrow as pa
+
+        schema = self.arrow_schema(dataset)
+        sink = _ChunkSink()
+        options = pa.ipc.IpcWriteOptions(compression=COLUMNAR_COMPRESSION)
+
+        with pa.ipc.new_stream(sink, schema, options=options) as writer:
+            yield sink.drain()
+            for batch in batches:
+                writer.write_batch(self._record_batch(schema, batch))
+                yield sink.drain()
+        yield sink.drain()
+
+    def stream_parquet(self, batches: Iterator[List[tuple]], dataset: ExportDataset = TRANSACTIONS) -> Iterator[bytes]:
+        """
+        Encode row batches as a zstd-compressed Parquet file
+
+        Parquet is written front to back (the footer comes last), so each row
+        group can be sent as soon as it is encoded.
+
+        Args:
+            batches: Row batches from iter_batches
+            dataset: Dataset the rows belong to
+
+        Yields:
+            Parquet file bytes, one row group per chunk
+        """
+        import pyarrow.parquet as pq
+
+        schema = self.arrow_schema(dataset)
+        sink = _ChunkSink()
+
+        with pq.ParquetWriter(sink, schema, compression=COLUMNAR_COMPRESSION) as writer:
+            for batch in batches:
+                writer.write_batch(self._record_batch(schema, batch))
+                yield sink.drain()
+        yield sink.drain()
+
+    def stream(
+        self,
+        session_factory: Callable[[], Session],
+        criteria: Sequence[Any],
+        export_format: str,
+        dataset: ExportDataset = TRANSACTIONS
+    ) -> Iterator:
+        """
+        Build the response body iterator for a format
+
+        Args:
+            session_factory: Session constructor
+            criteria: Filter expressions for the dataset's table
+            export_format: One of EXPORT_FORMATS
+            dataset: What to export
+
+        Returns:
+            Iterator of str (text formats) or bytes (columnar formats)
+        """
+        batch_size = COLUMNAR_BATCH_SIZE if export_format in COLUMNAR_FORMATS else EXPORT_BATCH_SIZE
+        batches = self.iter_batches(session_factory, criteria, batch_size, dataset)
+        encoders = {
+            "csv": self.stream_csv,
+            "ndjson": self.stream_ndjson,
+            "arrow": self.stream_arrow,
+            "parquet": self.stream_parquet,
+        }
+        return encoders[export_format](batches, dataset)
+
+
+def _json_default(value: Any) -> str:
+    """Serialize dates in NDJSON rows"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Singleton instance
+transaction_export_service = TransactionExportService()
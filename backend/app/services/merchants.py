@@ -0,0 +1,277 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import re
+import threading
+import unicodedata
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.merchant import Merchant
+from app.models.subscription import Subscription
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Payment processor / aggregator prefixes, e.g. "PAYPAL *SPOTIFY", "MERPAGO*RAPPI"
+_PROCESSOR_PREFIX_RE = re.compile(
+    r"^(?:paypal|pp|mercadopago|merpago|mp|clip|conekta|stripe|sq|openpay|dlo|dlocal)\s*\*\s*"
+)
+# Domains keep only their name: "netflix.com" -> "netflix"
+_DOMAIN_RE = re.compile(r"\b(?:www\.)?([a-z0-9-]+)\.(?:com|net|org|io|tv|app)(?:\.mx)?\b")
+# Brand "+" is spelled out: "disney+" -> "disney plus" (phone numbers keep theirs)
+_PLUS_RE = re.compile(r"(?<=[a-z])\s*\+(?!\d)")
+# Store numbers, references and card suffixes: "#1234", "*5678", "00123"
+_NUMBER_RE = re.compile(r"[#*]?\d+")
+_NON_WORD_RE = re.compile(r"[^a-z ]+")
+_SPACE_RE = re.compile(r"\s+")
+
+# Tokens that never distinguish one merchant from another
+NOISE_TOKENS = frozenset({
+    # countries
+    "mx", "mex", "mexico", "us", "usa",
+    # legal entity suffixes
+    "sa", "de", "cv", "sapi", "rl", "srl", "inc", "llc", "ltd", "co",
+    # generic payment/store words
+    "suc", "sucursal", "tienda", "store", "pago", "payment", "compra", "cargo",
+    "www", "com", "online", "digital",
+})
+
+# Known spellings that token rules alone do not collapse
+KEY_ALIASES = {
+    "amzn": "amazon",
+    "amzn mktp": "amazon",
+    "amazon mktplace": "amazon",
+    "amazon marketplace": "amazon",
+    "google youtube": "youtube",
+    "apple itunes": "apple",
+    "itunes": "apple",
+    "disneyplus": "disney plus",
+    "wal mart": "walmart",
+    "walmart express": "walmart",
+}
+
+
+@lru_cache(maxsize=65536)
+def normalize_merchant_name(raw_name: Optional[str]) -> Optional[str]:
+    """
+    Reduce a raw merchant string to its lookup key
+
+    "NETFLIX.COM 1234", "Netflix MX" and "PAYPAL *NETFLIX" all become "netflix".
+
+    Args:
+        raw_name: Merchant name as received from the bank
+
+    Returns:
+        Normalized key, or None if nothing meaningful remains
+    """
+    if not raw_name:
+        return None
+
+    value = unicodedata.normalize("NFKD", raw_name).encode("ascii", "ignore").decode().lower().strip()
+    value = _PROCESSOR_PREFIX_RE.sub("", value)
+    value = _DOMAIN_RE.sub(r"\1", value)
+    value = _PLUS_RE.sub(" plus ", value)
+    value = _NUMBER_RE.sub(" ", value)
+    value = _NON_WORD_RE.sub(" ", value)
+
+    tokens = [token for token in _SPACE_RE.split(value) if len(token) > 1 and token not in NOISE_TOKENS]
+    if not tokens:
+        return None
+
+    key = " ".join(tokens)
+    return KEY_ALIASES.get(key, key)
+
+
+class MerchantDirectory:
+    """
+    Per-worker cache of canonical merchants
+
+    Loaded from the merchants table on first use. Exact keys resolve through
+    a dict; curated merchants (match_prefix) also sit in a token trie so the
+    longest curated prefix wins ("oxxo insurgentes" -> "oxxo"). Unknown keys
+    are created on the fly.
+    """
+
+    _TERMINAL = "$id"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._by_key: Dict[str, int] = {}
+        self._trie: dict = {}
+
+    def _add(self, merchant_id: int, key: str, match_prefix: bool) -> None:
+        """Register a merchant in the cache (caller holds the lock)"""
+        self._by_key[key] = merchant_id
+        if match_prefix:
+            node = self._trie
+            for token in key.split(" "):
+                node = node.setdefault(token, {})
+            node[self._TERMINAL] = merchant_id
+
+    def _prefix_match(self, key: str) -> Optional[int]:
+        """Longest curated token prefix of key"""
+        node = self._trie
+        match = None
+        for token in key.split(" "):
+            node = node.get(token)
+            if node is None:
+                break
+            match = node.get(self._TERMINAL, match)
+        return match
+
+    def load(self, db: Session, force: bool = False) -> None:
+        """
+        Load all merchants into memory (once per worker unless forced)
+
+        Args:
+            db: Database session
+            force: Reload even if already loaded
+        """
+        if self._loaded and not force:
+            return
+
+        rows = db.query(Merchant.id, Merchant.normalized_key, Merchant.match_prefix).all()
+        with self._lock:
+            self._by_key = {}
+            self._trie = {}
+            for merchant_id, key, match_prefix in rows:
+                self._add(merchant_id, key, bool(match_prefix))
+            self._loaded = True
+        logger.info(f"Loaded {len(rows)} merchants into the directory cache")
+
+    def _lookup(self, key: str) -> Optional[int]:
+        """Resolve a key from the cache only"""
+        merchant_id = self._by_key.get(key)
+        if merchant_id is None:
+            merchant_id = self._prefix_match(key)
+        return merchant_id
+
+    def resolve_many(self, db: Session, raw_names: Iterable[Optional[str]]) -> Dict[str, Optional[int]]:
+        """
+        Map raw merchant names to merchant IDs, creating missing merchants
+
+        Cache misses are looked up with one IN query and the remainder are
+        inserted, so a sync costs at most two queries however many names it has.
+
+        Args:
+            db: Database session (caller commits)
+            raw_names: Raw merchant names
+
+        Returns:
+            Mapping from each raw name to its merchant ID (None if unnamed)
+        """
+        self.load(db)
+
+        keys = {raw: normalize_merchant_name(raw) for raw in set(raw_names) if raw}
+        resolved = {key: self._lookup(key) for key in set(keys.values()) if key}
+        missing = [key for key, merchant_id in resolved.items() if merchant_id is None]
+
+        if missing:
+            # Another worker may have created some of them already
+            for merchant_id, key in db.query(Merchant.id, Merchant.normalized_key).filter(
+                Merchant.normalized_key.in_(missing)
+            ):
+                resolved[key] = merchant_id
+                with self._lock:
+                    self._add(merchant_id, key, False)
+
+            for key in [key for key in missing if resolved[key] is None]:
+                resolved[key] = self._create(db, key)
+
+        return {raw: resolved.get(key) if key else None for raw, key in keys.items()}
+
+    def resolve(self, db: Session, raw_name: Optional[str]) -> Optional[int]:
+        """
+        Map a single raw merchant name to a merchant ID
+
+        Args:
+            db: Database session (caller commits)
+            raw_name: Raw merchant name
+
+        Returns:
+            Merchant ID, or None if the name is empty
+        """
+        if not raw_name:
+            return None
+        return self.resolve_many(db, [raw_name]).get(raw_name)
+
+    def _create(self, db: Session, key: str) -> int:
+        """Insert a merchant for key, tolerating a concurrent insert"""
+        try:
+            with db.begin_nested():
+                merchant = Merchant(name=key.title(), normalized_key=key, match_prefix=False)
+                db.add(merchant)
+            merchant_id = merchant.id
+        except IntegrityError:
+            merchant_id = db.query(Merchant.id).filter(Merchant.normalized_key == key).scalar()
+
+        # Not cached until committed: the caller may still roll back, and the
+        # next resolve finds the row with the IN query and caches it then
+        return merchant_id
+
+    def backfill(self, db: Session, batch_size: int = 500) -> Tuple[int, int]:
+        """
+        Set merchant_id on transactions and subscriptions that lack one
+
+        Works through distinct merchant names in batches, committing after
+        each so it can run on a live database.
+
+        Args:
+            db: Database session
+            batch_size: Distinct names per batch
+
+        Returns:
+            (transactions updated, subscriptions updated)
+        """
+        totals = []
+        for model in (Transaction, Subscription):
+            updated = 0
+            names: List[str] = [name for (name,) in db.query(model.merchant_name).filter(
+                model.merchant_id.is_(None),
+                model.merchant_name.isnot(None)
+            ).distinct()]
+
+            for start in range(0, len(names), batch_size):
+                batch = names[start:start + batch_size]
+                mapping = self.resolve_many(db, batch)
+                params = [
+                    {"raw_name": name, "new_merchant_id": merchant_id}
+                    for name, merchant_id in mapping.items() if merchant_id is not None
+                ]
+                if params:
+                    result = db.execute(
+                        update(model.__table__)
+                        .where(model.__table__.c.merchant_name == bindparam("raw_name"))
+                        .where(model.__table__.c.merchant_id.is_(None))
+                        .values(merchant_id=bindparam("new_merchant_id")),
+                        params
+                    )
+                    updated += result.rowcount or 0
+                db.commit()
+
+            totals.append(updated)
+            logger.info(f"Backfilled merchant_id on {updated} {model.__tablename__}")
+
+        return totals[0], totals[1]
+
+
+# Singleton instance
+merchant_directory = MerchantDirectory()
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.db.base import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Backfill normalized merchants")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        transactions_updated, subscriptions_updated = merchant_directory.backfill(db, batch_size=args.batch_size)
+        print(f"Updated {transactions_updated} transactions and {subscriptions_updated} subscriptions")
+    finally:
+        db.close()
@@ -0,0 +1,191 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import case, false, func, insert, literal, or_, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.alert import Alert
+from app.models.alert_archive import AlertArchive
+from app.services.alerts import alert_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns copied verbatim from alerts to alerts_archive
+ARCHIVED_COLUMNS = [
+    "id", "user_id", "alert_type", "title", "message", "priority", "category",
+    "related_transaction_id", "related_subscription_id", "related_account_id",
+    "is_read", "is_dismissed", "read_at", "dismissed_at",
+    "requires_action", "action_url", "action_taken", "action_taken_at",
+    "push_sent", "email_sent", "sms_sent", "created_at", "updated_at",
+]
+
+
+@dataclass
+class RetentionPolicy:
+    """Which alerts leave the live table"""
+    dismissed_days: int = settings.ALERT_RETENTION_DISMISSED_DAYS
+    max_age_days: int = settings.ALERT_RETENTION_MAX_AGE_DAYS
+    batch_size: int = settings.ALERT_RETENTION_BATCH_SIZE
+
+
+@dataclass
+class RetentionReport:
+    """Outcome (or preview, for dry runs) of a retention run"""
+    dry_run: bool
+    candidates: int = 0
+    dismissed: int = 0
+    expired: int = 0
+    archived: int = 0
+    batches: int = 0
+    oldest_created_at: Optional[datetime] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the report for logs and CLI output"""
+        return {
+            "dry_run": self.dry_run,
+            "candidates": self.candidates,
+            "dismissed": self.dismissed,
+            "expired": self.expired,
+            "archived": self.archived,
+            "batches": self.batches,
+            "oldest_created_at": self.oldest_created_at.isoformat() if self.oldest_created_at else None,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class AlertRetentionService:
+    """Moves dismissed and expired alerts from alerts to alerts_archive"""
+
+    def _conditions(self, policy: RetentionPolicy, now: datetime):
+        """Build (dismissed, expired) filter expressions for a policy"""
+        dismissed = false()
+        if policy.dismissed_days > 0:
+            dismissed_cutoff = now - timedelta(days=policy.dismissed_days)
+            dismissed = (Alert.is_dismissed == True) & (
+                func.coalesce(Alert.dismissed_at, Alert.created_at) < dismissed_cutoff
+            )
+
+        expired = false()
+        if policy.max_age_days > 0:
+            expired = Alert.created_at < now - timedelta(days=policy.max_age_days)
+
+        return dismissed, expired
+
+    def run(
+        self,
+        db: Session,
+        policy: Optional[RetentionPolicy] = None,
+        dry_run: bool = False
+    ) -> RetentionReport:
+        """
+        Archive alerts matching the retention policy in batches
+
+        Each batch copies rows into alerts_archive, deletes them from alerts
+        and commits, so locks stay short and an interrupted run can resume.
+
+        Args:
+            db: Database session
+            policy: Retention policy (defaults to settings)
+            dry_run: Only report what would be archived
+
+        Returns:
+            Retention report
+        """
+        policy = policy or RetentionPolicy()
+        now = datetime.utcnow()
+        dismissed, expired = self._conditions(policy, now)
+        report = RetentionReport(dry_run=dry_run)
+
+        # One aggregate pass for the report
+        row = db.query(
+            func.count(Alert.id),
+            func.sum(case((dismissed, 1), else_=0)),
+            func.sum(case((dismissed, 0), (expired, 1), else_=0)),
+            func.min(Alert.created_at),
+        ).filter(or_(dismissed, expired)).one()
+        report.candidates = row[0] or 0
+        report.dismissed = row[1] or 0
+        report.expired = row[2] or 0
+        report.oldest_created_at = row[3]
+
+        if dry_run or report.candidates == 0:
+            report.finished_at = datetime.utcnow()
+            logger.info(f"Alert retention report: {report.to_dict()}")
+            return report
+
+        archive_columns = [getattr(AlertArchive, name) for name in ARCHIVED_COLUMNS] + [AlertArchive.archived_at]
+
+        while True:
+            batch = db.query(Alert.id, Alert.user_id, Alert.is_read, Alert.is_dismissed).filter(
+                or_(dismissed, expired)
+            ).order_by(Alert.id).limit(policy.batch_size).all()
+
+            if not batch:
+                break
+
+            ids = [alert_id for alert_id, _, _, _ in batch]
+
+            db.execute(
+                insert(AlertArchive).from_select(
+                    archive_columns,
+                    select(
+                        *[getattr(Alert, name) for name in ARCHIVED_COLUMNS],
+                        literal(now, AlertArchive.archived_at.type)
+                    ).where(Alert.id.in_(ids))
+                )
+            )
+            db.query(Alert).filter(Alert.id.in_(ids)).delete(synchronize_session=False)
+
+            # Expired alerts may still be unread; keep counters exact
+            unread_by_user = Counter(
+                user_id for _, user_id, is_read, is_dismissed in batch
+                if not is_read and not is_dismissed
+            )
+            for user_id, count in unread_by_user.items():
+                alert_service.adjust_unread_count(db, user_id, -count)
+
+            db.commit()
+
+            report.archived += len(batch)
+            report.batches += 1
+
+        report.finished_at = datetime.utcnow()
+        logger.info(f"Alert retention finished: {report.to_dict()}")
+        return report
+
+
+# Singleton instance
+alert_retention_service = AlertRetentionService()
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    from app.db.base import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Archive dismissed and expired alerts")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be archived")
+    parser.add_argument("--dismissed-days", type=int, default=settings.ALERT_RETENTION_DISMISSED_DAYS)
+    parser.add_argument("--max-age-days", type=int, default=settings.ALERT_RETENTION_MAX_AGE_DAYS)
+    parser.add_argument("--batch-size", type=int, default=settings.ALERT_RETENTION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = alert_retention_service.run(
+            db,
+            RetentionPolicy(
+                dismissed_days=args.dismissed_days,
+                max_age_days=args.max_age_days,
+                batch_size=args.batch_size,
+            ),
+            dry_run=args.dry_run
+        )
+        print(json.dumps(result.to_dict(), indent=2))
+    finally:
+        db.close()
@@ -0,0 +1,166 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+import base64
+import json
+import logging
+import re
+from sqlalchemy import Float, and_, cast, column, func, literal, literal_column, or_, table
+from sqlalchemy.orm import Session
+from app.db.search import FTS_TABLE, SEARCH_CONFIG, SEARCH_VECTOR_COLUMN
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Longer queries are truncated to keep the tsquery/MATCH expression small
+MAX_SEARCH_TERMS = 8
+SEARCH_SORTS = ("relevance", "date")
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class TransactionSearchService:
+    """Ranked full-text search over a user's transactions with cursor pagination"""
+
+    @staticmethod
+    def parse_terms(query: str) -> List[str]:
+        """Split a user query into lower-cased word terms"""
+        return _TERM_RE.findall(query.lower())[:MAX_SEARCH_TERMS]
+
+    @staticmethod
+    def encode_cursor(rank: float, transaction_date: datetime, transaction_id: int) -> str:
+        """Opaque cursor pointing just after a result row"""
+        payload = json.dumps([rank, transaction_date.isoformat(), transaction_id])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[float, datetime, int]:
+        """
+        Decode a cursor produced by encode_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            rank, transaction_date, transaction_id = json.loads(base64.urlsafe_b64decode(padded))
+            return float(rank), datetime.fromisoformat(transaction_date), int(transaction_id)
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    def _match(self, db: Session, query, terms: List[str]):
+        """Apply the dialect's full-text match and return (query, rank expression)"""
+        dialect = db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            # Prefix match every term: "oxx sant" -> 'oxx':* & 'sant':*
+            tsquery = func.to_tsquery(
+                literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+                " & ".join(f"{term}:*" for term in terms)
+            )
+            vector = literal_column(f"{Transaction.__tablename__}.{SEARCH_VECTOR_COLUMN}")
+            # ts_rank_cd is float4; compare in float8 so the rank echoed in the
+            # cursor (a Python float) matches the row it came from
+            rank = cast(func.ts_rank_cd(vector, tsquery), Float(53))
+            return query.filter(vector.op("@@")(tsquery)), rank
+
+        if dialect == "sqlite":
+            fts = table(FTS_TABLE, column("rowid"))
+            fts_ref = literal_column(FTS_TABLE)
+            # bm25() is lower-is-better; negate so higher rank is better everywhere
+            rank = -func.bm25(fts_ref)
+            match = " ".join(f'"{term}"*' for term in terms)
+            return query.join(fts, fts.c.rowid == Transaction.id).filter(fts_ref.op("MATCH")(match)), rank
+
+        # No index available: unranked substring match
+        haystack = func.coalesce(Transaction.description, "") + " " + \
+            func.coalesce(Transaction.merchant_name, "") + " " + \
+            func.coalesce(Transaction.notes, "")
+        for term in terms:
+            query = query.filter(haystack.ilike(f"%{term}%"))
+        return query, literal(0.0)
+
+    def search(
+        self,
+        db: Session,
+        user_id: int,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort: str = "relevance",
+        transaction_type: Optional[str] = None,
+        category: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[List[Tuple[Transaction, float]], Optional[str]]:
+        """
+        Search description, merchant and notes
+
+        Results are ordered by rank (or date) with (transaction_date, id) as a
+        tie-breaker, and paginated by keyset so deep pages cost the same as
+        the first one.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            query: Free-text query
+            limit: Page size
+            cursor: Cursor from the previous page
+            sort: "relevance" or "date"
+            transaction_type: Filter by type
+            category: Filter by category
+            date_from: Filter from date (bounds partitions scanned)
+            date_to: Filter to date
+
+        Returns:
+            (transaction, rank) pairs and the next cursor, if any
+
+        Raises:
+            ValueError: If the query has no terms, the sort or cursor is invalid
+        """
+        terms = self.parse_terms(query)
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+        if sort not in SEARCH_SORTS:
+            raise ValueError(f"Invalid sort: {sort}")
+
+        base = db.query(Transaction).filter(Transaction.user_id == user_id)
+        if transaction_type:
+            base = base.filter(Transaction.transaction_type == transaction_type)
+        if category:
+            base = base.filter(Transaction.category == category)
+        if date_from:
+            base = base.filter(Transaction.transaction_date >= date_from)
+        if date_to:
+            base = base.filter(Transaction.transaction_date <= date_to)
+
+        base, rank = self._match(db, base, terms)
+        rank = rank.label("rank")
+        base = base.add_columns(rank)
+
+        if cursor:
+            after_rank, after_date, after_id = self.decode_cursor(cursor)
+            after_row = or_(
+                Transaction.transaction_date < after_date,
+                and_(Transaction.transaction_date == after_date, Transaction.id < after_id)
+            )
+            if sort == "relevance":
+                after_row = or_(rank.element < after_rank, and_(rank.element == after_rank, after_row))
+            base = base.filter(after_row)
+
+        order = [Transaction.transaction_date.desc(), Transaction.id.desc()]
+        if sort == "relevance":
+            order.insert(0, rank.element.desc())
+
+        rows = base.order_by(*order).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last, last_rank = rows[-1]
+            next_cursor = self.encode_cursor(last_rank, last.transaction_date, last.id)
+
+        return [(transaction, float(row_rank or 0.0)) for transaction, row_rank in rows], next_cursor
+
+
+# Singleton instance
+transaction_search_service = TransactionSearchService()
@@ -0,0 +1,220 @@
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+import csv
+import io
+import json
+import logging
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.bank_account import BankAccount
+from app.models.credit_card import CreditCard
+from app.models.transaction import Transaction
+from app.schemas.money import to_cents
+from app.schemas.transaction import TransactionCreate
+from app.services.categorization import categorization_service, SOURCE_USER
+from app.services.merchants import merchant_directory
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+class ImportLimitExceeded(ValueError):
+    """Upload has more rows than IMPORT_MAX_ROWS"""
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a bulk import"""
+    total_rows: int = 0
+    imported: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+
+class TransactionImportService:
+    """
+    Bulk-imports manual transactions from CSV or NDJSON uploads
+
+    Rows are validated with the same schema as POST /transactions. Each
+    distinct account and card ID is ownership-checked once per import, valid
+    rows are inserted with one executemany per batch, and invalid rows are
+    reported by row number instead of failing the upload. Everything is
+    committed together at the end.
+    """
+
+    @staticmethod
+    def parse_csv(source: BinaryIO) -> Iterator[Tuple[int, Any]]:
+        """
+        Read CSV rows with a header line
+
+        Empty cells are treated as missing values.
+
+        Args:
+            source: Binary file object (UTF-8, BOM allowed)
+
+        Yields:
+            (row number, row dict), numbered from 1 after the header
+        """
+        reader = csv.DictReader(io.TextIOWrapper(source, encoding="utf-8-sig", newline=""))
+        for number, row in enumerate(reader, start=1):
+            yield number, {key: value for key, value in row.items() if key and value not in (None, "")}
+
+    @staticmethod
+    def parse_ndjson(source: BinaryIO) -> Iterator[Tuple[int, Any]]:
+        """
+        Read one JSON object per line, skipping blank lines
+
+        Args:
+            source: Binary file object (UTF-8)
+
+        Yields:
+            (line number, decoded object or the ValueError raised decoding it)
+        """
+        for number, line in enumerate(io.TextIOWrapper(source, encoding="utf-8-sig"), start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, e
+
+    def _owned_ids(self, db: Session, model, user_id: int, ids: set, known: Dict[int, bool]) -> None:
+        """Look up ownership of IDs not yet in known with one IN query"""
+        unknown = [i for i in ids if i not in known]
+        if not unknown:
+            return
+        owned = {i for (i,) in db.query(model.id).filter(model.id.in_(unknown), model.user_id == user_id)}
+        for i in unknown:
+            known[i] = i in owned
+
+    def import_rows(
+        self,
+        db: Session,
+        user_id: int,
+        rows: Iterator[Tuple[int, Any]],
+        batch_size: Optional[int] = None,
+        max_rows: Optional[int] = None
+    ) -> ImportReport:
+        """
+        Validate and insert parsed rows for a user
+
+        Args:
+            db: Database session (committed on success, rolled back on error)
+            user_id: Owner of the imported transactions
+            rows: (row number, row dict) pairs from a parser
+            batch_size: Rows per insert (defaults to settings)
+            max_rows: Row limit (defaults to settings)
+
+        Returns:
+            Import report with per-row errors
+
+        Raises:
+            ImportLimitExceeded: If the upload has more than max_rows rows
+        """
+        batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        max_rows = max_rows or settings.IMPORT_MAX_ROWS
+        report = ImportReport()
+        accounts: Dict[int, bool] = {}
+        cards: Dict[int, bool] = {}
+        statement = insert(Transaction.__table__)
+
+        def flush(batch: List[Tuple[int, TransactionCreate]]) -> None:
+            self._owned_ids(db, BankAccount, user_id, {t.bank_account_id for _, t in batch if t.bank_account_id}, accounts)
+            self._owned_ids(db, CreditCard, user_id, {t.credit_card_id for _, t in batch if t.credit_card_id}, cards)
+            merchant_ids = merchant_directory.resolve_many(db, (t.merchant_name for _, t in batch))
+
+            params = []
+            for number, data in batch:
+                if data.bank_account_id and not accounts[data.bank_account_id]:
+                    report.errors.append({"row": number, "error": "Bank account not found"})
+                    continue
+                if data.credit_card_id and not cards[data.credit_card_id]:
+                    report.errors.append({"row": number, "error": "Credit card not found"})
+                    continue
+
+                params.append({
+                    "user_id": user_id,
+                    "bank_account_id": data.bank_account_id,
+                    "credit_card_id": data.credit_card_id,
+                    "description": data.description,
+                    "merchant_name": data.merchant_name,
+                    "merchant_id": merchant_ids.get(data.merchant_name),
+                    "category": data.category,
+                    "category_source": SOURCE_USER if data.category else None,
+                    "amount_cents": to_cents(data.amount),
+                    "currency": data.currency,
+                    "transaction_type": data.transaction_type,
+                    "transaction_date": data.transaction_date,
+                    "status": "completed",
+                })
+
+            if params:
+                categorization_service.assign_rows(db, user_id, params)
+                db.execute(statement, params)
+                report.imported += len(params)
+
+        batch: List[Tuple[int, TransactionCreate]] = []
+        try:
+            for number, row in rows:
+                report.total_rows += 1
+                if report.total_rows > max_rows:
+                    raise ImportLimitExceeded(f"Import is limited to {max_rows} rows")
+
+                if isinstance(row, Exception):
+                    report.errors.append({"row": number, "error": f"Invalid JSON: {row}"})
+                    continue
+                if not isinstance(row, dict):
+                    report.errors.append({"row": number, "error": "Row must be an object"})
+                    continue
+
+                try:
+                    batch.append((number, TransactionCreate.model_validate(row)))
+                except ValidationError as e:
+                    first = e.errors()[0]
+                    location = ".".join(str(part) for part in first["loc"])
+                    report.errors.append({"row": number, "error": f"{location}: {first['msg']}"})
+                    continue
+
+                if len(batch) >= batch_size:
+                    flush(batch)
+                    batch = []
+
+            if batch:
+                flush(batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        report.errors.sort(key=lambda error: error["row"])
+        logger.info(
+            f"Imported {report.imported} of {report.total_rows} transactions for user {user_id} "
+            f"({report.failed} failed)"
+        )
+        return report
+
+    def import_file(self, db: Session, user_id: int, source: BinaryIO, import_format: str) -> ImportReport:
+        """
+        Parse and import an uploaded file
+
+        Args:
+            db: Database session
+            user_id: Owner of the imported transactions
+            source: Binary file object
+            import_format: csv or ndjson
+
+        Returns:
+            Import report
+        """
+        parser = self.parse_ndjson if import_format == "ndjson" else self.parse_csv
+        return self.import_rows(db, user_id, parser(source))
+
+
+# Singleton instance
+transaction_import_service = TransactionImportService()
@@ -0,0 +1,270 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import io
+import logging
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.bank_account import BankAccount
+from app.models.transaction import Transaction
+from app.schemas.money import to_cents
+from app.services.categorization import categorization_service
+from app.services.merchants import merchant_directory
+
+logger = logging.getLogger(__name__)
+
+# Columns written by both ingest paths, in COPY order
+INGEST_COLUMNS = (
+    "user_id",
+    "bank_account_id",
+    "belvo_transaction_id",
+    "description",
+    "merchant_name",
+    "merchant_id",
+    "category",
+    "category_source",
+    "amount_cents",
+    "currency",
+    "transaction_type",
+    "reference",
+    "transaction_date",
+    "value_date",
+    "status",
+)
+STAGING_TABLE = "belvo_transactions_staging"
+PATH_INSERT = "insert"
+PATH_COPY = "copy"
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one Belvo transaction payload"""
+    inserted: int = 0
+    skipped: int = 0  # Already stored
+    errors: List[str] = field(default_factory=list)
+    path: str = PATH_INSERT
+
+
+def _parse_belvo_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _copy_value(value: Any) -> str:
+    """Encode a value for COPY's text format (\\N is NULL)"""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class TransactionIngestService:
+    """
+    Writes Belvo transactions into the transactions table
+
+    Rows are built in memory first (accounts and merchants resolved with one
+    query each, rules compiled once). Large syncs on PostgreSQL are then
+    loaded with COPY into a temp staging table and merged with a single
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING; everything else uses
+    batched executemany inserts after one existence check per batch.
+    """
+
+    def build_rows(
+        self,
+        db: Session,
+        user_id: int,
+        belvo_transactions: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+        progress_interval: int = 100
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Convert Belvo transaction payloads into insert rows
+
+        Args:
+            db: Database session
+            user_id: Owner of the transactions
+            belvo_transactions: Transactions as returned by the Belvo API
+            progress: Called with (processed, total) every progress_interval rows
+            progress_interval: Rows between progress calls
+
+        Returns:
+            (rows ready to insert, error messages)
+        """
+        total = len(belvo_transactions)
+        errors: List[str] = []
+
+        belvo_account_ids = {(t.get("account") or {}).get("id") for t in belvo_transactions} - {None}
+        accounts = dict(db.query(BankAccount.belvo_account_id, BankAccount.id).filter(
+            BankAccount.user_id == user_id,
+            BankAccount.belvo_account_id.in_(belvo_account_ids)
+        )) if belvo_account_ids else {}
+        merchant_ids = merchant_directory.resolve_many(
+            db,
+            ((t.get("merchant") or {}).get("name") for t in belvo_transactions)
+        )
+
+        rows = []
+        for index, belvo_transaction in enumerate(belvo_transactions, start=1):
+            if progress and index % progress_interval == 0:
+                progress(index, total)
+
+            try:
+                account_id = accounts.get((belvo_transaction.get("account") or {}).get("id"))
+                if account_id is None:
+                    errors.append(f"Account not found for transaction {belvo_transaction.get('id')}")
+                    continue
+
+                amount = float(belvo_transaction.get("amount", 0))
+                merchant_name = (belvo_transaction.get("merchant") or {}).get("name")
+                value_date = _parse_belvo_datetime(belvo_transaction["value_date"])
+                rows.append({
+                    "user_id": user_id,
+                    "bank_account_id": account_id,
+                    "belvo_transaction_id": belvo_transaction["id"],
+                    "description": belvo_transaction.get("description", "Transaction"),
+                    "merchant_name": merchant_name,
+                    "merchant_id": merchant_ids.get(merchant_name),
+                    "category": belvo_transaction.get("category"),
+                    "category_source": None,
+                    "amount_cents": abs(to_cents(amount)),
+                    "currency": belvo_transaction.get("currency", "MXN"),
+                    "transaction_type": "income" if amount > 0 else "expense",
+                    "reference": belvo_transaction.get("reference"),
+                    "transaction_date": value_date,
+                    "value_date": value_date,
+                    "status": "completed",
+                })
+            except Exception as e:
+                errors.append(f"Failed to sync transaction {belvo_transaction.get('id')}: {str(e)}")
+
+        categorization_service.assign_rows(db, user_id, rows)
+        return rows, errors
+
+    @staticmethod
+    def use_copy(db: Session, row_count: int) -> bool:
+        """Whether a batch of row_count rows should take the COPY path"""
+        threshold = settings.BELVO_COPY_THRESHOLD
+        return bool(threshold) and row_count >= threshold and db.get_bind().dialect.name == "postgresql"
+
+    def insert_rows(self, db: Session, rows: List[dict], batch_size: Optional[int] = None) -> int:
+        """
+        Insert rows not already stored, with one executemany per batch
+
+        Args:
+            db: Database session (caller commits)
+            rows: Rows from build_rows
+            batch_size: Rows per batch (defaults to settings)
+
+        Returns:
+            Number of rows inserted
+        """
+        batch_size = batch_size or settings.BELVO_INGEST_BATCH_SIZE
+        statement = insert(Transaction.__table__)
+        inserted = 0
+        seen = set()
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            ids = {row["belvo_transaction_id"] for row in batch}
+            seen.update(
+                belvo_id for (belvo_id,) in db.query(Transaction.belvo_transaction_id).filter(
+                    Transaction.belvo_transaction_id.in_(ids - seen)
+                )
+            )
+
+            params = []
+            for row in batch:
+                if row["belvo_transaction_id"] not in seen:
+                    seen.add(row["belvo_transaction_id"])
+                    params.append(row)
+            if params:
+                db.execute(statement, params)
+                inserted += len(params)
+
+        return inserted
+
+    def copy_rows(self, db: Session, rows: List[dict]) -> int:
+        """
+        Load rows through COPY into a temp table and merge them (PostgreSQL)
+
+        Runs inside the session's transaction; the staging table is dropped
+        at commit. Like insert_rows, a Belvo ID already stored (under any
+        date) or repeated in rows is written once.
+
+        Args:
+            db: Database session on PostgreSQL (caller commits)
+            rows: Rows from build_rows
+
+        Returns:
+            Number of rows inserted
+        """
+        buffer = io.StringIO()
+        seen = set()
+        for row in rows:
+            if row["belvo_transaction_id"] not in seen:
+                seen.add(row["belvo_transaction_id"])
+                buffer.write("\t".join(_copy_value(row[column]) for column in INGEST_COLUMNS) + "\n")
+        buffer.seek(0)
+
+        columns = ", ".join(INGEST_COLUMNS)
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM transactions WITH NO DATA"
+            )
+            cursor.execute(f"TRUNCATE {STAGING_TABLE}")
+            cursor.copy_expert(f"COPY {STAGING_TABLE} ({columns}) FROM STDIN", buffer)
+            # The unique key includes transaction_date (partitioning), so
+            # ON CONFLICT alone would store a re-dated transaction twice
+            cursor.execute(
+                f"INSERT INTO transactions ({columns}) "
+                f"SELECT {columns} FROM {STAGING_TABLE} s "
+                f"WHERE NOT EXISTS ("
+                f"SELECT 1 FROM transactions t WHERE t.belvo_transaction_id = s.belvo_transaction_id"
+                f") "
+                f"ON CONFLICT (belvo_transaction_id, transaction_date) DO NOTHING"
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def ingest(
+        self,
+        db: Session,
+        user_id: int,
+        belvo_transactions: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+        progress_interval: int = 100
+    ) -> IngestResult:
+        """
+        Build and store Belvo transactions, picking the write path by size
+
+        Args:
+            db: Database session (caller commits)
+            user_id: Owner of the transactions
+            belvo_transactions: Transactions as returned by the Belvo API
+            progress: Called with (processed, total) while rows are built
+            progress_interval: Rows between progress calls
+
+        Returns:
+            Inserted/skipped counts, errors and the path used
+        """
+        rows, errors = self.build_rows(db, user_id, belvo_transactions, progress, progress_interval)
+        result = IngestResult(errors=errors)
+
+        if self.use_copy(db, len(rows)):
+            result.path = PATH_COPY
+            result.inserted = self.copy_rows(db, rows)
+        else:
+            result.inserted = self.insert_rows(db, rows)
+
+        result.skipped = len(rows) - result.inserted
+        logger.info(
+            f"Ingested {result.inserted} Belvo transactions for user {user_id} via {result.path} "
+            f"({result.skipped} already stored, {len(errors)} errors)"
+        )
+        return result
+
+
+# Singleton instance
+transaction_ingest_service = TransactionIngestService()
@@ -0,0 +1,149 @@
+"""
+Compare Belvo ingest write paths: batched executemany vs COPY + merge
+
+Builds --rows synthetic Belvo transactions once, then stores them for a
+fresh user through TransactionIngestService.insert_rows and (on
+PostgreSQL) copy_rows, timing row building and writing separately. A
+second pass over the same payload measures the all-duplicates case a
+re-sync hits, and a third moves every value_date by a day (a pending
+charge posting later); both must insert nothing. The schema is created
+with create_all in a scratch database.
+
+Usage:
+    python -m benchmarks.belvo_ingest --database-url postgresql://localhost/glass_bench --rows 100000
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.base import Base
+from app.models import BankAccount, Transaction, User
+from app.services.transaction_ingest import transaction_ingest_service, PATH_COPY, PATH_INSERT
+
+WORDS = ["pago", "compra", "cargo", "restaurante", "gasolina", "farmacia", "renta", "cafe", "super", "servicio"]
+
+
+def make_payload(rng: random.Random, prefix: str, rows: int, belvo_account_ids: list) -> list:
+    """Synthetic Belvo /transactions response"""
+    start = datetime(2022, 1, 1)
+    return [
+        {
+            "id": f"{prefix}-{i}",
+            "account": {"id": rng.choice(belvo_account_ids)},
+            "description": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i % 97}",
+            "merchant": {"name": f"COMERCIO {rng.randrange(1000)} MX"},
+            "amount": round(rng.uniform(-5000, 2000), 2),
+            "currency": "MXN",
+            "category": rng.choice((None, "Online Platforms & Leisure", "Food & Groceries")),
+            "reference": str(rng.randrange(10 ** 8)),
+            "value_date": (start + timedelta(minutes=9 * i)).isoformat() + "Z",
+        }
+        for i in range(rows)
+    ]
+
+
+def run(session_factory, rng: random.Random, path: str, rows: int, batch_size: int) -> dict:
+    """Ingest a fresh payload for a new user, then re-ingest it"""
+    db = session_factory()
+    user = User(email=f"ingest-{path}@example.com", full_name="Ingest Bench", hashed_password="x")
+    db.add(user)
+    db.commit()
+    belvo_account_ids = [f"{path}-acct-{i}" for i in range(3)]
+    db.add_all(
+        BankAccount(
+            user_id=user.id,
+            belvo_account_id=belvo_account_id,
+            account_name=belvo_account_id,
+            institution_name="Bench",
+            account_type="checking"
+        )
+        for belvo_account_id in belvo_account_ids
+    )
+    db.commit()
+    payload = make_payload(rng, path, rows, belvo_account_ids)
+
+    def write(built_rows):
+        if path == PATH_COPY:
+            return transaction_ingest_service.copy_rows(db, built_rows)
+        return transaction_ingest_service.insert_rows(db, built_rows, batch_size)
+
+    try:
+        started = time.perf_counter()
+        built_rows, errors = transaction_ingest_service.build_rows(db, user.id, payload)
+        built = time.perf_counter()
+        inserted = write(built_rows)
+        db.commit()
+        finished = time.perf_counter()
+
+        inserted_again = write(built_rows)
+        db.commit()
+        resync_seconds = time.perf_counter() - finished
+
+        inserted_redated = write([
+            {**row, "transaction_date": row["transaction_date"] + timedelta(days=1),
+             "value_date": row["value_date"] + timedelta(days=1)}
+            for row in built_rows
+        ])
+        db.commit()
+
+        stored = db.query(Transaction).filter(Transaction.user_id == user.id).count()
+    finally:
+        db.close()
+
+    write_seconds = finished - built
+    return {
+        "rows": rows,
+        "errors": len(errors),
+        "inserted": inserted,
+        "stored": stored,
+        "build_seconds": round(built - started, 3),
+        "write_seconds": round(write_seconds, 3),
+        "write_rows_per_second": round(inserted / write_seconds, 1),
+        "total_seconds": round(finished - started, 3),
+        "resync_inserted": inserted_again,
+        "resync_seconds": round(resync_seconds, 3),
+        "redated_resync_inserted": inserted_redated,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench_ingest.db",
+        help="Scratch database; all tables are dropped and recreated (COPY needs PostgreSQL)"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=settings.BELVO_INGEST_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    rng = random.Random(args.seed)
+
+    result = {
+        "database": engine.dialect.name,
+        "batch_size": args.batch_size,
+        PATH_INSERT: run(session_factory, rng, PATH_INSERT, args.rows, args.batch_size),
+    }
+    if engine.dialect.name == "postgresql":
+        result[PATH_COPY] = run(session_factory, rng, PATH_COPY, args.rows, args.batch_size)
+        result["copy_speedup"] = round(result[PATH_INSERT]["write_seconds"] / result[PATH_COPY]["write_seconds"], 2)
+    else:
+        result[PATH_COPY] = "skipped: COPY requires PostgreSQL"
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Measure transaction ingest throughput with categorization off vs on
+
+Replays the Belvo sync ingest path (merchant normalization, Transaction
+construction, insert + commit per chunk) over synthetic transactions, once
+without and once with CategorizationService.assign. The schema is created
+with create_all in a scratch database.
+
+Usage:
+    python -m benchmarks.categorization --rows 200000 --user-rules 200
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.base import Base
+from app.models import CategoryRule, Merchant, Transaction, User
+from app.services.categorization import categorization_service
+from app.services.merchants import MerchantDirectory
+
+CATEGORIES = ["food", "transport", "entertainment", "utilities", "shopping", "groceries", "health"]
+WORDS = ["pago", "compra", "cargo", "restaurante", "gasolina", "farmacia", "renta", "cafe", "super", "servicio"]
+
+
+def make_rows(rng: random.Random, rows: int, merchants: int) -> list:
+    """Synthetic Belvo-shaped transactions"""
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "id": f"bench-{i}",
+            "description": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i % 97}",
+            "merchant": {"name": f"COMERCIO {rng.randrange(merchants)} MX #{rng.randrange(1000)}"},
+            "amount": -round(rng.uniform(10, 5000), 2),
+            "value_date": start + timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ]
+
+
+def ingest(session_factory, user_id: int, rows: list, chunk: int, categorize: bool) -> dict:
+    """Run the ingest path over rows and return throughput"""
+    directory = MerchantDirectory()
+    db = session_factory()
+    started = time.perf_counter()
+    categorize_seconds = 0.0
+
+    try:
+        for first in range(0, len(rows), chunk):
+            batch = rows[first:first + chunk]
+            merchant_ids = directory.resolve_many(db, (r["merchant"]["name"] for r in batch))
+            transactions = [
+                Transaction(
+                    user_id=user_id,
+                    belvo_transaction_id=f"{user_id}-{r['id']}",
+                    description=r["description"],
+                    merchant_name=r["merchant"]["name"],
+                    merchant_id=merchant_ids.get(r["merchant"]["name"]),
+                    amount_cents=int(abs(r["amount"]) * 100),
+                    transaction_type="expense",
+                    transaction_date=r["value_date"],
+                    status="completed",
+                )
+                for r in batch
+            ]
+            if categorize:
+                categorize_started = time.perf_counter()
+                categorization_service.assign(db, user_id, transactions)
+                categorize_seconds += time.perf_counter() - categorize_started
+
+            db.add_all(transactions)
+            db.commit()
+
+        elapsed = time.perf_counter() - started
+        categorized = db.query(Transaction).filter(
+            Transaction.user_id == user_id,
+            Transaction.category_source == "rule"
+        ).count()
+    finally:
+        db.close()
+
+    return {
+        "rows": len(rows),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(len(rows) / elapsed, 1),
+        "categorize_seconds": round(categorize_seconds, 3),
+        "categorize_rows_per_second": round(len(rows) / categorize_seconds, 1) if categorize_seconds else None,
+        "categorized_rows": categorized,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench_categorization.db",
+        help="Scratch database; all tables are dropped and recreated"
+    )
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--merchants", type=int, default=2_000)
+    parser.add_argument("--user-rules", type=int, default=200, help="Learned merchant rules for the user")
+    parser.add_argument("--chunk", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    rng = random.Random(args.seed)
+
+    db = session_factory()
+    users = [User(email=f"bench{i}@example.com", full_name="Bench", hashed_password="x") for i in range(2)]
+    db.add_all(users)
+    db.commit()
+    user_ids = [user.id for user in users]
+
+    # Global keyword rules plus merchants with default categories
+    db.add_all(CategoryRule(keyword=word, category=rng.choice(CATEGORIES), source="curated") for word in WORDS[3:])
+    db.commit()
+    directory = MerchantDirectory()
+    names = [f"COMERCIO {i}" for i in range(args.merchants)]
+    merchant_ids = directory.resolve_many(db, names)
+    for merchant in db.query(Merchant).all():
+        if rng.random() < 0.5:
+            merchant.category = rng.choice(CATEGORIES)
+    for user_id in user_ids:
+        for name in rng.sample(names, min(args.user_rules, len(names))):
+            db.add(CategoryRule(
+                user_id=user_id,
+                merchant_id=merchant_ids[name],
+                category=rng.choice(CATEGORIES),
+                source="user_correction"
+            ))
+    db.commit()
+    db.close()
+
+    rows = make_rows(rng, args.rows, args.merchants)
+    off = ingest(session_factory, user_ids[0], rows, args.chunk, categorize=False)
+    categorization_service.invalidate()
+    on = ingest(session_factory, user_ids[1], rows, args.chunk, categorize=True)
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "merchants": args.merchants,
+        "user_rules": args.user_rules,
+        "chunk": args.chunk,
+        "categorization_off": off,
+        "categorization_on": on,
+        "overhead_pct": round((on["seconds"] - off["seconds"]) / off["seconds"] * 100, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+Seeded synthetic data for load tests and benchmarks
+
+Creates --users users, each with bank accounts, credit cards, --years of
+transactions (salary, recurring subscription charges and everyday
+spending), the matching subscriptions, alerts, suspicious charges and
+automation rules. Rows are written with multi-row INSERTs in batches, not
+through the ORM, so millions of transactions load in minutes. The same
+--seed always produces the same data, relative to today's date.
+
+Every user logs in as bench<N>@example.com with BENCH_PASSWORD and has a
+Belvo link ID (bench-link-<N>) for sync scenarios.
+
+Usage:
+    python -m benchmarks.datagen --database-url sqlite:////tmp/glass_bench.db --users 100 --years 3
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.base import Base
+from app.models import (
+    Alert,
+    AutomationRule,
+    BankAccount,
+    CreditCard,
+    Merchant,
+    Subscription,
+    SuspiciousCharge,
+    Transaction,
+    User,
+)
+from app.services.merchants import normalize_merchant_name
+
+BENCH_PASSWORD = "BenchPassword1!"
+INSERT_BATCH_SIZE = 5_000
+
+INSTITUTIONS = ["BBVA México", "Banorte", "Santander", "Citibanamex", "HSBC"]
+# (merchant, category, typical amount in MXN)
+SPENDING = [
+    ("OXXO", "groceries", 85), ("WALMART SUPERCENTER", "groceries", 950), ("SORIANA", "groceries", 700),
+    ("STARBUCKS", "food", 95), ("UBER EATS", "food", 280), ("RAPPI", "food", 310), ("VIPS", "food", 420),
+    ("UBER", "transport", 140), ("DIDI", "transport", 110), ("PEMEX", "transport", 800),
+    ("FARMACIA GUADALAJARA", "health", 260), ("LIVERPOOL", "shopping", 1500), ("AMAZON MX", "shopping", 620),
+    ("MERCADO LIBRE", "shopping", 540), ("CINEPOLIS", "entertainment", 230), ("CFE", "utilities", 480),
+    ("TELMEX", "utilities", 549), ("TOTALPLAY", "utilities", 599),
+]
+# (service, merchant, category, monthly amount in MXN)
+SUBSCRIPTIONS = [
+    ("Netflix", "NETFLIX.COM", "entertainment", 219), ("Spotify", "SPOTIFY", "entertainment", 129),
+    ("Disney+", "DISNEY PLUS", "entertainment", 179), ("Amazon Prime", "AMAZON PRIME", "shopping", 99),
+    ("YouTube Premium", "GOOGLE YOUTUBE", "entertainment", 139), ("iCloud", "APPLE.COM/BILL", "software", 49),
+    ("Smart Fit", "SMART FIT", "health", 499), ("Microsoft 365", "MICROSOFT", "software", 129),
+]
+ALERT_TYPES = [
+    ("suspicious_charge", "security", "high"), ("subscription_reminder", "payment", "medium"),
+    ("low_balance", "account", "high"), ("payment_due", "payment", "medium"), ("budget", "budget", "low"),
+]
+
+
+class Ids:
+    """Sequential primary keys per table, so rows can reference each other before insert"""
+
+    def __init__(self):
+        self._next: Dict[str, int] = {}
+
+    def next(self, table: str) -> int:
+        self._next[table] = self._next.get(table, 0) + 1
+        return self._next[table]
+
+
+def cents(rng: random.Random, typical: float) -> int:
+    """Amount around typical pesos, skewed like real spending"""
+    return max(100, int(rng.lognormvariate(0, 0.45) * typical * 100))
+
+
+def generate_user(rng: random.Random, ids: Ids, index: int, years: int, merchant_ids: Dict[str, int],
+                  hashed_password: str, today: date) -> Dict[str, List[dict]]:
+    """All rows of one user, keyed by table name"""
+    now = datetime.now(timezone.utc)
+    user_id = ids.next("users")
+    rows: Dict[str, List[dict]] = {name: [] for name in (
+        "users", "bank_accounts", "credit_cards", "transactions", "subscriptions",
+        "alerts", "suspicious_charges", "automation_rules",
+    )}
+    rows["users"].append({
+        "id": user_id,
+        "email": f"bench{index}@example.com",
+        "full_name": f"Bench User {index}",
+        "hashed_password": hashed_password,
+        "is_active": True,
+        "is_verified": True,
+        "belvo_link_id": f"bench-link-{index}",
+        "push_notifications": True,
+        "email_notifications": True,
+        "sms_notifications": False,
+        "unread_alerts_count": 0,
+    })
+
+    account_ids = []
+    for n in range(rng.randint(1, 3)):
+        account_id = ids.next("bank_accounts")
+        account_ids.append(account_id)
+        balance = rng.randint(500_00, 150_000_00)
+        rows["bank_accounts"].append({
+            "id": account_id,
+            "user_id": user_id,
+            "belvo_account_id": f"bench-{index}-acct-{n}",
+            "account_name": "Cuenta de ahorro" if n else "Cuenta de cheques",
+            "account_number": f"{rng.randrange(10000):04d}",
+            "account_type": "savings" if n else "checking",
+            "institution_name": rng.choice(INSTITUTIONS),
+            "currency": "MXN",
+            "current_balance_cents": balance,
+            "available_balance_cents": balance,
+            "is_active": True,
+            "is_primary": n == 0,
+            "last_synced_at": now,
+        })
+
+    card_ids = []
+    for n in range(rng.randint(0, 2)):
+        card_id = ids.next("credit_cards")
+        card_ids.append(card_id)
+        limit = rng.choice((20_000, 50_000, 80_000, 150_000)) * 100
+        balance = rng.randint(0, limit // 2)
+        rows["credit_cards"].append({
+            "id": card_id,
+            "user_id": user_id,
+            "card_name": f"Tarjeta {n + 1}",
+            "last_four_digits": f"{rng.randrange(10000):04d}",
+            "institution_name": rng.choice(INSTITUTIONS),
+            "card_type": rng.choice(("visa", "mastercard", "amex")),
+            "credit_limit_cents": limit,
+            "current_balance_cents": balance,
+            "available_credit_cents": limit - balance,
+            "billing_cycle_day": rng.randint(1, 28),
+            "payment_due_day": rng.randint(1, 28),
+            "minimum_payment_cents": balance // 20,
+            "is_active": True,
+        })
+
+    start = today - timedelta(days=365 * years)
+    sources = [("bank_account_id", a) for a in account_ids] + [("credit_card_id", c) for c in card_ids]
+
+    def add_transaction(day: date, description: str, merchant: str, category: str, amount_cents: int,
+                        transaction_type: str, source: tuple) -> int:
+        transaction_id = ids.next("transactions")
+        moment = datetime(day.year, day.month, day.day, rng.randint(7, 22), rng.randint(0, 59), tzinfo=timezone.utc)
+        rows["transactions"].append({
+            "id": transaction_id,
+            "user_id": user_id,
+            "bank_account_id": source[1] if source[0] == "bank_account_id" else None,
+            "credit_card_id": source[1] if source[0] == "credit_card_id" else None,
+            "belvo_transaction_id": f"bench-{index}-{transaction_id}",
+            "description": description,
+            "merchant_name": merchant,
+            "merchant_id": merchant_ids.get(merchant),
+            "category": category,
+            "category_source": "bank",
+            "amount_cents": amount_cents,
+            "currency": "MXN",
+            "transaction_type": transaction_type,
+            "reference": str(rng.randrange(10 ** 10)),
+            "transaction_date": moment,
+            "value_date": moment,
+            "status": "completed",
+            "created_at": moment,
+        })
+        return transaction_id
+
+    # Salary twice a month
+    salary = rng.randint(15_000, 90_000) * 100
+    day = start
+    while day <= today:
+        if day.day in (15, 28):
+            add_transaction(day, "DEPOSITO NOMINA", "NOMINA EMPRESA", "income", salary // 2, "income",
+                            ("bank_account_id", account_ids[0]))
+        # Everyday spending: about two purchases a day
+        for _ in range(rng.choices((0, 1, 2, 3, 4), weights=(2, 4, 5, 3, 1))[0]):
+            merchant, category, typical = rng.choice(SPENDING)
+            add_transaction(day, f"COMPRA {merchant}", merchant, category, cents(rng, typical), "expense",
+                            rng.choice(sources))
+        day += timedelta(days=1)
+
+    # Subscriptions with a monthly charge each since they started
+    for service, merchant, category, amount in rng.sample(SUBSCRIPTIONS, rng.randint(2, 6)):
+        first = start + timedelta(days=rng.randrange(max(1, (today - start).days - 60)))
+        billing_day = min(first.day, 28)
+        source = rng.choice(sources)
+        charge = date(first.year, first.month, billing_day)
+        last = None
+        while charge <= today:
+            add_transaction(charge, f"CARGO RECURRENTE {merchant}", merchant, category, amount * 100, "expense", source)
+            last = charge
+            charge = (charge.replace(day=1) + timedelta(days=32)).replace(day=billing_day)
+        rows["subscriptions"].append({
+            "id": ids.next("subscriptions"),
+            "user_id": user_id,
+            "service_name": service,
+            "merchant_name": merchant,
+            "merchant_id": merchant_ids.get(merchant),
+            "category": category,
+            "amount_cents": amount * 100,
+            "currency": "MXN",
+            "billing_frequency": "monthly",
+            "billing_day": billing_day,
+            "first_charge_date": first,
+            "last_charge_date": last,
+            "next_charge_date": charge,
+            "is_active": rng.random() < 0.85,
+            "auto_detected": True,
+            "user_confirmed": rng.random() < 0.5,
+            "alert_before_charge": True,
+            "alert_days_before": 3,
+        })
+
+    # Suspicious charges on a few large purchases, each with an alert
+    expenses = [t for t in rows["transactions"] if t["transaction_type"] == "expense"]
+    for transaction in rng.sample(expenses, min(len(expenses), rng.randint(0, 5))):
+        rows["suspicious_charges"].append({
+            "id": ids.next("suspicious_charges"),
+            "user_id": user_id,
+            "transaction_id": transaction["id"],
+            "merchant_name": transaction["merchant_name"],
+            "amount_cents": transaction["amount_cents"],
+            "currency": "MXN",
+            "charge_date": transaction["transaction_date"],
+            "suspicion_type": rng.choice(("unusual_amount", "unusual_merchant", "duplicate_charge")),
+            "confidence_score": round(rng.uniform(0.5, 0.99), 2),
+            "reason": "Monto inusual para este comercio",
+            "status": rng.choice(("pending", "confirmed_legitimate", "dismissed")),
+            "alert_sent": True,
+        })
+
+    # Alerts spread over the last year, most of them read
+    for _ in range(rng.randint(10, 60)):
+        alert_type, category, priority = rng.choice(ALERT_TYPES)
+        created = now - timedelta(minutes=rng.randrange(365 * 24 * 60))
+        is_read = rng.random() < 0.8
+        is_dismissed = is_read and rng.random() < 0.3
+        rows["alerts"].append({
+            "id": ids.next("alerts"),
+            "user_id": user_id,
+            "alert_type": alert_type,
+            "title": alert_type.replace("_", " ").capitalize(),
+            "message": "Alerta generada para pruebas de carga",
+            "priority": priority,
+            "category": category,
+            "is_read": is_read,
+            "is_dismissed": is_dismissed,
+            "read_at": created if is_read else None,
+            "dismissed_at": created if is_dismissed else None,
+            "requires_action": False,
+            "action_taken": False,
+            "push_sent": True,
+            "email_sent": False,
+            "sms_sent": False,
+            "created_at": created,
+        })
+    rows["users"][0]["unread_alerts_count"] = sum(
+        1 for a in rows["alerts"] if not a["is_read"] and not a["is_dismissed"]
+    )
+
+    for n in range(rng.randint(0, 3)):
+        rows["automation_rules"].append({
+            "id": ids.next("automation_rules"),
+            "user_id": user_id,
+            "rule_name": f"Alerta de saldo {n + 1}",
+            "rule_type": "balance_threshold",
+            "description": "Avisar cuando el saldo baje del umbral",
+            "trigger_conditions": {"account_id": account_ids[0], "threshold": rng.choice((1000, 5000, 10000))},
+            "threshold_account_id": account_ids[0],
+            "action_config": {"notify": True},
+            "is_active": True,
+            "require_confirmation": True,
+            "execution_count": 0,
+            "failure_count": 0,
+        })
+
+    return rows
+
+
+def insert_rows(engine: Engine, model, rows: Iterable[dict]) -> None:
+    """Multi-row INSERT in batches of INSERT_BATCH_SIZE"""
+    rows = list(rows)
+    with engine.begin() as conn:
+        for first in range(0, len(rows), INSERT_BATCH_SIZE):
+            conn.execute(insert(model.__table__), rows[first:first + INSERT_BATCH_SIZE])
+
+
+def reset_sequences(engine: Engine, models: list) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted keys"""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for model in models:
+            table = model.__tablename__
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+            ))
+
+
+def generate(engine: Engine, users: int, years: int, seed: int, users_per_batch: int = 50) -> dict:
+    """
+    Fill an empty schema with synthetic users
+
+    Args:
+        engine: Engine of a database with the schema created and no rows
+        users: Number of users
+        years: Years of transaction history per user
+        seed: Random seed; the same seed gives the same data
+        users_per_batch: Users generated before their rows are written
+
+    Returns:
+        Row counts per table and elapsed seconds
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    ids = Ids()
+    today = date.today()
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+
+    names = sorted({m for m, _, _ in SPENDING} | {m for _, m, _, _ in SUBSCRIPTIONS} | {"NOMINA EMPRESA"})
+    merchants = [
+        {"id": i, "name": name, "normalized_key": normalize_merchant_name(name), "match_prefix": False}
+        for i, name in enumerate(names, start=1)
+    ]
+    insert_rows(engine, Merchant, merchants)
+    merchant_ids = {m["name"]: m["id"] for m in merchants}
+
+    # Parents before children
+    order = [
+        (User, "users"), (BankAccount, "bank_accounts"), (CreditCard, "credit_cards"),
+        (Transaction, "transactions"), (Subscription, "subscriptions"), (Alert, "alerts"),
+        (SuspiciousCharge, "suspicious_charges"), (AutomationRule, "automation_rules"),
+    ]
+    counts = {"merchants": len(merchants)}
+    for first in range(0, users, users_per_batch):
+        batch = [
+            generate_user(rng, ids, index, years, merchant_ids, hashed_password, today)
+            for index in range(first, min(first + users_per_batch, users))
+        ]
+        for model, table in order:
+            table_rows = [row for user_rows in batch for row in user_rows[table]]
+            insert_rows(engine, model, table_rows)
+            counts[table] = counts.get(table, 0) + len(table_rows)
+
+    reset_sequences(engine, [Merchant] + [model for model, _ in order])
+    return {"rows": counts, "seconds": round(time.perf_counter() - started, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench.db",
+        help="Scratch database; all tables are dropped and recreated"
+    )
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    result = generate(engine, args.users, args.years, args.seed)
+    print(json.dumps({"database": engine.dialect.name, "users": args.users, "years": args.years,
+                      "seed": args.seed, **result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Export a large transaction set through the streaming exporter and track RSS
+
+Loads --rows synthetic transactions for one user into a scratch database,
+then drains TransactionExportService output (CSV, NDJSON, Parquet or Arrow
+IPC) into a byte
+counter while sampling resident memory. Flat RSS across checkpoints means
+memory does not grow with row count. --naive adds the old approach
+(load every ORM row with .all()) for contrast.
+
+Usage:
+    python -m benchmarks.export --rows 1000000 --format csv
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.base import Base
+from app.models import Transaction, User
+from app.services.export import transaction_export_service, COLUMNAR_BATCH_SIZE, COLUMNAR_FORMATS, EXPORT_BATCH_SIZE
+
+CHECKPOINTS = (0.1, 0.25, 0.5, 0.75, 1.0)
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        # Peak RSS; KB on Linux, bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load(engine, session_factory, rows: int, chunk: int, seed: int) -> int:
+    """Create the schema and insert rows for one user; returns the user ID"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    db = session_factory()
+    user = User(email="export@example.com", full_name="Export Bench", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    statement = insert(Transaction.__table__)
+    with engine.begin() as conn:
+        for first in range(0, rows, chunk):
+            conn.execute(statement, [
+                {
+                    "user_id": user_id,
+                    "description": f"Compra {i % 997} en comercio",
+                    "merchant_name": f"Comercio {i % 503}",
+                    "category": rng.choice(("food", "transport", "shopping", "utilities")),
+                    "amount_cents": rng.randrange(100, 500_000),
+                    "currency": "MXN",
+                    "transaction_type": "expense" if i % 7 else "income",
+                    "transaction_date": start + timedelta(minutes=i),
+                    "status": "completed",
+                }
+                for i in range(first, min(first + chunk, rows))
+            ])
+    return user_id
+
+
+def run_stream(session_factory, user_id: int, rows: int, fmt: str, batch_size: int) -> dict:
+    """Drain the exporter, sampling RSS at row-count checkpoints"""
+    criteria = [Transaction.user_id == user_id]
+    batches = transaction_export_service.iter_batches(session_factory, criteria, batch_size)
+
+    exported = 0
+
+    def counting(source):
+        nonlocal exported
+        for batch in source:
+            exported += len(batch)
+            yield batch
+
+    encoders = {
+        "csv": transaction_export_service.stream_csv,
+        "ndjson": transaction_export_service.stream_ndjson,
+        "parquet": transaction_export_service.stream_parquet,
+        "arrow": transaction_export_service.stream_arrow,
+    }
+    stream = encoders[fmt](counting(batches))
+
+    checkpoints = iter(CHECKPOINTS)
+    next_checkpoint = next(checkpoints)
+    samples = []
+    total_bytes = 0
+    baseline = rss_mb()
+    started = time.perf_counter()
+
+    for chunk in stream:
+        total_bytes += len(chunk.encode() if isinstance(chunk, str) else chunk)
+        while next_checkpoint is not None and exported >= rows * next_checkpoint:
+            samples.append({"rows": exported, "rss_mb": round(rss_mb(), 1)})
+            next_checkpoint = next(checkpoints, None)
+
+    elapsed = time.perf_counter() - started
+    peak = max(sample["rss_mb"] for sample in samples) if samples else baseline
+    return {
+        "rows": exported,
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(exported / elapsed, 1) if elapsed else None,
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_growth_mb": round(peak - baseline, 1),
+        "rss_by_rows": samples,
+    }
+
+
+def run_naive(session_factory, user_id: int) -> dict:
+    """Load every row as an ORM object, as paging /transactions would server-side"""
+    db = session_factory()
+    baseline = rss_mb()
+    started = time.perf_counter()
+    try:
+        loaded = db.query(Transaction).filter(Transaction.user_id == user_id).all()
+        count = len(loaded)
+        peak = rss_mb()
+    finally:
+        db.close()
+    return {
+        "rows": count,
+        "seconds": round(time.perf_counter() - started, 3),
+        "peak_rss_growth_mb": round(peak - baseline, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench_export.db",
+        help="Scratch database; all tables are dropped and recreated"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("csv", "ndjson", "parquet", "arrow"), default="csv")
+    parser.add_argument("--batch-size", type=int, default=None, help="Defaults to the exporter's size for the format")
+    parser.add_argument("--chunk", type=int, default=10_000, help="Rows per insert during setup")
+    parser.add_argument("--skip-setup", action="store_true", help="Reuse rows from a previous run")
+    parser.add_argument("--naive", action="store_true", help="Also measure loading all rows with .all()")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.batch_size is None:
+        args.batch_size = COLUMNAR_BATCH_SIZE if args.format in COLUMNAR_FORMATS else EXPORT_BATCH_SIZE
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine)
+
+    if args.skip_setup:
+        db = session_factory()
+        user_id = db.query(User.id).filter(User.email == "export@example.com").scalar()
+        db.close()
+        setup_seconds = None
+    else:
+        setup_started = time.perf_counter()
+        user_id = load(engine, session_factory, args.rows, args.chunk, args.seed)
+        setup_seconds = round(time.perf_counter() - setup_started, 1)
+
+    result = {
+        "database": engine.dialect.name,
+        "format": args.format,
+        "batch_size": args.batch_size,
+        "setup_seconds": setup_seconds,
+        "streaming": run_stream(session_factory, user_id, args.rows, args.format, args.batch_size),
+    }
+    if args.naive:
+        result["naive_all"] = run_naive(session_factory, user_id)
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
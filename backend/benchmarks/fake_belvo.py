@@ -0,0 +1,328 @@
+"""
+Local stand-in for the Belvo API, for offline sync benchmarks
+
+Implements the endpoints belvo-python calls for Links, Accounts,
+Transactions, Balances, Owners and Institutions. Data is generated from
+the link ID and --seed, so a repeated or overlapping sync sees exactly the
+same rows again (the incremental/duplicate path), and list endpoints page
+like Belvo's ({"count", "next", "previous", "results"}).
+
+Latency (with jitter) and error injection apply to every call except the
+login check. An injected error returns error_status with a Belvo-style
+error body. GET /_stats reports calls and injected errors per endpoint.
+
+Run it standalone and point the app at it:
+    python -m benchmarks.fake_belvo --port 9000 --latency-ms 150 --error-rate 0.05
+    BELVO_ENVIRONMENT=http://127.0.0.1:9000 uvicorn app.main:app
+
+Links named bench-link-<n> (see benchmarks.datagen) map their accounts to
+the ones already generated for that user.
+"""
+import argparse
+import asyncio
+import random
+import socket
+import threading
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+import uvicorn
+from fastapi import Body, FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+MAX_PAGE_SIZE = 1000  # Belvo's limit for page_size
+MERCHANTS = ["OXXO", "WALMART SUPERCENTER", "STARBUCKS", "UBER", "NETFLIX.COM", "PEMEX", "AMAZON MX"]
+CATEGORIES = [None, "Food & Groceries", "Online Platforms & Leisure", "Transport & Travel", "Shopping"]
+INSTITUTION_COUNTRIES = ["MX", "MX", "MX", "BR", "CO"]
+ERROR_CODES = {429: "too_many_sessions", 500: "unexpected_error", 503: "service_unavailable", 504: "institution_down"}
+
+
+@dataclass
+class FakeBelvoConfig:
+    """Size, speed and reliability of the fake API"""
+    seed: int = 42
+    accounts_per_link: int = 2
+    transactions_per_day: int = 3
+    institutions: int = 60
+    page_size: int = 100  # Default page size of list endpoints
+    latency_ms: float = 0.0  # Added to every call
+    latency_jitter_ms: float = 0.0  # Uniform extra latency up to this
+    error_rate: float = 0.0  # Fraction of calls answered with error_status
+    error_status: int = 503
+
+
+def account_ids(link: str, count: int) -> List[str]:
+    """Belvo account IDs of a link; bench-link-<n> maps to benchmarks.datagen's accounts"""
+    prefix = f"bench-{link.rsplit('-', 1)[-1]}" if link.startswith("bench-link-") else link
+    return [f"{prefix}-acct-{n}" for n in range(count)]
+
+
+def create_app(config: Optional[FakeBelvoConfig] = None) -> FastAPI:
+    config = config or FakeBelvoConfig()
+    app = FastAPI()
+    calls: Counter = Counter()
+    injected: Counter = Counter()
+    links = {}
+    fault_rng = random.Random(config.seed)
+
+    def rng_for(*key) -> random.Random:
+        return random.Random("-".join(str(part) for part in (config.seed, *key)))
+
+    @app.middleware("http")
+    async def latency_and_errors(request: Request, call_next):
+        endpoint = f"{request.method} {request.url.path}"
+        if request.url.path in ("/api/", "/_stats"):
+            return await call_next(request)
+
+        calls[endpoint] += 1
+        delay = config.latency_ms + fault_rng.uniform(0, config.latency_jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if config.error_rate and fault_rng.random() < config.error_rate:
+            injected[endpoint] += 1
+            code = ERROR_CODES.get(config.error_status, "unexpected_error")
+            return JSONResponse(
+                [{"code": code, "message": "Injected by fake Belvo", "request_id": uuid.uuid4().hex}],
+                status_code=config.error_status,
+            )
+        return await call_next(request)
+
+    def paginate(request: Request, items: list, page: int, page_size: Optional[int]) -> dict:
+        size = min(page_size or config.page_size, MAX_PAGE_SIZE)
+        first = (page - 1) * size
+        url = request.url.remove_query_params("page")
+        return {
+            "count": len(items),
+            "next": str(url.include_query_params(page=page + 1)) if first + size < len(items) else None,
+            "previous": str(url.include_query_params(page=page - 1)) if page > 1 else None,
+            "results": items[first:first + size],
+        }
+
+    def link_data(link_id: str) -> dict:
+        if link_id in links:
+            return links[link_id]
+        created = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=rng_for(link_id).randrange(10 ** 5))
+        return {
+            "id": link_id,
+            "institution": "banorte_mx_retail",
+            "access_mode": "recurrent",
+            "status": "valid",
+            "created_at": created.isoformat(),
+            "last_accessed_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def accounts_for(link: str) -> List[dict]:
+        accounts = []
+        for n, account_id in enumerate(account_ids(link, config.accounts_per_link)):
+            rng = rng_for(link, account_id)
+            current = round(rng.uniform(1_000, 90_000), 2)
+            accounts.append({
+                "id": account_id,
+                "link": link,
+                "institution": {"name": "Banorte", "type": "bank"},
+                "collected_at": datetime.now(timezone.utc).isoformat(),
+                "category": "SAVINGS_ACCOUNT" if n else "CHECKING_ACCOUNT",
+                "type": "savings" if n else "checking",
+                "name": "Cuenta de ahorro" if n else "Cuenta de cheques",
+                "number": f"{rng.randrange(10 ** 10):010d}",
+                "currency": "MXN",
+                "balance": {"current": current, "available": round(current * rng.uniform(0.8, 1.0), 2)},
+            })
+        return accounts
+
+    def transactions_for(link: str, date_from: date, date_to: date, account: Optional[str] = None) -> List[dict]:
+        accounts = account_ids(link, config.accounts_per_link)
+        rows = []
+        day = date_from
+        while day <= date_to:
+            rng = rng_for(link, day)
+            for n in range(config.transactions_per_day):
+                merchant = rng.choice(MERCHANTS)
+                account_id = rng.choice(accounts)
+                income = rng.random() < 0.1
+                row = {
+                    "id": f"{link}-{day}-{n}",
+                    "account": {"id": account_id},
+                    "collected_at": datetime.now(timezone.utc).isoformat(),
+                    "value_date": datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc).isoformat(),
+                    "accounting_date": datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc).isoformat(),
+                    "description": "DEPOSITO" if income else f"COMPRA {merchant}",
+                    "merchant": None if income else {"name": merchant},
+                    "amount": round(rng.uniform(500, 20_000), 2) if income else -round(rng.uniform(20, 2_500), 2),
+                    "currency": "MXN",
+                    "category": None if income else rng.choice(CATEGORIES),
+                    "reference": str(rng.randrange(10 ** 8)),
+                    "type": "INFLOW" if income else "OUTFLOW",
+                    "status": "PROCESSED",
+                }
+                if account is None or account == account_id:
+                    rows.append(row)
+            day += timedelta(days=1)
+        return rows
+
+    def date_range(payload: dict, default_days: int = 90) -> tuple:
+        date_to = date.fromisoformat(payload["date_to"]) if payload.get("date_to") else date.today()
+        date_from = date.fromisoformat(payload["date_from"]) if payload.get("date_from") else date_to - timedelta(days=default_days)
+        return date_from, date_to
+
+    # belvo-python's login check
+    @app.get("/api/")
+    def root():
+        return {}
+
+    @app.get("/_stats")
+    def stats():
+        return {"config": asdict(config), "calls": dict(calls), "injected_errors": dict(injected)}
+
+    # Links
+    @app.post("/api/links/", status_code=201)
+    def create_link(payload: dict = Body(...)):
+        link_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{payload.get('institution')}/{payload.get('username')}"))
+        links[link_id] = {**link_data(link_id), "institution": payload.get("institution")}
+        return links[link_id]
+
+    @app.get("/api/links/")
+    def list_links(request: Request, page: int = 1, page_size: Optional[int] = None):
+        return paginate(request, list(links.values()), page, page_size)
+
+    @app.get("/api/links/{link_id}/")
+    def get_link(link_id: str):
+        return link_data(link_id)
+
+    @app.delete("/api/links/{link_id}/", status_code=204)
+    def delete_link(link_id: str):
+        links.pop(link_id, None)
+        return Response(status_code=204)
+
+    # Accounts
+    @app.post("/api/accounts/", status_code=201)
+    def create_accounts(payload: dict = Body(...)):
+        return accounts_for(payload["link"])
+
+    @app.get("/api/accounts/")
+    def list_accounts(request: Request, link: str, page: int = 1, page_size: Optional[int] = None):
+        return paginate(request, accounts_for(link), page, page_size)
+
+    # Transactions
+    @app.post("/api/transactions/", status_code=201)
+    def create_transactions(payload: dict = Body(...)):
+        date_from, date_to = date_range(payload)
+        return transactions_for(payload["link"], date_from, date_to, payload.get("account"))
+
+    @app.get("/api/transactions/")
+    def list_transactions(request: Request, link: str, page: int = 1, page_size: Optional[int] = None,
+                          value_date__gte: Optional[str] = None, value_date__lte: Optional[str] = None):
+        date_from, date_to = date_range({"date_from": value_date__gte, "date_to": value_date__lte})
+        return paginate(request, transactions_for(link, date_from, date_to), page, page_size)
+
+    # Balances: one snapshot per account per day
+    @app.post("/api/balances/", status_code=201)
+    def create_balances(payload: dict = Body(...)):
+        date_from, date_to = date_range(payload, default_days=0)
+        balances = []
+        for account in accounts_for(payload["link"]):
+            if payload.get("account") and payload["account"] != account["id"]:
+                continue
+            day = date_from
+            while day <= date_to:
+                balance = round(account["balance"]["current"] * rng_for(account["id"], day).uniform(0.7, 1.3), 2)
+                balances.append({
+                    "id": f"{account['id']}-{day}",
+                    "account": {"id": account["id"]},
+                    "value_date": day.isoformat(),
+                    "current_balance": balance,
+                    "balance": balance,
+                    "currency": "MXN",
+                })
+                day += timedelta(days=1)
+        return balances
+
+    # Owners
+    @app.post("/api/owners/", status_code=201)
+    def create_owners(payload: dict = Body(...)):
+        rng = rng_for(payload["link"], "owner")
+        return [{
+            "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"owner/{payload['link']}")),
+            "internal_identification": str(rng.randrange(10 ** 6)),
+            "display_name": f"Titular {rng.randrange(1000)}",
+            "email": f"titular{rng.randrange(1000)}@example.com",
+            "phone_number": f"+52 55 {rng.randrange(10 ** 8):08d}",
+            "address": "Av. Reforma 222, CDMX",
+            "document_id": {"document_type": "CURP", "document_number": f"BENC{rng.randrange(10 ** 6):06d}"},
+        }]
+
+    # Institutions
+    @app.get("/api/institutions/")
+    def list_institutions(request: Request, page: int = 1, page_size: Optional[int] = None):
+        institutions = []
+        for n in range(config.institutions):
+            country = INSTITUTION_COUNTRIES[n % len(INSTITUTION_COUNTRIES)]
+            institutions.append({
+                "id": n + 1,
+                "name": f"bank{n}_{country.lower()}_retail",
+                "display_name": f"Bank {n}",
+                "type": "bank",
+                "website": f"https://bank{n}.example.com",
+                "country": country,
+                "country_code": country,
+                "country_codes": [country],
+                "primary_color": "#056dae",
+                "logo": None,
+                "status": "healthy",
+                "form_fields": [{"name": "username", "type": "text"}, {"name": "password", "type": "password"}],
+            })
+        return paginate(request, institutions, page, page_size)
+
+    return app
+
+
+class FakeBelvoServer:
+    """Runs the fake API with uvicorn in a background thread"""
+
+    def __init__(self, app: FastAPI, host: str = "127.0.0.1", port: int = 0):
+        if not port:
+            with socket.socket() as sock:
+                sock.bind((host, 0))
+                port = sock.getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        self._server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, name="fake-belvo", daemon=True)
+
+    def __enter__(self) -> "FakeBelvoServer":
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Fake Belvo server failed to start")
+            self._thread.join(0.05)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser, prefix: str = "") -> None:
+    """Command-line options for every FakeBelvoConfig field"""
+    defaults = FakeBelvoConfig()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f"--{prefix}{name.replace('_', '-')}", dest=f"{prefix.replace('-', '_')}{name}",
+                            type=type(value), default=value)
+
+
+def config_from_arguments(args: argparse.Namespace, prefix: str = "") -> FakeBelvoConfig:
+    return FakeBelvoConfig(**{name: getattr(args, f"{prefix.replace('-', '_')}{name}") for name in asdict(FakeBelvoConfig())})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(config_from_arguments(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Load-test scenarios against the real FastAPI application
+
+Virtual users (--concurrency of them) log in as users created by
+benchmarks.datagen and loop over the chosen scenarios for --duration
+seconds. Each request step is timed; the report gives p50/p95/p99
+latency and throughput per step as JSON. Pass an earlier report as
+--baseline to add the change of each step against it.
+Options prefixed --belvo- configure the fake Belvo (size, latency, errors).
+
+By default the app runs in-process (httpx ASGI transport) on
+--database-url, with Belvo calls going to benchmarks.fake_belvo. The
+client shares the process with the app, so compare runs made the same
+way. With --base-url a running server is driven instead; it must use the
+same database, and its BELVO_ENVIRONMENT must point at a fake Belvo for
+the sync scenario.
+
+Scenarios:
+    login      POST /auth/login
+    dashboard  profile, account/card/alert/subscription summaries, unread count
+    paging     first --pages pages of /transactions
+    analytics  /transactions/analytics for 30 and 365 days
+    sync       /belvo/sync/all against the fake Belvo (writes)
+
+Usage:
+    python -m benchmarks.datagen --database-url sqlite:////tmp/glass_bench.db --users 50
+    python -m benchmarks.load --database-url sqlite:////tmp/glass_bench.db --users 50 --concurrency 16 > base.json
+    python -m benchmarks.load --database-url sqlite:////tmp/glass_bench.db --users 50 --concurrency 16 --baseline base.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from typing import Dict, List, Optional
+import httpx
+from app.core.config import settings
+from benchmarks.fake_belvo import FakeBelvoServer, add_config_arguments, config_from_arguments, create_app as create_fake_belvo
+
+API = "/api/v1"
+SCENARIOS = ("login", "dashboard", "paging", "analytics", "sync")
+
+
+class Recorder:
+    """Latencies and failures per request step"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, step: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        self.latencies[step].append(time.perf_counter() - started)
+        if response is None or response.status_code >= 400:
+            self.errors[step] += 1
+        return response
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    steps = {}
+    for step, values in sorted(recorder.latencies.items()):
+        values = sorted(values)
+        steps[step] = {
+            "requests": len(values),
+            "errors": recorder.errors[step],
+            "throughput_rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+            "mean_ms": round(statistics.fmean(values) * 1000, 1),
+            "max_ms": round(values[-1] * 1000, 1),
+        }
+    requests = sum(step["requests"] for step in steps.values())
+    return {
+        "seconds": round(elapsed, 1),
+        "requests": requests,
+        "errors": sum(step["errors"] for step in steps.values()),
+        "throughput_rps": round(requests / elapsed, 1),
+        "steps": steps,
+    }
+
+
+def compare(report: dict, baseline: dict) -> dict:
+    """Percent change of latency and throughput per step against a baseline report"""
+    changes = {}
+    for step, current in report["steps"].items():
+        previous = baseline.get("steps", {}).get(step)
+        if not previous:
+            continue
+        changes[step] = {
+            key: round((current[key] - previous[key]) / previous[key] * 100, 1) if previous[key] else None
+            for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+        }
+    return changes
+
+
+async def login(client: httpx.AsyncClient, recorder: Optional[Recorder], index: int, password: str) -> Optional[str]:
+    payload = {"email": f"bench{index}@example.com", "password": password}
+    if recorder is None:
+        response = await client.post(f"{API}/auth/login", json=payload)
+    else:
+        response = await recorder.request(client, "login", "POST", f"{API}/auth/login", json=payload)
+    if response is None or response.status_code != 200:
+        return None
+    return response.json()["access_token"]
+
+
+async def run_scenario(name: str, client: httpx.AsyncClient, recorder: Recorder, index: int,
+                       token: str, args) -> None:
+    headers = {"Authorization": f"Bearer {token}"}
+
+    if name == "login":
+        await login(client, recorder, index, args.password)
+    elif name == "dashboard":
+        for step, path in (
+            ("dashboard.me", "/users/me"),
+            ("dashboard.accounts", "/accounts/summary"),
+            ("dashboard.cards", "/cards/summary"),
+            ("dashboard.alerts", "/alerts/summary"),
+            ("dashboard.subscriptions", "/subscriptions/summary"),
+            ("dashboard.unread", "/alerts/unread-count"),
+        ):
+            await recorder.request(client, step, "GET", API + path, headers=headers)
+    elif name == "paging":
+        for page in range(1, args.pages + 1):
+            await recorder.request(
+                client, "paging.transactions", "GET", f"{API}/transactions/",
+                params={"page": page, "page_size": 50}, headers=headers
+            )
+    elif name == "analytics":
+        for days in (30, 365):
+            await recorder.request(
+                client, f"analytics.{days}d", "GET", f"{API}/transactions/analytics",
+                params={"days": days}, headers=headers
+            )
+    elif name == "sync":
+        await recorder.request(client, "sync.all", "POST", f"{API}/belvo/sync/all", headers=headers)
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, rng: random.Random, tokens: Dict[int, str],
+                       scenarios: List[str], deadline: float, args) -> None:
+    while time.perf_counter() < deadline:
+        index = rng.randrange(args.users)
+        await run_scenario(rng.choice(scenarios), client, recorder, index, tokens[index], args)
+
+
+async def run(args, base_url: str, transport: Optional[httpx.AsyncBaseTransport]) -> dict:
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    scenarios = args.scenarios.split(",")
+
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, timeout=120) as client:
+        # Sign every user in before the clock starts; password hashing would dominate otherwise
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def sign_in(index: int) -> Optional[str]:
+            async with semaphore:
+                return await login(client, None, index, args.password)
+
+        tokens = dict(enumerate(await asyncio.gather(*(sign_in(index) for index in range(args.users)))))
+        missing = [index for index, token in tokens.items() if token is None]
+        if missing:
+            raise SystemExit(f"bench{missing[0]}@example.com cannot log in; run benchmarks.datagen with --users >= {args.users}")
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            virtual_user(client, recorder, random.Random(rng.random()), tokens, scenarios, deadline, args)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    return summarize(recorder, elapsed)
+
+
+async def run_in_process(args) -> dict:
+    """Run against the app imported here, on the scratch database"""
+    from app.main import app
+
+    with contextlib.ExitStack() as stack:
+        if "sync" in args.scenarios.split(","):
+            fake_belvo = stack.enter_context(FakeBelvoServer(create_fake_belvo(config_from_arguments(args, "belvo-"))))
+            settings.BELVO_ENVIRONMENT = fake_belvo.url
+        async with app.router.lifespan_context(app):
+            return await run(args, "http://bench", httpx.ASGITransport(app=app))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench.db",
+        help="Database filled by benchmarks.datagen (sync writes to it)"
+    )
+    parser.add_argument("--base-url", help="Drive a running server instead of the in-process app")
+    parser.add_argument("--users", type=int, default=50, help="Generated users to spread the load over")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds")
+    parser.add_argument("--pages", type=int, default=5, help="Transaction pages per paging scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="Earlier report to compare against")
+    # Fake Belvo used by the in-process sync scenario (--belvo-latency-ms, --belvo-error-rate, ...)
+    add_config_arguments(parser, prefix="belvo-")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    if args.database_url == settings.DATABASE_URL and "sync" in args.scenarios.split(","):
+        raise SystemExit("Refusing to sync fake data into the application database; pass a scratch --database-url")
+
+    if not args.base_url:
+        # The engine is created from settings when app.db is first imported
+        # (benchmarks.datagen included), so point it at the scratch database first
+        settings.DATABASE_URL = args.database_url
+        settings.DATABASE_POOL_SIZE = max(settings.DATABASE_POOL_SIZE, args.concurrency)
+    from benchmarks.datagen import BENCH_PASSWORD
+    args.password = BENCH_PASSWORD
+
+    if args.base_url:
+        report = asyncio.run(run(args, args.base_url, None))
+    else:
+        report = asyncio.run(run_in_process(args))
+
+    report = {
+        "target": args.base_url or "in-process",
+        "database": args.database_url.split(":", 1)[0],
+        "scenarios": args.scenarios.split(","),
+        "concurrency": args.concurrency,
+        "users": args.users,
+        "seed": args.seed,
+        **({"fake_belvo": asdict(config_from_arguments(args, "belvo-"))} if "sync" in args.scenarios.split(",") else {}),
+        **report,
+    }
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["change_pct"] = compare(report, json.load(f))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
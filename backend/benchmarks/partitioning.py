@@ -0,0 +1,201 @@
+"""
+Compare transaction list/analytics latency on a plain vs a monthly
+range-partitioned table (PostgreSQL only)
+
+Both tables are generated server-side with generate_series inside a scratch
+"bench" schema, so 50M rows load in minutes without touching app data.
+
+Usage:
+    python -m benchmarks.partitioning --rows 50000000 --users 10000 --months 36
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date
+from sqlalchemy import create_engine, text
+from app.core.config import settings
+from app.db.partitioning import month_start
+
+SCHEMA = "bench"
+
+LIST_SQL = """
+SELECT id, description, amount, transaction_date
+FROM {table}
+WHERE user_id = :user_id
+  AND transaction_date >= :date_from AND transaction_date < :date_to
+ORDER BY transaction_date DESC
+LIMIT 50
+"""
+
+ANALYTICS_SQL = """
+SELECT category, transaction_type, SUM(amount), COUNT(*)
+FROM {table}
+WHERE user_id = :user_id
+  AND transaction_date >= :date_from AND transaction_date < :date_to
+GROUP BY category, transaction_type
+"""
+
+COLUMNS_DDL = """
+    id BIGINT NOT NULL,
+    user_id INTEGER NOT NULL,
+    description VARCHAR NOT NULL,
+    merchant_name VARCHAR,
+    category VARCHAR,
+    amount DOUBLE PRECISION NOT NULL,
+    transaction_type VARCHAR NOT NULL,
+    transaction_date TIMESTAMP WITH TIME ZONE NOT NULL
+"""
+
+GENERATE_SQL = """
+INSERT INTO {table}
+SELECT g,
+       (g % :users) + 1,
+       'Compra ' || (g % 997),
+       'Comercio ' || (g % 503),
+       (ARRAY['food', 'transport', 'entertainment', 'utilities', 'shopping'])[(g % 5) + 1],
+       round((random() * 2000)::numeric, 2),
+       CASE WHEN g % 7 = 0 THEN 'income' ELSE 'expense' END,
+       CAST(:start AS timestamptz) + random() * (CAST(:end AS timestamptz) - CAST(:start AS timestamptz))
+FROM generate_series(:first, :last) AS g
+"""
+
+
+def setup(conn, rows: int, users: int, months: int, chunk: int) -> tuple:
+    """Create and fill the plain and partitioned benchmark tables"""
+    end = month_start(date.today(), 1)
+    start = month_start(end, -months)
+
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.tx_plain ({COLUMNS_DDL}, PRIMARY KEY (id))"))
+    conn.execute(text(
+        f"CREATE TABLE {SCHEMA}.tx_part ({COLUMNS_DDL}, PRIMARY KEY (id, transaction_date)) "
+        f"PARTITION BY RANGE (transaction_date)"
+    ))
+
+    month = start
+    while month < end:
+        following = month_start(month, 1)
+        conn.execute(text(
+            f"CREATE TABLE {SCHEMA}.tx_part_p{month.year:04d}_{month.month:02d} "
+            f"PARTITION OF {SCHEMA}.tx_part FOR VALUES FROM ('{month}') TO ('{following}')"
+        ))
+        month = following
+
+    for table in ("tx_plain", "tx_part"):
+        for first in range(1, rows + 1, chunk):
+            conn.execute(text(GENERATE_SQL.format(table=f"{SCHEMA}.{table}")), {
+                "users": users,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "first": first,
+                "last": min(first + chunk - 1, rows),
+            })
+            conn.commit()
+        conn.execute(text(
+            f"CREATE INDEX ON {SCHEMA}.{table} (user_id, transaction_date)"
+        ))
+        conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+        conn.commit()
+
+    return start, end
+
+
+def measure(conn, sql: str, table: str, params_list: list) -> dict:
+    """Run a query for each parameter set and summarize latency in ms"""
+    statement = text(sql.format(table=f"{SCHEMA}.{table}"))
+    timings = []
+    for params in params_list:
+        started = time.perf_counter()
+        conn.execute(statement, params).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+    }
+
+
+def pruned_partitions(conn, params: dict) -> list:
+    """Partitions the planner keeps for a one-month list query"""
+    plan = conn.execute(
+        text("EXPLAIN (FORMAT JSON) " + LIST_SQL.format(table=f"{SCHEMA}.tx_part")),
+        params
+    ).scalar()
+
+    names = set()
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            if "Relation Name" in node:
+                names.add(node["Relation Name"])
+            stack.extend(v for v in node.values() if isinstance(v, (list, dict)))
+    return sorted(names)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--chunk", type=int, default=1_000_000)
+    parser.add_argument("--skip-setup", action="store_true", help="Reuse tables from a previous run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Partitioning benchmark requires PostgreSQL")
+
+    rng = random.Random(args.seed)
+    end = month_start(date.today(), 1)
+
+    with engine.connect() as conn:
+        if not args.skip_setup:
+            setup_started = time.perf_counter()
+            setup(conn, args.rows, args.users, args.months, args.chunk)
+            setup_seconds = round(time.perf_counter() - setup_started, 1)
+        else:
+            setup_seconds = None
+
+        one_month = []
+        ninety_days = []
+        for _ in range(args.iterations):
+            month = month_start(end, -rng.randint(1, args.months))
+            user_id = rng.randint(1, args.users)
+            one_month.append({"user_id": user_id, "date_from": month, "date_to": month_start(month, 1)})
+            ninety_days.append({"user_id": user_id, "date_from": month_start(end, -3), "date_to": end})
+
+        result = {
+            "rows": args.rows,
+            "users": args.users,
+            "months": args.months,
+            "iterations": args.iterations,
+            "setup_seconds": setup_seconds,
+            "pruning": {
+                "one_month_list_scans": pruned_partitions(conn, one_month[0]),
+            },
+            "list_one_month": {
+                "plain": measure(conn, LIST_SQL, "tx_plain", one_month),
+                "partitioned": measure(conn, LIST_SQL, "tx_part", one_month),
+            },
+            "analytics_90_days": {
+                "plain": measure(conn, ANALYTICS_SQL, "tx_plain", ninety_days),
+                "partitioned": measure(conn, ANALYTICS_SQL, "tx_part", ninety_days),
+            },
+        }
+
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Measure transaction search latency per cursor page and check paging
+
+Generates transactions for one user from a few repeated descriptions, so
+most matches share the same rank and many share a date. Every page of a
+search is fetched by cursor, once per sort; the pages must add up to the
+unpaginated result in the same order, with no row repeated or skipped.
+A mismatch exits with an error. On PostgreSQL the search column and GIN
+index are added as the migration does.
+
+Usage:
+    python -m benchmarks.search --rows 20000 --page-size 50
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.base import Base
+from app.db.search import POSTGRES_SEARCH_VECTOR, SEARCH_INDEX, SEARCH_VECTOR_COLUMN, ensure_sqlite_fts
+from app.models import Transaction, User
+from app.services.search import SEARCH_SORTS, transaction_search_service
+
+DESCRIPTIONS = ["OXXO SANTA FE", "OXXO CONDESA", "UBER TRIP", "UBER EATS", "NETFLIX MX", "STARBUCKS ROMA"]
+QUERIES = ["oxxo", "uber", "netflix"]
+
+
+def create_search_index(engine) -> None:
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text(
+                f"ALTER TABLE transactions ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+                f"GENERATED ALWAYS AS ({POSTGRES_SEARCH_VECTOR}) STORED"
+            ))
+            connection.execute(text(f"CREATE INDEX {SEARCH_INDEX} ON transactions USING GIN ({SEARCH_VECTOR_COLUMN})"))
+        else:
+            ensure_sqlite_fts(connection)
+
+
+def walk(session_factory, user_id: int, query: str, sort: str, page_size: int) -> dict:
+    """Fetch every page by cursor and compare with the unpaginated result"""
+    db = session_factory()
+    try:
+        expected, _ = transaction_search_service.search(db, user_id, query, limit=1_000_000, sort=sort)
+        expected_ids = [transaction.id for transaction, _ in expected]
+
+        seen, timings, cursor = [], [], None
+        while True:
+            started = time.perf_counter()
+            page, cursor = transaction_search_service.search(
+                db, user_id, query, limit=page_size, cursor=cursor, sort=sort
+            )
+            timings.append(time.perf_counter() - started)
+            seen.extend(transaction.id for transaction, _ in page)
+            if cursor is None or len(seen) > len(expected_ids):
+                break
+    finally:
+        db.close()
+
+    return {
+        "matches": len(expected_ids),
+        "distinct_ranks": len({rank for _, rank in expected}),
+        "pages": len(timings),
+        "page_p50_ms": round(statistics.median(timings) * 1000, 2),
+        "page_max_ms": round(max(timings) * 1000, 2),
+        "duplicates": len(seen) - len(set(seen)),
+        "missing": len(set(expected_ids) - set(seen)),
+        "consistent": seen == expected_ids,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench_search.db",
+        help="Scratch database; all tables are dropped and recreated"
+    )
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--days", type=int, default=90, help="Spread of dates; fewer days means more date ties")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    create_search_index(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    rng = random.Random(args.seed)
+
+    db = session_factory()
+    user = User(email="bench0@example.com", full_name="Bench", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+
+    start = datetime(2026, 1, 1)
+    for first in range(0, args.rows, 10_000):
+        db.bulk_insert_mappings(Transaction, [
+            {
+                "user_id": user_id,
+                "belvo_transaction_id": f"bench-{i}",
+                "description": rng.choice(DESCRIPTIONS),
+                "amount_cents": rng.randrange(1_000, 500_000),
+                "transaction_type": "expense",
+                # Whole days only, so rows with the same rank also tie on date
+                "transaction_date": start + timedelta(days=rng.randrange(args.days)),
+                "status": "completed",
+            }
+            for i in range(first, min(first + 10_000, args.rows))
+        ])
+        db.commit()
+    db.close()
+
+    results = {
+        f"{query}/{sort}": walk(session_factory, user_id, query, sort, args.page_size)
+        for query in QUERIES
+        for sort in SEARCH_SORTS
+    }
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "rows": args.rows,
+        "page_size": args.page_size,
+        "searches": results,
+    }, indent=2))
+
+    broken = [name for name, result in results.items() if not result["consistent"]]
+    if broken:
+        raise SystemExit(f"Cursor paging lost or repeated rows: {', '.join(broken)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Compare JSON response serialization paths for the large list endpoints
+
+Builds TransactionListResponse, AlertSummary and SubscriptionSummary
+payloads of --sizes items from transient ORM objects (no database) and
+serves each through a throwaway FastAPI app three ways:
+
+    default  endpoint returns the model, rendered by JSONResponse (json.dumps)
+    orjson   endpoint returns the model, rendered by FastJSONResponse
+    model    endpoint returns model_response(model), skipping FastAPI's
+             dump/validate/serialize round trip
+
+Each path is timed over --requests in-process requests; the first response
+of every path is compared to the default one.
+
+Usage:
+    python -m benchmarks.serialization --sizes 50 500 5000 --requests 50
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from app.api.responses import FastJSONResponse, model_response
+from app.models import Alert, Subscription, Transaction
+from app.schemas.alert import AlertSummary
+from app.schemas.money import from_cents
+from app.schemas.subscription import SubscriptionSummary
+from app.schemas.transaction import TransactionListResponse
+
+WORDS = ["cafe", "super", "gasolina", "farmacia", "renta", "restaurante", "cine", "uber"]
+PATHS = ("default", "orjson", "model")
+
+
+def make_transactions(rng: random.Random, size: int) -> TransactionListResponse:
+    start = datetime(2025, 1, 1)
+    transactions = [
+        Transaction(
+            id=i, user_id=1, bank_account_id=1, belvo_transaction_id=f"belvo-{i}",
+            description=f"{rng.choice(WORDS)} {i}", merchant_name=f"COMERCIO {i % 300} MX", merchant_id=i % 300,
+            category=rng.choice(WORDS), category_source="rule", amount_cents=rng.randrange(100, 500_000),
+            currency="MXN", transaction_type="expense", reference=str(rng.randrange(10 ** 8)),
+            transaction_date=start + timedelta(minutes=i), value_date=start + timedelta(minutes=i),
+            status="completed", created_at=start + timedelta(minutes=i)
+        )
+        for i in range(size)
+    ]
+    return TransactionListResponse(total=size * 10, page=1, page_size=size, transactions=transactions)
+
+
+def make_alerts(rng: random.Random, size: int) -> AlertSummary:
+    start = datetime(2025, 1, 1)
+    alerts = [
+        Alert(
+            id=i, user_id=1, alert_type="large_transaction", title=f"Cargo de {rng.choice(WORDS)}",
+            message="Se detectó un cargo mayor a tu promedio " * 3, priority=rng.choice(("low", "high")),
+            category="payment", related_transaction_id=i, is_read=bool(i % 3), is_dismissed=False,
+            requires_action=False, action_taken=False, push_sent=True, email_sent=False, sms_sent=False,
+            created_at=start + timedelta(minutes=i)
+        )
+        for i in range(size)
+    ]
+    return AlertSummary(total_alerts=size, unread_alerts=size // 3, critical_alerts=0, requires_action=0, alerts=alerts)
+
+
+def make_subscriptions(rng: random.Random, size: int) -> SubscriptionSummary:
+    start = datetime(2025, 1, 1)
+    subscriptions = [
+        Subscription(
+            id=i, user_id=1, service_name=f"Servicio {i}", merchant_name=f"SERVICIO {i} MX",
+            amount_cents=rng.randrange(5_000, 50_000), currency="MXN", billing_frequency="monthly",
+            billing_day=i % 28 + 1, category="entertainment", is_active=True, auto_detected=True,
+            user_confirmed=True, first_charge_date=start.date(), next_charge_date=(start + timedelta(days=i % 30)).date(),
+            alert_before_charge=True, alert_days_before=3, created_at=start
+        )
+        for i in range(size)
+    ]
+    upcoming = [
+        {"subscription_id": s.id, "service_name": s.service_name, "amount": from_cents(s.amount_cents),
+         "currency": s.currency, "charge_date": s.next_charge_date.isoformat()}
+        for s in subscriptions
+    ]
+    return SubscriptionSummary(total_subscriptions=size, active_subscriptions=size, monthly_cost=0.0, yearly_cost=0.0,
+                               subscriptions=subscriptions, upcoming_charges=upcoming)
+
+
+PAYLOADS = {
+    "transactions": (TransactionListResponse, make_transactions),
+    "alerts_summary": (AlertSummary, make_alerts),
+    "subscriptions_summary": (SubscriptionSummary, make_subscriptions),
+}
+
+
+def build_app(response_model, payload) -> FastAPI:
+    """One route per serialization path, all returning the same payload"""
+    app = FastAPI()
+
+    @app.get("/default", response_model=response_model, response_class=JSONResponse)
+    def default():
+        return payload
+
+    @app.get("/orjson", response_model=response_model, response_class=FastJSONResponse)
+    def orjson_path():
+        return payload
+
+    @app.get("/model", response_model=response_model)
+    def model(response: Response):
+        return model_response(payload, response)
+
+    return app
+
+
+def run(client: TestClient, path: str, requests: int) -> dict:
+    reference = client.get(f"/{path}")
+    reference.raise_for_status()
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(f"/{path}")
+    elapsed = time.perf_counter() - started
+    return {
+        "ms_per_request": round(elapsed / requests * 1000, 2),
+        "bytes": len(reference.content),
+        "body": reference.json(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report = {}
+    for name, (response_model, make) in PAYLOADS.items():
+        report[name] = {}
+        for size in args.sizes:
+            client = TestClient(build_app(response_model, make(rng, size)))
+            results = {path: run(client, path, args.requests) for path in PATHS}
+            default_ms = results["default"]["ms_per_request"]
+            report[name][size] = {
+                path: {
+                    "ms_per_request": result["ms_per_request"],
+                    "speedup": round(default_ms / result["ms_per_request"], 2),
+                    "bytes": result["bytes"],
+                    "same_body": result["body"] == results["default"]["body"],
+                }
+                for path, result in results.items()
+            }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Measure bulk transaction import throughput
+
+Generates a CSV or NDJSON file of --rows transactions spread over a few of
+the user's accounts and cards, then runs it through
+TransactionImportService against a scratch database. A share
+of rows (--bad-ratio) is invalid so per-row error reporting is included in
+the timing.
+
+Usage:
+    python -m benchmarks.transaction_import --rows 100000 --format csv
+"""
+import argparse
+import csv
+import io
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.db.base import Base
+from app.models import BankAccount, CreditCard, Transaction, User
+from app.services.transaction_import import transaction_import_service
+
+FIELDS = ["description", "amount", "transaction_type", "transaction_date", "merchant_name",
+          "bank_account_id", "credit_card_id", "category"]
+WORDS = ["cafe", "super", "gasolina", "farmacia", "renta", "restaurante", "cine", "uber"]
+
+
+def make_file(rng: random.Random, rows: int, fmt: str, account_ids: list, card_ids: list, bad_ratio: float) -> bytes:
+    """Synthetic spreadsheet export"""
+    start = datetime(2025, 1, 1)
+    records = []
+    for i in range(rows):
+        use_card = rng.random() < 0.3
+        record = {
+            "description": f"{rng.choice(WORDS)} {i % 211}",
+            "amount": f"{rng.uniform(5, 5000):.2f}",
+            "transaction_type": "expense" if i % 9 else "income",
+            "transaction_date": (start + timedelta(minutes=17 * i)).isoformat(),
+            "merchant_name": f"COMERCIO {rng.randrange(500)} MX",
+            "bank_account_id": "" if use_card else rng.choice(account_ids),
+            "credit_card_id": rng.choice(card_ids) if use_card else "",
+            "category": rng.choice(("", "", "food", "transport")),
+        }
+        if rng.random() < bad_ratio:
+            record["amount"] = "n/a"
+        records.append(record)
+
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps({key: value for key, value in record.items() if value != ""}) + "\n" for record in records
+        ).encode()
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--database-url",
+        default="sqlite:////tmp/glass_bench_import.db",
+        help="Scratch database; all tables are dropped and recreated"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=("csv", "ndjson"), default="csv")
+    parser.add_argument("--bad-ratio", type=float, default=0.01, help="Share of rows with an invalid amount")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.database_url == settings.DATABASE_URL:
+        raise SystemExit("Refusing to drop the application database; pass a scratch --database-url")
+
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    rng = random.Random(args.seed)
+
+    db = session_factory()
+    user = User(email="import@example.com", full_name="Import Bench", hashed_password="x")
+    db.add(user)
+    db.commit()
+    accounts = [
+        BankAccount(user_id=user.id, account_name=f"Cuenta {i}", institution_name="Bench", account_type="checking")
+        for i in range(3)
+    ]
+    cards = [
+        CreditCard(user_id=user.id, card_name=f"Tarjeta {i}", institution_name="Bench", last_four_digits=f"{i:04d}",
+                   credit_limit_cents=5_000_000, available_credit_cents=5_000_000)
+        for i in range(2)
+    ]
+    db.add_all(accounts + cards)
+    db.commit()
+    account_ids = [account.id for account in accounts]
+    card_ids = [card.id for card in cards]
+    user_id = user.id
+    db.close()
+
+    payload = make_file(rng, args.rows, args.format, account_ids, card_ids, args.bad_ratio)
+    parse = transaction_import_service.parse_ndjson if args.format == "ndjson" else transaction_import_service.parse_csv
+
+    db = session_factory()
+    started = time.perf_counter()
+    try:
+        report = transaction_import_service.import_rows(
+            db, user_id, parse(io.BytesIO(payload)), max_rows=max(args.rows, settings.IMPORT_MAX_ROWS)
+        )
+        elapsed = time.perf_counter() - started
+        stored = db.query(Transaction).filter(Transaction.user_id == user_id).count()
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "format": args.format,
+        "file_mb": round(len(payload) / 1024 / 1024, 1),
+        "batch_size": settings.IMPORT_BATCH_SIZE,
+        "rows": report.total_rows,
+        "imported": report.imported,
+        "failed": report.failed,
+        "stored": stored,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(report.total_rows / elapsed, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures
+
+Tests run the app against a scratch SQLite database (TEST_DATABASE_URL to
+override), never the DATABASE_URL of the environment, since tables are
+dropped afterwards.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL",
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='glass-tests-'), 'test.db')}"
+)
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("BELVO_SECRET_ID", "test")
+os.environ.setdefault("BELVO_SECRET_PASSWORD", "test")
+
+import pytest
+from fastapi.testclient import TestClient
+from app.db.base import Base, engine
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient over freshly created tables"""
+    Base.metadata.create_all(engine)
+    with TestClient(app) as test_client:
+        yield test_client
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    """Bearer headers of a registered user"""
+    credentials = {"email": "tests@example.com", "password": "Secret123!"}
+    client.post("/api/v1/auth/register", json={**credentials, "full_name": "Test User"})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,27 @@
+"""
+Gunicorn settings (picked up automatically from the working directory)
+
+Usage:
+    PROMETHEUS_MULTIPROC_DIR=/tmp/glass-metrics gunicorn app.main:app
+"""
+import os
+import shutil
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server):
+    """Start every run with an empty Prometheus multiprocess directory"""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop live gauges (in-flight requests, pool connections) of a dead worker"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,14 @@
+import pytest
+from app.db.query_stats import query_budget
+
+
+def test_profile_query_budget(client, auth_headers):
+    with query_budget(6):
+        response = client.get("/api/v1/users/me/profile", headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_query_budget_fails_when_exceeded(client, auth_headers):
+    with pytest.raises(AssertionError, match="budget is 1"):
+        with query_budget(1):
+            client.get("/api/v1/users/me/profile", headers=auth_headers)